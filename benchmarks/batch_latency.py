@@ -0,0 +1,67 @@
+"""
+Benchmark: processing files over threads when reads have latency.
+
+Every ``os.pread`` call is delayed, to simulate a network file system,
+and the sample JPEG files are processed sequentially and with
+``process_files(..., executor="thread")`` for several numbers of threads.
+Reports the number of reads per file and the throughput.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/batch_latency.py [LATENCY_MS]
+"""
+
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import exifread
+from exifread import batch
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+THREADS = (1, 4, 16, 64)
+
+
+def main() -> None:
+    latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.002
+    logging.disable(logging.CRITICAL)
+    paths = sorted((RESOURCES_ROOT / "jpg").glob("*.jpg"))
+    pread = os.pread
+    reads = [0]
+
+    def delayed_pread(fd: int, size: int, offset: int) -> bytes:
+        reads[0] += 1
+        time.sleep(latency)
+        return pread(fd, size, offset)
+
+    os.pread = delayed_pread
+    try:
+        start = time.perf_counter()
+        for path in paths:
+            batch._process_pread(path, details=False)  # pylint: disable=protected-access
+        elapsed = time.perf_counter() - start
+        print(
+            "%d files, %.1f ms latency, %.1f reads per file"
+            % (len(paths), latency * 1000, reads[0] / len(paths))
+        )
+        print("%-12s %10s %10s" % ("threads", "files/s", "speedup"))
+        print("%-12s %10.0f %10s" % ("sequential", len(paths) / elapsed, "1.0x"))
+        for threads in THREADS:
+            start = time.perf_counter()
+            for _ in exifread.process_files(
+                paths, workers=threads, chunksize=1, executor="thread", details=False
+            ):
+                pass
+            threaded = time.perf_counter() - start
+            print(
+                "%-12d %10.0f %9.1fx"
+                % (threads, len(paths) / threaded, elapsed / threaded)
+            )
+    finally:
+        os.pread = pread
+
+
+if __name__ == "__main__":
+    main()
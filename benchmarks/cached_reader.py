@@ -0,0 +1,87 @@
+"""
+Benchmark: processing files through a block cache when reads are slow.
+
+Each sample file is read from an in-memory stand-in delaying every ``read``
+call, to simulate a slow or remote file, and processed with and without
+``cached=True`` for several block sizes.
+Reports the underlying reads per file, the cache hit ratio and the time.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/cached_reader.py [LATENCY_MS]
+"""
+
+import io
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import BinaryIO, List, Tuple, cast
+
+import exifread
+from exifread.core import cached_reader
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+FOLDERS = ("jpg", "tiff", "heic", "raw")
+BLOCK_SIZES = (4 * 1024, 16 * 1024, 64 * 1024)
+
+
+class SlowFile(io.BytesIO):
+    """In-memory file with a delay on each read, counting them."""
+
+    latency = 0.0
+    reads = 0
+
+    def read(self, size=-1):
+        SlowFile.reads += 1
+        time.sleep(self.latency)
+        return super().read(size)
+
+
+def run(files: List[bytes], **kwargs: int) -> Tuple[int, int, int, float]:
+    SlowFile.reads = 0
+    hits = misses = 0
+    start = time.perf_counter()
+    for data in files:
+        fh = SlowFile(data)
+        if kwargs:
+            reader = cached_reader.CachedReader(fh, **kwargs)
+            exifread.process_file(cast(BinaryIO, reader), details=True, debug=True)
+            hits += reader.hits
+            misses += reader.misses
+        else:
+            exifread.process_file(fh, details=True, debug=True)
+    return SlowFile.reads, hits, misses, time.perf_counter() - start
+
+
+def main() -> None:
+    SlowFile.latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.001
+    logging.disable(logging.CRITICAL)
+    files = [
+        path.read_bytes()
+        for folder in FOLDERS
+        for path in sorted((RESOURCES_ROOT / folder).glob("*.*"))
+        if path.suffix.lower() != ".txt"
+    ]
+    print("%d files, %.1f ms per read" % (len(files), SlowFile.latency * 1000))
+    print("%-10s %12s %10s %12s" % ("block", "reads/file", "hit ratio", "ms/file"))
+    reads, _, _, elapsed = run(files)
+    print(
+        "%-10s %12.1f %10s %12.1f"
+        % ("none", reads / len(files), "-", elapsed / len(files) * 1000)
+    )
+    for block_size in BLOCK_SIZES:
+        reads, hits, misses, elapsed = run(files, block_size=block_size)
+        print(
+            "%-10s %12.1f %9.0f%% %12.1f"
+            % (
+                "%d KB" % (block_size // 1024),
+                reads / len(files),
+                100 * hits / max(hits + misses, 1),
+                elapsed / len(files) * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: logging overhead when debug output is disabled.
+
+Processes files with the logger at its default level and reports the time
+per file, and how many ``logger.debug()`` calls were still made (and their
+arguments built) although nothing is output.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/debug_logging.py [NUMBER]
+"""
+
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+import exifread
+from exifread.exif_log import get_logger
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+SAMPLES = (
+    "jpg/Canon_40D.jpg",
+    "jpg/Nikon_D70.jpg",
+    "jpg/Canon_DIGITAL_IXUS_400.jpg",
+    "jpg/long_description.jpg",
+    "heic/mobile/iphone_13_pro_max.heic",
+)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    logger = get_logger()
+    logger.setLevel(logging.INFO)
+    calls = [0]
+    debug = logger.debug
+
+    def counting_debug(*args, **kwargs) -> None:
+        calls[0] += 1
+        debug(*args, **kwargs)
+
+    print("%-40s %12s %12s" % ("file", "ms/file", "debug calls"))
+    for sample in SAMPLES:
+        file_path = RESOURCES_ROOT / sample
+        if not file_path.exists():
+            continue
+        with open(file_path, "rb") as fh:
+            logger.debug = counting_debug  # type: ignore
+            calls[0] = 0
+            exifread.process_file(fh, details=True)
+            del logger.debug
+            elapsed = timeit.timeit(
+                "process_file(fh, details=True)",
+                globals={"process_file": exifread.process_file, "fh": fh},
+                number=number,
+            )
+        print("%-40s %12.3f %12d" % (sample, elapsed / number * 1000, calls[0]))
+
+
+if __name__ == "__main__":
+    main()
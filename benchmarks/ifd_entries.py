@@ -0,0 +1,96 @@
+"""
+Microbenchmark: decoding IFD entry tables.
+
+Compares decoding every entry field by field with ``ExifHeader.s2n``
+(tag, type, count and offset, as ``dump_ifd`` used to do) against the bulk
+table decoder ``ExifHeader.read_ifd``.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/ifd_entries.py [NUMBER]
+"""
+
+import functools
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+
+from exifread.core.exif_header import ExifHeader
+from exifread.core.find_exif import find_exif_block, get_endian_str
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+SAMPLES = (
+    "jpg/Canon_40D.jpg",
+    "jpg/Canon_DIGITAL_IXUS_400.jpg",
+    "jpg/Canon_PowerShot_S40.jpg",
+    "jpg/Nikon_D70.jpg",
+    "jpg/Nikon_COOLPIX_P1.jpg",
+)
+
+
+def _open_header(file_path: Path) -> ExifHeader:
+    with open(file_path, "rb") as fh:
+        offset, endian, fake_exif, exif_size = find_exif_block(fh)
+        hdr = ExifHeader(
+            fh, get_endian_str(endian)[0], offset, fake_exif, False, exif_size=exif_size
+        )
+        # walk all IFDs once, including sub-IFDs and MakerNote
+        for ifd in hdr.list_ifd():
+            hdr.dump_ifd(ifd, "Image")
+        exif_off = hdr.tags.get("Image ExifOffset")
+        if exif_off:
+            hdr.dump_ifd(exif_off.values[0], "EXIF")
+        if "EXIF MakerNote" in hdr.tags:
+            hdr.decode_maker_note()
+    return hdr
+
+
+def _per_field(hdr: ExifHeader, ifds: List[int]) -> int:
+    total = 0
+    for ifd in ifds:
+        entries = hdr.s2n(ifd, 2)
+        for i in range(entries):
+            entry = ifd + 2 + 12 * i
+            hdr.s2n(entry, 2)
+            hdr.s2n(entry + 2, 2)
+            hdr.s2n(entry + 4, 4)
+            hdr.s2n(entry + 8, 4)
+        hdr.s2n(ifd + 2 + 12 * entries, 4)
+        total += entries
+    return total
+
+
+def _bulk(hdr: ExifHeader, ifds: List[int]) -> int:
+    hdr._ifd_cache.clear()  # pylint: disable=protected-access
+    total = 0
+    for ifd in ifds:
+        total += len(hdr.read_ifd(ifd)[0])
+    return total
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print("%-32s %8s %14s %14s %8s" % ("file", "entries", "s2n/s", "bulk/s", "speedup"))
+    for sample in SAMPLES:
+        hdr = _open_header(RESOURCES_ROOT / sample)
+        cache = hdr._ifd_cache  # pylint: disable=protected-access
+        # only the IFDs relative to the start of the EXIF data
+        ifds = [key[2] for key in cache if key[0] == hdr.offset]
+        entries = _per_field(hdr, ifds)
+        before = timeit.timeit(functools.partial(_per_field, hdr, ifds), number=number)
+        after = timeit.timeit(functools.partial(_bulk, hdr, ifds), number=number)
+        print(
+            "%-32s %8d %14.0f %14.0f %7.1fx"
+            % (
+                sample,
+                entries,
+                entries * number / before,
+                entries * number / after,
+                before / after,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Memory benchmark: bytes retained per tag.
+
+Processes MakerNote heavy files with ``details=True`` and measures, with
+``tracemalloc``, the memory retained by the returned tags, first as
+returned (printable versions not computed yet) and then once every
+printable version has been accessed, which is what used to be kept for
+every tag.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/ifd_tag_memory.py
+"""
+
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import Any, MutableMapping
+
+import exifread
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+SAMPLES = (
+    "jpg/Canon_40D.jpg",
+    "jpg/Canon_DIGITAL_IXUS_400.jpg",
+    "jpg/Nikon_D70.jpg",
+    "jpg/Nikon_COOLPIX_P1.jpg",
+    "jpg/Sony_alpha_a58.JPG",
+)
+
+
+def _process(file_path: Path) -> MutableMapping[str, Any]:
+    with open(file_path, "rb") as fh:
+        return exifread.process_file(fh, details=True)
+
+
+def main() -> None:
+    print("%-32s %6s %12s %12s" % ("file", "tags", "lazy B/tag", "printed B/tag"))
+    for sample in SAMPLES:
+        file_path = RESOURCES_ROOT / sample
+        if not file_path.exists():
+            continue
+        # warm up imports and caches
+        _process(file_path)
+        gc.collect()
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        tags = _process(file_path)
+        gc.collect()
+        lazy = tracemalloc.get_traced_memory()[0] - base
+        for tag in tags.values():
+            str(tag)
+        printed = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+
+        print(
+            "%-32s %6d %12.0f %12.0f"
+            % (sample, len(tags), lazy / len(tags), printed / len(tags))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: time to import exifread, and to start the command line.
+
+Imports each module in a fresh interpreter with ``-X importtime`` and reports
+the median cumulative import time, the exifread modules taking the most time
+on their own, and which heavy modules were loaded although not needed:
+vendor MakerNote tables, XMP parsing, fractions, asyncio, etc.
+Bytecode is written first, so that compiling the sources is not measured.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/import_time.py [RUNS]
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULES = ("exifread", "exifread.cli")
+
+# Modules only needed by some files or options
+LAZY_MODULES = (
+    "exifread.tags.makernote.canon",
+    "exifread.tags.makernote.nikon",
+    "exifread.tags.makernote.olympus",
+    "xml.dom.minidom",
+    "pyexpat",
+    "fractions",
+    "decimal",
+    "asyncio",
+    "concurrent.futures",
+    "http.client",
+)
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(module: str, env: Dict[str, str]) -> Tuple[int, Dict[str, int]]:
+    """Return the cumulative import time of `module`, and the self time of all."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        env=env,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stderr
+    total = 0
+    own: Dict[str, int] = {}
+    for match in LINE.finditer(output):
+        own[match.group(4)] = int(match.group(1))
+        if match.group(4) == module:
+            total = int(match.group(2))
+    return total, own
+
+
+def loaded_modules(module: str, env: Dict[str, str]) -> List[str]:
+    code = "import sys, %s; print(' '.join(sys.modules))" % module
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stdout.split()
+    return [name for name in LAZY_MODULES if name in output]
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run([sys.executable, "-c", "import exifread.cli"], env=env, check=True)
+
+    for module in MODULES:
+        totals = []
+        own: Dict[str, List[int]] = {}
+        for _ in range(runs):
+            total, times = import_times(module, env)
+            totals.append(total)
+            for name, microseconds in times.items():
+                own.setdefault(name, []).append(microseconds)
+        print("import %s: %.1f ms" % (module, statistics.median(totals) / 1000))
+        slowest = sorted(
+            (
+                (statistics.median(times), name)
+                for name, times in own.items()
+                if name.startswith("exifread")
+            ),
+            reverse=True,
+        )
+        for median, name in slowest[:5]:
+            print("  %-40s %8.1f ms" % (name, median / 1000))
+        print(
+            "  heavy modules loaded: %s"
+            % (", ".join(loaded_modules(module, env)) or "none")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: ``process_bytes`` against ``process_file`` on a ``BytesIO``.
+
+Processes every sample image of the test resources from memory, grouped by
+format, once wrapped in ``io.BytesIO`` and once given as is to
+``process_bytes``. The ``debug`` pass also searches the files for XMP data.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/process_bytes.py [NUMBER]
+"""
+
+import functools
+import io
+import logging
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import exifread
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+
+# Label and options of each pass
+OPTIONS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("default", {}),
+    ("debug", {"debug": True}),
+)
+
+
+def _process_files(files: List[bytes], options: Dict[str, Any]) -> None:
+    for data in files:
+        exifread.process_file(io.BytesIO(data), **options)
+
+
+def _process_bytes(files: List[bytes], options: Dict[str, Any]) -> None:
+    for data in files:
+        exifread.process_bytes(data, **options)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    logging.disable(logging.CRITICAL)
+    # contents of the sample files, by format
+    formats: Dict[str, List[bytes]] = {}
+    for path in sorted(RESOURCES_ROOT.rglob("*")):
+        suffix = path.suffix.lower()
+        if path.is_file() and suffix not in (".txt", ".rst"):
+            formats.setdefault(suffix, []).append(path.read_bytes())
+    print(
+        "%-24s %-8s %10s %12s %12s %8s"
+        % ("format", "options", "MB", "BytesIO MB/s", "bytes MB/s", "speedup")
+    )
+    for suffix, files in sorted(formats.items()):
+        size = sum(len(data) for data in files) / 1e6
+        for label, options in OPTIONS:
+            before = timeit.timeit(
+                functools.partial(_process_files, files, options), number=number
+            )
+            after = timeit.timeit(
+                functools.partial(_process_bytes, files, options), number=number
+            )
+            print(
+                "%-24s %-8s %10.1f %12.0f %12.0f %7.1fx"
+                % (
+                    "%s (%d files)" % (suffix, len(files)),
+                    label,
+                    size,
+                    size * number / before,
+                    size * number / after,
+                    before / after,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: memory-mapped ``process_path`` against ``process_file``.
+
+Processes every sample image of the test resources, once opened as a file
+object for ``process_file`` and once memory-mapped by ``process_path``.
+Files are read beforehand so that both are served from the page cache.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/process_path.py [NUMBER]
+"""
+
+import functools
+import logging
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+
+import exifread
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+
+
+def _process_files(paths: List[Path]) -> None:
+    for path in paths:
+        with open(path, "rb") as fh:
+            exifread.process_file(fh, details=True)
+
+
+def _process_paths(paths: List[Path]) -> None:
+    for path in paths:
+        exifread.process_path(path, details=True)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    logging.disable(logging.CRITICAL)
+    samples = sorted(
+        path
+        for path in RESOURCES_ROOT.rglob("*")
+        if path.is_file() and path.suffix.lower() not in (".txt", ".rst")
+    )
+    for path in samples:
+        path.read_bytes()
+
+    print("%-32s %12s %12s %8s" % ("format", "file ms", "mmap ms", "speedup"))
+    totals = [0.0, 0.0]
+    for suffix in sorted({path.suffix.lower() for path in samples}):
+        paths = [path for path in samples if path.suffix.lower() == suffix]
+        before = timeit.timeit(functools.partial(_process_files, paths), number=number)
+        after = timeit.timeit(functools.partial(_process_paths, paths), number=number)
+        totals[0] += before
+        totals[1] += after
+        label = "%s (%d files)" % (suffix, len(paths))
+        print(
+            "%-32s %12.3f %12.3f %7.1fx"
+            % (label, before / number * 1000, after / number * 1000, before / after)
+        )
+    print(
+        "%-32s %12.3f %12.3f %7.1fx"
+        % (
+            "total",
+            totals[0] / number * 1000,
+            totals[1] / number * 1000,
+            totals[0] / totals[1],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: reading the sample files over HTTP range requests.
+
+The sample files are served by a local ``http.server`` supporting ``Range``,
+each request delayed to simulate a remote store, and processed through
+``RangeReader`` for several block sizes.
+Reports the requests and bytes fetched per file against the file sizes.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/range_reader.py [LATENCY_MS]
+"""
+
+import http.server
+import logging
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, cast
+
+import exifread
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+FOLDERS = ("jpg", "tiff", "heic", "raw")
+BLOCK_SIZES = (4 * 1024, 16 * 1024, 64 * 1024)
+LATENCY = [0.0]
+
+
+class RangeHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve the sample files with `Range` support, after a delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(RESOURCES_ROOT), **kwargs)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(LATENCY[0])
+        data = Path(self.translate_path(self.path)).read_bytes()
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        start = int(match.group(1))
+        end = min(int(match.group(2)) + 1, len(data))
+        self.send_response(206)
+        self.send_header(
+            "Content-Range", "bytes %d-%d/%d" % (start, end - 1, len(data))
+        )
+        self.send_header("Content-Length", str(end - start))
+        self.end_headers()
+        self.wfile.write(data[start:end])
+
+
+def main() -> None:
+    LATENCY[0] = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.005
+    logging.disable(logging.CRITICAL)
+    paths = [
+        path
+        for folder in FOLDERS
+        for path in sorted((RESOURCES_ROOT / folder).glob("*.*"))
+        if path.suffix.lower() != ".txt"
+    ]
+    total = sum(path.stat().st_size for path in paths)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:%d/" % server.server_address[1]
+    print(
+        "%d files, %.1f MB, %.1f ms latency"
+        % (len(paths), total / 1e6, LATENCY[0] * 1000)
+    )
+    print(
+        "%-10s %14s %14s %10s %12s"
+        % ("block", "requests/file", "KB/file", "fetched", "ms/file")
+    )
+    try:
+        for block_size in BLOCK_SIZES:
+            requests = fetched = 0
+            start = time.perf_counter()
+            for path in paths:
+                name = path.relative_to(RESOURCES_ROOT).as_posix()
+                with exifread.RangeReader(url + name, block_size=block_size) as reader:
+                    try:
+                        exifread.process_file(cast(BinaryIO, reader), details=False)
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        pass
+                    requests += reader.requests
+                    fetched += reader.bytes_fetched
+            elapsed = time.perf_counter() - start
+            print(
+                "%-10s %14.1f %14.1f %9.1f%% %12.1f"
+                % (
+                    "%d KB" % (block_size // 1024),
+                    requests / len(paths),
+                    fetched / len(paths) / 1024,
+                    100 * fetched / total,
+                    elapsed / len(paths) * 1000,
+                )
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
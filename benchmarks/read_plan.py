@@ -0,0 +1,98 @@
+"""
+Benchmark: reads made outside of the EXIF block, with and without planning.
+
+The sample files are processed from an in-memory file counting its reads,
+with the values read one by one, in merged ranges for each IFD, and in
+merged ranges for the IFD chain and its sub-IFDs at once.
+The EXIF block read up front is limited to ``PRELOAD_KB``, to simulate
+files larger than the samples.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/read_plan.py [PRELOAD_KB]
+"""
+
+import io
+import logging
+import sys
+from pathlib import Path
+
+import exifread
+from exifread.core import exif_header
+
+RESOURCES_ROOT = Path(__file__).parent.parent / "tests" / "resources"
+FOLDERS = ("jpg", "tiff", "raw")
+
+
+class CountingFile(io.BytesIO):
+    """In-memory file counting its reads."""
+
+    reads = 0
+    size = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        CountingFile.reads += 1
+        CountingFile.size += len(data)
+        return data
+
+
+def run(files) -> None:
+    CountingFile.reads = CountingFile.size = 0
+    for data in files:
+        try:
+            exifread.process_file(CountingFile(data), details=True)
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+
+def main() -> None:
+    # planning is turned off by replacing the method reading the plan
+    # pylint: disable=protected-access
+    if len(sys.argv) > 1:
+        exif_header.PRELOAD_LIMIT = int(sys.argv[1]) * 1024
+    logging.disable(logging.CRITICAL)
+    files = [
+        path.read_bytes()
+        for folder in FOLDERS
+        for path in sorted((RESOURCES_ROOT / folder).rglob("*.*"))
+        if path.suffix.lower() != ".txt"
+    ]
+    print(
+        "%d files, %d KB read up front"
+        % (len(files), exif_header.PRELOAD_LIMIT // 1024)
+    )
+    print("%-12s %12s %12s" % ("", "reads", "KB read"))
+    results = []
+    read_plan = exif_header.ExifHeader._read_plan
+    plan_reads = exif_header.ExifHeader.plan_reads
+    for name, plan, across in (
+        ("one by one", False, False),
+        ("per IFD", True, False),
+        ("across IFDs", True, True),
+    ):
+        if plan:
+            exif_header.ExifHeader._read_plan = read_plan  # type: ignore
+        else:
+            exif_header.ExifHeader._read_plan = (  # type: ignore
+                lambda self: self._plan.clear()
+            )
+        if across:
+            exif_header.ExifHeader.plan_reads = plan_reads  # type: ignore
+        else:
+            exif_header.ExifHeader.plan_reads = (  # type: ignore
+                lambda self, chain, stop_tag, details: None
+            )
+        run(files)
+        results.append(CountingFile.reads)
+        print("%-12s %12d %12d" % (name, CountingFile.reads, CountingFile.size // 1024))
+    exif_header.ExifHeader._read_plan = read_plan  # type: ignore
+    exif_header.ExifHeader.plan_reads = plan_reads  # type: ignore
+    print(
+        "%.1fx fewer reads per IFD, %.1fx across IFDs"
+        % (results[0] / results[1], results[0] / results[2])
+    )
+
+
+if __name__ == "__main__":
+    main()
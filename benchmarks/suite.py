@@ -0,0 +1,360 @@
+"""
+Benchmark suite over a corpus of sample images.
+
+Times ``process_file`` for each file format and camera vendor of the corpus,
+by default the ``tests/resources`` folder of a source checkout, and the hot
+paths of the parsing. Results can be saved as JSON, and compared against a
+saved baseline.
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 0.1
+
+The comparison exits with status 1 if any benchmark is slower than the
+baseline by more than the threshold.
+"""
+
+import argparse
+import io
+import json
+import logging
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from synthetic import GENERATORS
+
+import exifread
+from exifread.core.exif_header import ExifHeader
+from exifread.core.find_exif import find_exif_block
+from exifread.core.ifd_tag import IfdTag
+from exifread.core.jpeg import find_jpeg_exif
+from exifread.core.thumbnail import Thumbnail
+from exifread.serialize import convert_types
+from exifread.tags.fields import FieldType
+
+# Files of the corpus which are not images
+SKIPPED_SUFFIXES = (".txt", ".rst", ".md")
+
+# Sample used by the microbenchmarks
+MICRO_SAMPLE = Path("jpg") / "Canon_40D.jpg"
+
+Benchmark = Tuple[str, Callable[[], object], int]
+
+
+def _process(paths: List[Path]) -> Callable[[], None]:
+    files = [path.read_bytes() for path in paths]
+
+    def run() -> None:
+        for data in files:
+            exifread.process_file(io.BytesIO(data), details=True)
+
+    return run
+
+
+def _vendor(data: bytes) -> str:
+    try:
+        tags = exifread.process_file(io.BytesIO(data), details=False)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return "error"
+    make = tags.get("Image Make")
+    words = str(make).split() if make else []
+    return words[0].lower() if words else "unknown"
+
+
+def corpus_groups(resources: Path) -> Dict[str, List[Path]]:
+    """Return the files of the corpus, grouped by format and by vendor."""
+    paths = sorted(
+        path
+        for path in resources.rglob("*")
+        if path.is_file() and path.suffix.lower() not in SKIPPED_SUFFIXES
+    )
+    by_format: Dict[str, List[Path]] = {}
+    by_vendor: Dict[str, List[Path]] = {}
+    for path in paths:
+        by_format.setdefault(path.suffix.lower().lstrip("."), []).append(path)
+        by_vendor.setdefault(_vendor(path.read_bytes()), []).append(path)
+    groups = {"format " + name: group for name, group in sorted(by_format.items())}
+    groups.update(
+        ("vendor " + name, group) for name, group in sorted(by_vendor.items())
+    )
+    return groups
+
+
+def corpus_benchmarks(groups: Dict[str, List[Path]]) -> List[Benchmark]:
+    """Return the benchmarks processing the files of each group."""
+    return [(name, _process(group), len(group)) for name, group in groups.items()]
+
+
+def result_size(tags: Any) -> int:
+    """
+    Return the memory used by the result of `process_file`, in bytes.
+
+    Counts the mapping, its keys and the objects it refers to, e.g. `IfdTag`
+    objects, their `values` lists and the thumbnails, with the data they hold.
+    Shared objects are counted once, small integers and functions not at all.
+    """
+    seen = set()
+    size = 0
+    pending = deque([tags])
+    while pending:
+        obj = pending.popleft()
+        if obj is None or isinstance(obj, bool) or callable(obj) or id(obj) in seen:
+            continue
+        if isinstance(obj, int) and -5 <= obj <= 256:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            pending.extend(obj)
+        elif isinstance(obj, memoryview):
+            pending.append(obj.obj)
+        elif isinstance(obj, (IfdTag, Thumbnail)):
+            pending.extend(getattr(obj, slot, None) for slot in obj.__slots__)
+        elif hasattr(obj, "__dict__"):
+            pending.append(vars(obj))
+    return size
+
+
+def memory_results(groups: Dict[str, List[Path]]) -> Dict[str, float]:
+    """
+    Measure the memory used by `process_file`, with `tracemalloc`.
+
+    :returns: the peak and retained memory of a call, and the size of its
+        result, in bytes per file of each group.
+    """
+    results = {}
+    for name, group in groups.items():
+        peak = retained = result = 0
+        for path in group:
+            data = path.read_bytes()
+            # caches and lazy imports are filled on the first call
+            exifread.process_file(io.BytesIO(data), details=True)
+            tracemalloc.start()
+            try:
+                start = tracemalloc.get_traced_memory()[0]
+                tags = exifread.process_file(io.BytesIO(data), details=True)
+                current, highest = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            peak += highest - start
+            retained += current - start
+            result += result_size(tags)
+        results["memory peak " + name] = peak / len(group)
+        results["memory retained " + name] = retained / len(group)
+        results["memory result " + name] = result / len(group)
+    return results
+
+
+def _format(name: str, value: float) -> str:
+    """Format a result: memory in KB, times in microseconds."""
+    if name.startswith("memory "):
+        return "%9.1f KB" % (value / 1024)
+    return "%9.3f us" % (value * 1e6)
+
+
+def _header(data: bytes) -> ExifHeader:
+    fh = io.BytesIO(data)
+    offset, endian, fake_exif, exif_size = find_exif_block(fh)
+    return ExifHeader(fh, chr(endian[0]), offset, fake_exif, False, exif_size=exif_size)
+
+
+def micro_benchmarks(resources: Path) -> List[Benchmark]:
+    """Return the benchmarks of the hot paths, on a sample JPEG file."""
+    data = (resources / MICRO_SAMPLE).read_bytes()
+    hdr = _header(data)
+    fh = io.BytesIO(data)
+    ifd = hdr.list_ifd()[0]
+    tags = exifread.process_file(io.BytesIO(data), details=True)
+    offsets = list(range(ifd, ifd + 2 + 12 * 10, 2))
+
+    def s2n() -> None:
+        for entry in offsets:
+            hdr.s2n(entry, 2)
+
+    def process_field() -> None:
+        for entry in offsets:
+            hdr._process_field(  # pylint: disable=protected-access
+                "Tag", 4, FieldType.SHORT, 2, entry
+            )
+
+    def find_jpeg() -> None:
+        fh.seek(0)
+        find_jpeg_exif(fh, fh.read(12), 0)
+
+    return [
+        ("micro s2n", s2n, len(offsets)),
+        ("micro _process_field", process_field, len(offsets)),
+        ("micro convert_types", lambda: convert_types(tags), 1),
+        ("micro find_jpeg_exif", find_jpeg, 1),
+    ]
+
+
+def scaling_benchmarks() -> List[Benchmark]:
+    """
+    Return the benchmarks of the parsing steps stressed by synthetic files.
+
+    Each runs at growing sizes of its file, to show how it scales.
+    """
+    steps: Dict[str, Callable[[bytes], Callable[[], object]]] = {
+        "tiff_pages": lambda data: lambda: _header(data).list_ifd(),
+        "tiff_strips": lambda data: lambda: _header(data).dump_ifd(8, "Image"),
+        "jpeg_icc": lambda data: lambda: find_exif_block(io.BytesIO(data)),
+        "heic_items": lambda data: lambda: find_exif_block(io.BytesIO(data)),
+        "jpeg_makernote": lambda data: lambda: exifread.process_file(
+            io.BytesIO(data), details=True
+        ),
+    }
+    benchmarks = []
+    for kind, generator in GENERATORS.items():
+        generate, sizes = generator
+        for size in sizes:
+            function = steps[kind](generate(size))
+            benchmarks.append(("scaling %s %d" % (kind, size), function, 1))
+    return benchmarks
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark], repeat: int = 5, min_time: float = 0.2
+) -> Dict[str, float]:
+    """
+    Time each benchmark, keeping the best of `repeat` runs.
+
+    :returns: the time per operation in seconds, keyed by benchmark name.
+    """
+    results = {}
+    for name, function, operations in benchmarks:
+        timer = timeit.Timer(function)
+        number, elapsed = timer.autorange()
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+        best = min(timer.repeat(repeat=repeat, number=number))
+        results[name] = best / number / operations
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    """
+    Print the results against the baseline.
+
+    :returns: the names of the benchmarks slower, or using more memory, than
+        the baseline by more than `threshold`, a fraction of the baseline.
+    """
+    regressions = []
+    print("%-40s %12s %12s %8s" % ("benchmark", "baseline", "current", "ratio"))
+    for name, value in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print("%-40s %12s %12s %8s" % (name, "-", _format(name, value), "new"))
+            continue
+        ratio = value / before if before else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  worse"
+        elif ratio < 1 - threshold:
+            flag = "  better"
+        print(
+            "%-40s %12s %12s %7.2fx%s"
+            % (name, _format(name, before), _format(name, value), ratio, flag)
+        )
+    return regressions
+
+
+def get_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/suite.py",
+        description="Benchmark exifread over a corpus of sample images.",
+    )
+    parser.add_argument(
+        "--resources",
+        type=Path,
+        default=Path("tests") / "resources",
+        help="Folder of sample images (default: tests/resources).",
+    )
+    parser.add_argument(
+        "--save", type=Path, help="Save the results as JSON to this file."
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Compare with the results saved in this file."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Increase reported as a regression, as a fraction (default: 0.1).",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs of each benchmark (default: 5)."
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Also run the parsing steps on synthetic files of growing sizes.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also measure the memory used per file, with tracemalloc.",
+    )
+    parser.add_argument(
+        "-k",
+        dest="select",
+        help="Only run the benchmarks whose name contains this string.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = get_args(argv)
+    if not args.resources.is_dir():
+        print("No sample images in %s" % args.resources, file=sys.stderr)
+        return 2
+    logging.disable(logging.CRITICAL)
+    groups = corpus_groups(args.resources)
+    benchmarks = corpus_benchmarks(groups) + micro_benchmarks(args.resources)
+    if args.scaling:
+        benchmarks += scaling_benchmarks()
+    if args.select:
+        benchmarks = [bench for bench in benchmarks if args.select in bench[0]]
+    results = run_benchmarks(benchmarks, repeat=args.repeat)
+    if args.memory:
+        for name, value in memory_results(groups).items():
+            if not args.select or args.select in name:
+                results[name] = value
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "version": exifread.__version__,
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Regressions: %s" % ", ".join(regressions))
+            return 1
+        return 0
+
+    print("%-40s %12s" % ("benchmark", "per op"))
+    for name, value in results.items():
+        print("%-40s %12s" % (name, _format(name, value)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Generate valid image files of any size, to measure how parsing scales.
+
+The sample images are small photos; these files stress one dimension each:
+the number of IFDs, the number of values of a tag, the segments before the
+EXIF one, the number of HEIC items, or the size of a MakerNote. They hold
+metadata only, not decodable pixels. To write a set of them, from the
+repository root, with exifread installed (``make install``)::
+
+    python benchmarks/synthetic.py OUTPUT_DIR
+"""
+
+import argparse
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Struct format of the field types used
+_FORMATS = {1: "B", 2: "B", 3: "H", 4: "L", 7: "B"}
+
+# Largest payload of a JPEG segment, after its marker and length
+_SEGMENT_MAX = 65535 - 2
+
+# Tag, field type, and values: bytes for ASCII and UNDEFINED, else integers
+Entry = Tuple[int, int, Union[bytes, Sequence[int]]]
+
+
+def _ifd(entries: Sequence[Entry], offset: int, next_ifd: int = 0) -> bytes:
+    """
+    Return an IFD placed at `offset` of a little-endian TIFF file.
+
+    Values not fitting in their entry follow the table, aligned on words.
+    """
+    table = [struct.pack("<H", len(entries))]
+    data: List[bytes] = []
+    data_offset = offset + 2 + 12 * len(entries) + 4
+    for tag, field_type, values in sorted(entries, key=lambda entry: entry[0]):
+        if isinstance(values, bytes):
+            raw = values
+        else:
+            raw = struct.pack("<%d%s" % (len(values), _FORMATS[field_type]), *values)
+        count = len(values)
+        if len(raw) <= 4:
+            value = raw.ljust(4, b"\x00")
+        else:
+            value = struct.pack("<L", data_offset)
+            raw += b"\x00" * (len(raw) % 2)
+            data.append(raw)
+            data_offset += len(raw)
+        table.append(struct.pack("<HHL", tag, field_type, count) + value)
+    table.append(struct.pack("<L", next_ifd))
+    return b"".join(table + data)
+
+
+def _exif(
+    entries: Sequence[Entry], exif_entries: Optional[Sequence[Entry]] = None
+) -> bytes:
+    """Return a TIFF header with one IFD, and an EXIF IFD if given."""
+    if exif_entries is None:
+        return b"II*\x00\x08\x00\x00\x00" + _ifd(entries, 8)
+    # the EXIF IFD pointer does not change the size of the first IFD
+    entries = list(entries) + [(0x8769, 4, [0])]
+    exif_offset = 8 + len(_ifd(entries, 8))
+    entries[-1] = (0x8769, 4, [exif_offset])
+    return (
+        b"II*\x00\x08\x00\x00\x00" + _ifd(entries, 8) + _ifd(exif_entries, exif_offset)
+    )
+
+
+def _image_entries(number: int = 0) -> List[Entry]:
+    return [
+        (0x0100, 3, [640]),
+        (0x0101, 3, [480]),
+        (0x010E, 2, b"Synthetic page %06d\x00" % number),
+        (0x010F, 2, b"Synthetic\x00"),
+    ]
+
+
+def tiff_pages(pages: int) -> bytes:
+    """Return a TIFF file with `pages` IFDs, one per page, in a chain."""
+    chunks = [b"II*\x00\x08\x00\x00\x00"]
+    offset = 8
+    for number in range(pages):
+        entries = _image_entries(number) + [
+            (0x00FE, 4, [2]),
+            (0x0129, 3, [number, pages]),
+        ]
+        size = len(_ifd(entries, offset))
+        next_ifd = offset + size if number + 1 < pages else 0
+        chunks.append(_ifd(entries, offset, next_ifd))
+        offset += size
+    return b"".join(chunks)
+
+
+def tiff_strips(strips: int) -> bytes:
+    """Return a TIFF file with an image of `strips` strips, of one row each."""
+    # strips point past the tables, to a single row of pixels
+    entries = _image_entries() + [
+        (0x0111, 4, [0] * strips),
+        (0x0116, 4, [1]),
+        (0x0117, 4, [640] * strips),
+    ]
+    tiff = _exif(entries)
+    entries[-3] = (0x0111, 4, [len(tiff)] * strips)
+    return _exif(entries) + b"\x00" * 640
+
+
+def jpeg_icc(size: int) -> bytes:
+    """
+    Return a JPEG file with an ICC profile of `size` bytes before its EXIF.
+
+    The profile is split in APP2 segments, which come before the APP1 one.
+    """
+    profile = b"\x00" * size
+    step = _SEGMENT_MAX - 14
+    chunks = [profile[start : start + step] for start in range(0, size, step)]
+    if len(chunks) > 255:
+        raise ValueError("ICC profile too large for 255 segments")
+    segments = [b"\xff\xd8"]
+    for number, chunk in enumerate(chunks, 1):
+        payload = b"ICC_PROFILE\x00" + bytes((number, len(chunks))) + chunk
+        segments.append(b"\xff\xe2" + struct.pack(">H", len(payload) + 2) + payload)
+    segments.append(_app1(_exif(_image_entries())))
+    segments.append(b"\xff\xdb\x00\x02\xff\xd9")
+    return b"".join(segments)
+
+
+def _app1(tiff: bytes) -> bytes:
+    payload = b"Exif\x00\x00" + tiff
+    if len(payload) > _SEGMENT_MAX:
+        raise ValueError("EXIF data too large for a JPEG segment")
+    return b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _box(kind: bytes, payload: bytes, version: Optional[int] = None) -> bytes:
+    if version is not None:
+        payload = struct.pack(">L", version << 24) + payload
+    return struct.pack(">L", len(payload) + 8) + kind + payload
+
+
+def heic_items(items: int) -> bytes:
+    """
+    Return a HEIC file with `items` items, the EXIF one last.
+
+    Other items are empty image tiles, as in grid images.
+    """
+    if not 1 <= items <= 0xFFFF:
+        raise ValueError("items must be between 1 and 65535")
+    ftyp = _box(b"ftyp", b"heic" + struct.pack(">L", 0) + b"mif1heic")
+    hdlr = _box(b"hdlr", b"\x00" * 4 + b"pict" + b"\x00" * 13, version=0)
+    iinf = _box(
+        b"iinf",
+        struct.pack(">H", items)
+        + b"".join(
+            _box(
+                b"infe",
+                struct.pack(">HH", item, 0)
+                + (b"Exif" if item == items else b"hvc1")
+                + b"\x00",
+                version=2,
+            )
+            for item in range(1, items + 1)
+        ),
+        version=0,
+    )
+    exif = struct.pack(">L", 6) + b"Exif\x00\x00" + _exif(_image_entries())
+    # iloc version 1, one extent of 4-byte offset and length: 16 bytes per item
+    iloc_size = 8 + 4 + 4 + 16 * items
+    meta_size = 8 + 4 + len(hdlr) + len(iinf) + iloc_size
+    exif_offset = len(ftyp) + meta_size + 8
+    iloc = _box(
+        b"iloc",
+        b"\x44\x00"
+        + struct.pack(">H", items)
+        + b"".join(
+            struct.pack(
+                ">HHHHLL",
+                item,
+                0,
+                0,
+                1,
+                exif_offset,
+                len(exif) if item == items else 0,
+            )
+            for item in range(1, items + 1)
+        ),
+        version=1,
+    )
+    meta = _box(b"meta", hdlr + iinf + iloc, version=0)
+    return ftyp + meta + _box(b"mdat", exif)
+
+
+def jpeg_makernote(size: int) -> bytes:
+    """
+    Return a JPEG file with a Canon MakerNote of about `size` bytes.
+
+    The MakerNote is an IFD of entries with 8 values each. The EXIF segment
+    of a JPEG file must fit in 64 KB, which bounds `size` to about 65400.
+    """
+    make = [(0x010F, 2, b"Canon\x00")]
+    # the MakerNote follows the tables of the first IFD and the EXIF IFD
+    note_offset = len(_exif(make, [(0x927C, 7, b"\x00" * 5)]))
+    count = max((size - 6) // 28, 1)
+    note = _ifd(
+        [(0x2000 + tag, 3, list(range(8))) for tag in range(count)], note_offset
+    )
+    return (
+        b"\xff\xd8"
+        + _app1(_exif(make, [(0x927C, 7, note)]))
+        + b"\xff\xdb\x00\x02\xff\xd9"
+    )
+
+
+# Generator and sizes of each kind of file, from small to large
+GENERATORS: Dict[str, Tuple[Callable[[int], bytes], Tuple[int, ...]]] = {
+    "tiff_pages": (tiff_pages, (10, 100, 1000, 10000)),
+    "tiff_strips": (tiff_strips, (100, 1000, 10000, 100000)),
+    "jpeg_icc": (jpeg_icc, (1000, 10000, 100000, 1000000)),
+    "heic_items": (heic_items, (10, 100, 1000, 10000)),
+    "jpeg_makernote": (jpeg_makernote, (1000, 4000, 16000, 64000)),
+}
+
+_SUFFIXES = {"tiff": "tiff", "jpeg": "jpg", "heic": "heic"}
+
+
+def write_files(directory: Path, kinds: Optional[Sequence[str]] = None) -> List[Path]:
+    """
+    Write the files of each kind, at each of its sizes, to `directory`.
+
+    :returns: the paths of the files written.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for kind in kinds or GENERATORS:
+        generate, sizes = GENERATORS[kind]
+        suffix = _SUFFIXES[kind.split("_")[0]]
+        for size in sizes:
+            path = directory / ("%s_%d.%s" % (kind, size, suffix))
+            path.write_bytes(generate(size))
+            paths.append(path)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python benchmarks/synthetic.py",
+        description="Write synthetic image files of growing sizes.",
+    )
+    parser.add_argument("directory", type=Path, help="Folder to write the files to.")
+    parser.add_argument(
+        "-k",
+        dest="kinds",
+        action="append",
+        choices=sorted(GENERATORS),
+        help="Kind of files to write, may be repeated (default: all).",
+    )
+    args = parser.parse_args(argv)
+    for path in write_files(args.directory, args.kinds):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
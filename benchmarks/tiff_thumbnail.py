@@ -0,0 +1,125 @@
+"""
+Microbenchmark: assembling uncompressed TIFF thumbnails.
+
+Compares the former assembler, which rebuilt an immutable ``bytes`` object
+for every pointer fix-up and strip, against
+``ExifHeader._build_tiff_thumbnail``, on synthetic thumbnails with many strips.
+
+Run from the repository root, with exifread installed (``make install``)::
+
+    python benchmarks/tiff_thumbnail.py [NUMBER]
+"""
+
+import functools
+import io
+import struct
+import sys
+import timeit
+from typing import Sequence
+
+from exifread.core.exif_header import ExifHeader
+from exifread.core.find_exif import find_exif_block, get_endian_str
+from exifread.tags.fields import FIELD_DEFINITIONS, FieldType
+
+STRIPS = (1, 16, 256, 4096)
+
+
+def _tiff_with_thumbnail(strips: int) -> bytes:
+    """Build a TIFF file with an uncompressed thumbnail of 64 byte strips."""
+    thumb_ifd = 8 + 2 + 12 + 4
+    data_start = thumb_ifd + 2 + 5 * 12 + 4
+    arrays_size = 8 * strips if strips > 1 else 0
+    offsets = [data_start + arrays_size + 64 * i for i in range(strips)]
+    entry = struct.Struct("<HHII")
+    short = struct.Struct("<HHIHxx")
+    tiff = b"II*\x00" + struct.pack("<I", 8)
+    tiff += struct.pack("<H", 1) + short.pack(0x0100, 3, 1, 16)
+    tiff += struct.pack("<IH", thumb_ifd, 5)
+    tiff += short.pack(0x0100, 3, 1, 16)
+    tiff += short.pack(0x0101, 3, 1, strips)
+    tiff += short.pack(0x0103, 3, 1, 1)
+    if strips > 1:
+        tiff += entry.pack(0x0111, 4, strips, data_start)
+        tiff += entry.pack(0x0117, 4, strips, data_start + 4 * strips)
+        tiff += struct.pack("<I", 0)
+        tiff += struct.pack("<%dI" % strips, *offsets)
+        tiff += struct.pack("<%dI" % strips, *[64] * strips)
+    else:
+        tiff += entry.pack(0x0111, 4, 1, offsets[0])
+        tiff += entry.pack(0x0117, 4, 1, 64)
+        tiff += struct.pack("<I", 0)
+    return tiff + bytes(range(64)) * strips
+
+
+def _legacy(
+    hdr: ExifHeader,
+    thumb_ifd: int,
+    old_offsets: Sequence[int],
+    old_counts: Sequence[int],
+) -> bytes:
+    # pylint: disable=protected-access
+    entries = hdr.read_ifd(thumb_ifd)[0]
+    tiff = b"II*\x00\x08\x00\x00\x00"
+    tiff += hdr._read(thumb_ifd, len(entries) * 12 + 2) + b"\x00\x00\x00\x00"
+    for i, (tag, field_type_id, count, old_offset) in enumerate(entries):
+        type_length = FIELD_DEFINITIONS[FieldType(field_type_id)][0]
+        ptr = i * 12 + 18
+        strip_len = 0
+        if tag == 0x0111:
+            strip_off = ptr
+            strip_len = count * type_length
+        if count * type_length > 4:
+            newoff = len(tiff)
+            tiff = tiff[:ptr] + hdr.n2b(newoff, 4) + tiff[ptr + 4 :]
+            if tag == 0x0111:
+                strip_off = newoff
+                strip_len = 4
+            tiff += hdr._read(old_offset, count * type_length)
+    for i, old_offset in enumerate(old_offsets):
+        offset = hdr.n2b(len(tiff), strip_len)
+        tiff = tiff[:strip_off] + offset + tiff[strip_off + strip_len :]
+        strip_off += strip_len
+        tiff += hdr._read(old_offset, old_counts[i])
+    return tiff
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(
+        "%8s %10s %14s %14s %8s"
+        % ("strips", "bytes", "legacy ms", "bytearray ms", "speedup")
+    )
+    for strips in STRIPS:
+        fh = io.BytesIO(_tiff_with_thumbnail(strips))
+        offset, endian, fake_exif, exif_size = find_exif_block(fh)
+        hdr = ExifHeader(
+            fh, get_endian_str(endian)[0], offset, fake_exif, False, exif_size=exif_size
+        )
+        ifds = hdr.list_ifd()
+        for ifd in ifds:
+            hdr.dump_ifd(ifd, "Image" if ifd == ifds[0] else "Thumbnail")
+        args = (
+            ifds[1],
+            hdr.tags["Thumbnail StripOffsets"].values,
+            hdr.tags["Thumbnail StripByteCounts"].values,
+        )
+        # pylint: disable=protected-access
+        size = len(hdr._build_tiff_thumbnail(*args))
+        before = timeit.timeit(functools.partial(_legacy, hdr, *args), number=number)
+        after = timeit.timeit(
+            functools.partial(hdr._build_tiff_thumbnail, *args), number=number
+        )
+        print(
+            "%8d %10d %14.3f %14.3f %7.1fx"
+            % (
+                strips,
+                size,
+                before / number * 1000,
+                after / number * 1000,
+                before / after,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,83 @@
 Supported formats: TIFF, JPEG, PNG, Webp, HEIC
 """
 
-from typing import Any, BinaryIO, Dict
+import importlib
+import mmap
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Iterable,
+    MutableMapping,
+    Optional,
+    Union,
+    cast,
+)
 
+from exifread.core.buffer_reader import BufferReader, BytesLike
+from exifread.core.cached_reader import BlockReader, CachedReader
 from exifread.core.exceptions import ExifNotFound, InvalidExif
-from exifread.core.exif_header import ExifHeader
-from exifread.core.find_exif import determine_type, get_endian_str
+from exifread.core.exif_header import MAX_VALUES, ExifHeader
+from exifread.core.find_exif import find_exif_block, get_endian_str
+from exifread.core.io_stats import IoStats, StatsReader
+from exifread.core.lazy_tags import LazyTags
+from exifread.core.tag_filter import TagFilter
+from exifread.core.thumbnail import Thumbnail
+from exifread.core.timings import NullTimings, Timings
 from exifread.core.xmp import find_xmp_data
 from exifread.exif_log import get_logger
-from exifread.serialize import convert_types
+from exifread.serialize import convert_tag, convert_types
 from exifread.tags import DEFAULT_STOP_TAG
 
+if TYPE_CHECKING:
+    from exifread.aio import aprocess_files, process_file_async
+    from exifread.batch import process_files
+    from exifread.core.range_reader import RangeReader
+    from exifread.retry import RetryParser
+
 __version__ = "3.5.1"
 
+__all__ = [
+    "DEFAULT_STOP_TAG",
+    "ExifHeader",
+    "ExifNotFound",
+    "InvalidExif",
+    "IoStats",
+    "RangeReader",
+    "RetryParser",
+    "Thumbnail",
+    "Timings",
+    "aprocess_files",
+    "convert_types",
+    "process_bytes",
+    "process_file",
+    "process_file_async",
+    "process_files",
+    "process_path",
+]
+
 logger = get_logger()
 
+# Imported on first use, they load asyncio, concurrent.futures and http.client,
+# or import this package
+_LAZY_ATTRIBUTES = {
+    "aprocess_files": "exifread.aio",
+    "process_file_async": "exifread.aio",
+    "process_files": "exifread.batch",
+    "RangeReader": "exifread.core.range_reader",
+    "RetryParser": "exifread.retry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 def _extract_xmp_data(hdr: ExifHeader, fh: BinaryIO):
     # Easy we already have them
@@ -26,11 +89,73 @@ def _extract_xmp_data(hdr: ExifHeader, fh: BinaryIO):
         xmp_bytes = bytes(xmp_tag.values)
     # We need to look in the entire file for the XML
     else:
+        fh.seek(0)
         xmp_bytes = find_xmp_data(fh)
     if xmp_bytes:
         hdr.parse_xmp(xmp_bytes)
 
 
+def _open_reader(fh: BinaryIO, cached: bool, stats: Optional[IoStats]) -> BinaryIO:
+    """Wrap `fh` to record its I/O in `stats`, and to read it in cached blocks."""
+    # files in memory or already read in blocks are not cached again
+    cached = cached and not isinstance(fh, (BufferReader, BlockReader))
+    if stats is not None:
+        fh = cast(BinaryIO, StatsReader(fh, stats))
+    if cached:
+        fh = cast(BinaryIO, CachedReader(fh))
+    return fh
+
+
+def _dump_ifds(hdr: ExifHeader, stop_tag: str, details: bool, timings: Timings) -> int:
+    """Decode the IFDs of the chain and the EXIF IFDs, return the thumbnail IFD."""
+    thumb_ifd = 0
+    chain = []
+    for ctr, ifd in enumerate(hdr.list_ifd()):
+        if ctr == 0:
+            ifd_name = "Image"
+        elif ctr == 1:
+            ifd_name = "Thumbnail"
+            thumb_ifd = ifd
+        else:
+            ifd_name = "IFD %d" % ctr
+        chain.append((ifd, ifd_name))
+    hdr.plan_reads(chain, stop_tag, details)
+    for ctr, (ifd, ifd_name) in enumerate(chain):
+        logger.debug("IFD %d (%s) at offset %s:", ctr, ifd_name, ifd)
+        hdr.dump_ifd(ifd=ifd, ifd_name=ifd_name, stop_tag=stop_tag)
+    timings.record("ifds")
+    # EXIF IFD
+    exif_off = hdr.tags.get("Image ExifOffset")
+    if exif_off:
+        logger.debug("Exif SubIFD at offset %s:", exif_off.values[0])
+        hdr.dump_ifd(ifd=exif_off.values[0], ifd_name="EXIF", stop_tag=stop_tag)
+
+    # EXIF SubIFD
+    sub_ifds = hdr.tags.get("Image SubIFDs")
+    if details and sub_ifds:
+        for subifd_id, subifd_offset in enumerate(sub_ifds.values):
+            logger.debug("Exif SubIFD%d at offset %d:", subifd_id, subifd_offset)
+            hdr.dump_ifd(
+                ifd=subifd_offset, ifd_name=f"EXIF SubIFD{subifd_id}", stop_tag=stop_tag
+            )
+    if exif_off or sub_ifds:
+        timings.record("sub_ifds")
+    return thumb_ifd
+
+
+def _decode_maker_note(hdr: ExifHeader, strict: bool, timings: Timings) -> None:
+    """Decode the MakerNote, errors are only raised in strict mode."""
+    try:
+        hdr.decode_maker_note()
+    except ValueError as err:
+        if not strict:
+            logger.debug("Failed to decode EXIF MakerNote: %s", str(err))
+        else:
+            raise err
+    finally:
+        timings.record("makernote %s" % (hdr.maker_note_vendor or "other"))
+
+
 def process_file(
     fh: BinaryIO,
     stop_tag: str = DEFAULT_STOP_TAG,
@@ -41,7 +166,14 @@ def process_file(
     auto_seek=True,
     extract_thumbnail=True,
     builtin_types=False,
-) -> Dict[str, Any]:
+    max_values=MAX_VALUES,
+    lazy=False,
+    tags: Optional[Iterable[str]] = None,
+    ifds: Optional[Iterable[str]] = None,
+    cached: bool = False,
+    stats: Optional[IoStats] = None,
+    timings: Optional[Timings] = None,
+) -> MutableMapping[str, Any]:
     """
     Process an image file to extract EXIF metadata.
 
@@ -58,83 +190,165 @@ def process_file(
     :param auto_seek: If `True`, automatically `seek` to the start of the file.
     :param extract_thumbnail: If `True`, extract the JPEG thumbnail.
         The thumbnail is not always present in the EXIF metadata.
+        It is returned as a `Thumbnail` holding a copy of the image data,
+        or, if `lazy` is `True` or the source is already in memory,
+        reading it when accessed.
     :param builtin_types: If `True`, convert tags to standard Python types.
+    :param max_values: Skip tags with more values than this.
+        Tags with many values (e.g. `StripOffsets`) are returned as typed arrays.
+    :param lazy: If `True`, only index the tags, and decode their values, or
+        read the thumbnail, when first accessed.
+        The file must stay open until the returned mapping is closed.
+    :param tags: Only process these tags, as `"IFD_NAME TAG_NAME"` keys.
+        `"JPEGThumbnail"` and `"TIFFThumbnail"` select the thumbnail.
+    :param ifds: Only process the tags of these IFDs, e.g. `"GPS"`.
+        If `tags` and `ifds` are both given, tags matching either are processed.
+    :param cached: If `True`, read the file through a `CachedReader`, in blocks
+        kept in a cache, rather than in many small reads.
+    :param stats: An `IoStats` recording the calls made on the file and the
+        data read, in total and for each phase of the processing.
+    :param timings: A `Timings` adding up the time spent in each phase of
+        the processing, which can be shared by many files.
 
-    :returns: A `dict` containing the EXIF metadata.
+    :returns: A `dict` containing the EXIF metadata, or a `LazyTags` mapping
+        if `lazy` is `True`.
         The keys are a string in the format `"IFD_NAME TAG_NAME"`.
-        If `builtin_types` is `False`, the value will be a `IfdTag` class, or bytes.
+        If `builtin_types` is `False`, the value will be a `IfdTag` class, or `Thumbnail`.
         IF `builtin_types` is `True`, the value will be a standard Python type.
     """
 
+    # the options are the public interface, and count as locals
+    # pylint: disable=too-many-arguments,too-many-locals
+    if timings is None:
+        timings = NullTimings()
+    timings.start()
+    fh = _open_reader(fh, cached, stats)
+    if stats is None:
+        # the phases are followed, but no I/O is recorded
+        stats = IoStats()
+
     if auto_seek:
         fh.seek(0)
 
     try:
-        offset, endian_bytes, fake_exif = determine_type(fh)
+        offset, endian_bytes, fake_exif, exif_size = find_exif_block(fh, stats)
     except ExifNotFound as err:
         logger.warning(err)
-        return {}
+        return LazyTags() if lazy else {}
     except InvalidExif as err:
         logger.debug(err)
-        return {}
+        return LazyTags() if lazy else {}
+    finally:
+        stats.phase = "access"
+        timings.record("detect")
+
+    stats.phase = "header"
+
+    tag_filter = None
+    if tags is not None or ifds is not None:
+        tag_filter = TagFilter(tags, ifds)
 
     endian_str, endian_type = get_endian_str(endian_bytes)
     # deal with the EXIF info we found
     logger.debug("Endian format is %s (%s)", endian_str, endian_type)
 
     hdr = ExifHeader(
-        fh, endian_str, offset, fake_exif, strict, debug, details, truncate_tags
+        fh,
+        endian_str,
+        offset,
+        fake_exif,
+        strict,
+        debug,
+        details,
+        truncate_tags,
+        exif_size,
+        max_values,
+        lazy,
+        tag_filter,
     )
-    thumb_ifd = 0
-    ctr = 0
-    for ifd in hdr.list_ifd():
-        if ctr == 0:
-            ifd_name = "Image"
-        elif ctr == 1:
-            ifd_name = "Thumbnail"
-            thumb_ifd = ifd
-        else:
-            ifd_name = "IFD %d" % ctr
-        logger.debug("IFD %d (%s) at offset %s:", ctr, ifd_name, ifd)
-        hdr.dump_ifd(ifd=ifd, ifd_name=ifd_name, stop_tag=stop_tag)
-        ctr += 1
-    # EXIF IFD
-    exif_off = hdr.tags.get("Image ExifOffset")
-    if exif_off:
-        logger.debug("Exif SubIFD at offset %s:", exif_off.values[0])
-        hdr.dump_ifd(ifd=exif_off.values[0], ifd_name="EXIF", stop_tag=stop_tag)
-
-    # EXIF SubIFD
-    sub_ifds = hdr.tags.get("Image SubIFDs")
-    if details and sub_ifds:
-        for subifd_id, subifd_offset in enumerate(sub_ifds.values):
-            logger.debug("Exif SubIFD%d at offset %d:", subifd_id, subifd_offset)
-            hdr.dump_ifd(
-                ifd=subifd_offset, ifd_name=f"EXIF SubIFD{subifd_id}", stop_tag=stop_tag
-            )
+    thumb_ifd = _dump_ifds(hdr, stop_tag, details, timings)
 
     # deal with MakerNote contained in EXIF IFD
     # (Some apps use MakerNote tags but do not use a format for which we
     # have a description, do not process these).
     if details and "EXIF MakerNote" in hdr.tags and "Image Make" in hdr.tags:
-        try:
-            hdr.decode_maker_note()
-        except ValueError as err:
-            if not strict:
-                logger.debug("Failed to decode EXIF MakerNote: %s", str(err))
-            else:
-                raise err
+        stats.phase = "makernote"
+        _decode_maker_note(hdr, strict, timings)
 
     # extract thumbnails
-    if thumb_ifd and extract_thumbnail:
+    if thumb_ifd and extract_thumbnail and (tag_filter is None or tag_filter.thumbnail):
+        stats.phase = "thumbnail"
         hdr.extract_tiff_thumbnail(thumb_ifd)
         hdr.extract_jpeg_thumbnail()
+        timings.record("thumbnail")
 
     # parse XMP tags (experimental)
     if debug and details:
-        _extract_xmp_data(hdr=hdr, fh=fh)
+        if tag_filter is None or tag_filter.wants("Image ApplicationNotes"):
+            stats.phase = "xmp"
+            _extract_xmp_data(hdr=hdr, fh=fh)
+            timings.record("xmp")
+
+    # reads made from now on are for lazy tags and thumbnails
+    stats.phase = "access"
+
+    # drop the tags only needed to reach the requested ones
+    if tag_filter is not None:
+        for key in [key for key in hdr.tags if not tag_filter.wants(key)]:
+            del hdr.tags[key]
 
     if builtin_types:
-        return convert_types(hdr.tags)
+        if isinstance(hdr.tags, LazyTags):
+            hdr.tags.convert = convert_tag
+            return hdr.tags
+        converted = convert_types(hdr.tags)
+        timings.record("convert")
+        return converted
 
     return hdr.tags
+
+
+def process_bytes(data: BytesLike, **kwargs: Any) -> MutableMapping[str, Any]:
+    """
+    Process an image held in memory to extract EXIF metadata.
+
+    The data is not copied, tags are decoded from it and thumbnails are
+    views on it, or assembled from it when accessed for TIFF thumbnails, so
+    it must not be modified while they are in use.
+
+    :param data: the image file contents, e.g. `bytes` or a `memoryview`.
+    :param kwargs: the options of `process_file`.
+
+    :returns: the same as `process_file`.
+    """
+    kwargs["auto_seek"] = True
+    return process_file(cast(BinaryIO, BufferReader(data)), **kwargs)
+
+
+def process_path(
+    path: Union[str, "os.PathLike[str]"], **kwargs: Any
+) -> MutableMapping[str, Any]:
+    """
+    Process an image file, given its path, to extract EXIF metadata.
+
+    The file is memory-mapped and the EXIF data decoded from the mapping,
+    without `seek`/`read` calls on a file object.
+    Files that cannot be mapped, e.g. empty files, are read in memory.
+
+    :param path: the path of the file to process.
+    :param kwargs: the options of `process_file`.
+
+    :returns: the same as `process_file`.
+        Thumbnails are views on the mapping, or assembled from it when
+        accessed, which is released once the returned tags, and any
+        thumbnail, are no longer referenced.
+    """
+    with open(path, "rb") as fh:
+        try:
+            buffer: Union[mmap.mmap, bytes] = mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except (ValueError, OSError):
+            buffer = fh.read()
+    kwargs["auto_seek"] = True
+    return process_file(cast(BinaryIO, BufferReader(buffer)), **kwargs)
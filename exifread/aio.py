@@ -0,0 +1,155 @@
+"""
+Extract EXIF metadata from asyncio code.
+
+The ranges asked for by the retry parser are read through the async
+reader, at once when it has positional reads. Files are opened and read,
+and the parsing runs, in the default executor, off the event loop.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from exifread.core.base_reader import FileReader, PositionalReader
+from exifread.core.pread_reader import PreadReader
+from exifread.retry import Range, RetryParser
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+class _FileReader:  # pylint: disable=too-few-public-methods
+    """Async reader over a local file, reading in the default executor."""
+
+    def __init__(self, fh: BinaryIO) -> None:
+        self._reader: PositionalReader
+        self._lock: Optional[threading.Lock] = None
+        if hasattr(os, "pread"):
+            self._reader = PreadReader(fh.fileno())
+        else:
+            # reads seek the file, so only one runs at a time
+            self._reader = FileReader(fh)
+            self._lock = threading.Lock()
+
+    def _pread(self, size: int, offset: int) -> bytes:
+        if self._lock is None:
+            return self._reader.pread(size, offset)
+        with self._lock:
+            return self._reader.pread(size, offset)
+
+    async def pread(self, size: int, offset: int) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._pread, size, offset)
+
+
+async def _maybe_await(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def process_file_async(
+    source: Union[PathType, Any], **kwargs: Any
+) -> MutableMapping[str, Any]:
+    """
+    Process an image file to extract EXIF metadata, from a coroutine.
+
+    :param source: the path of the file, or an async reader, with
+        `async read(size)` and a `seek(offset)` method, which may be async,
+        or with `async pread(size, offset)`, to read several ranges at once.
+    :param kwargs: the options of `process_file`, except `lazy`, `stats` and `timings`.
+
+    :returns: the same as `process_file`.
+    """
+    if kwargs.pop("lazy", False):
+        raise ValueError("Lazy decoding is not supported from async code")
+    kwargs["auto_seek"] = True
+    if isinstance(source, (str, os.PathLike)):
+        loop = asyncio.get_running_loop()
+        fh = await loop.run_in_executor(None, functools.partial(open, source, "rb"))
+        try:
+            return await _process(_FileReader(cast(BinaryIO, fh)), kwargs)
+        finally:
+            await loop.run_in_executor(None, fh.close)
+    return await _process(source, kwargs)
+
+
+async def _read_ranges(reader: Any, ranges: List[Range]) -> List[bytes]:
+    """Read the ranges asked for by a run of the parser."""
+    if hasattr(reader, "pread"):
+        # the ranges of a run are independent, read them at once
+        return list(
+            await asyncio.gather(
+                *(reader.pread(end - start, start) for start, end in ranges)
+            )
+        )
+    chunks = []
+    for start, end in ranges:
+        await _maybe_await(reader.seek(start))
+        chunks.append(await reader.read(end - start))
+    return chunks
+
+
+async def _process(reader: Any, options: dict) -> MutableMapping[str, Any]:
+    """Feed the parser with the ranges it needs, parsing off the event loop."""
+    loop = asyncio.get_running_loop()
+    parser = RetryParser(**options)
+    ranges = parser.needed()
+    while ranges:
+        for (start, end), data in zip(ranges, await _read_ranges(reader, ranges)):
+            parser.feed(start, data, eof=len(data) < end - start)
+        ranges = await loop.run_in_executor(None, parser.needed)
+    return cast(MutableMapping[str, Any], parser.tags)
+
+
+async def aprocess_files(
+    paths: Iterable[PathType], concurrency: int = 64, **kwargs: Any
+) -> AsyncIterator[Tuple[PathType, Union[MutableMapping[str, Any], Exception]]]:
+    """
+    Process image files concurrently, from a coroutine.
+
+    :param paths: the paths of the files to process.
+    :param concurrency: the maximum number of files processed at once.
+    :param kwargs: the options of `process_file`, except `lazy`, `stats` and `timings`.
+
+    :returns: an async iterator of `(path, tags)` tuples, yielded as they are
+        completed, where `tags` is the exception raised if the file could not
+        be processed.
+    """
+    if kwargs.get("lazy"):
+        raise ValueError("Lazy decoding is not supported from async code")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    async def process(
+        path: PathType,
+    ) -> Tuple[PathType, Union[MutableMapping[str, Any], Exception]]:
+        try:
+            return path, await process_file_async(path, **kwargs)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return path, err
+
+    running: Set[asyncio.Future] = set()
+    paths = iter(paths)
+    next_path: Optional[PathType] = next(paths, None)
+    while next_path is not None or running:
+        while next_path is not None and len(running) < concurrency:
+            running.add(asyncio.ensure_future(process(next_path)))
+            next_path = next(paths, None)
+        done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
@@ -0,0 +1,201 @@
+"""
+Process many files in parallel.
+"""
+
+import collections
+import itertools
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+import exifread
+from exifread.core.pread_reader import PreadReader
+from exifread.core.timings import Timings
+from exifread.serialize import SerializedTagDict
+
+PathType = Union[str, "os.PathLike[str]"]
+BatchResult = Tuple[PathType, Union[SerializedTagDict, Exception]]
+
+# Files processed by a worker per task
+DEFAULT_CHUNKSIZE = 16
+
+EXECUTORS = ("process", "thread")
+
+
+def _process_pread(path: PathType, **options: Any) -> MutableMapping[str, Any]:
+    """Process a file through positional reads on its descriptor."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return exifread.process_file(cast(BinaryIO, PreadReader(fd)), **options)
+    finally:
+        os.close(fd)
+
+
+def _process_chunk(
+    paths: List[PathType],
+    options: Dict[str, Any],
+    pread: bool = False,
+    timed: bool = False,
+) -> Tuple[List[BatchResult], Optional[Timings]]:
+    """
+    Process files in a worker, errors are returned rather than raised.
+
+    :returns: the results, and the timings of the chunk if `timed`.
+    """
+    process = _process_pread if pread else exifread.process_path
+    timings = Timings() if timed else None
+    results: List[BatchResult] = []
+    for path in paths:
+        try:
+            tags = process(path, builtin_types=True, timings=timings, **options)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results.append((path, err))
+        else:
+            results.append((path, dict(tags)))
+    return results, timings
+
+
+def _chunks(paths: Iterable[PathType], chunksize: int) -> Iterator[List[PathType]]:
+    paths = iter(paths)
+    while True:
+        chunk = list(itertools.islice(paths, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run(
+    executor: Executor,
+    paths: Iterable[PathType],
+    chunksize: int,
+    ordered: bool,
+    pending: int,
+    options: Dict[str, Any],
+    pread: bool,
+    timings: Optional[Timings],
+) -> Iterator[BatchResult]:
+    """Submit chunks of files, with at most `pending` chunks in flight."""
+
+    def results(future: Future) -> List[BatchResult]:
+        chunk_results, chunk_timings = future.result()
+        if timings is not None and chunk_timings is not None:
+            timings.merge(chunk_timings)
+        return chunk_results
+
+    timed = timings is not None
+    chunks = _chunks(paths, chunksize)
+    if ordered:
+        queue: Deque[Future] = collections.deque()
+        for chunk in chunks:
+            queue.append(executor.submit(_process_chunk, chunk, options, pread, timed))
+            if len(queue) >= pending:
+                yield from results(queue.popleft())
+        while queue:
+            yield from results(queue.popleft())
+        return
+
+    running: Set[Future] = set()
+    for chunk in chunks:
+        running.add(executor.submit(_process_chunk, chunk, options, pread, timed))
+        if len(running) >= pending:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from results(future)
+    while running:
+        done, running = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from results(future)
+
+
+def process_files(
+    paths: Iterable[PathType],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = False,
+    executor: str = "process",
+    **kwargs: Any,
+) -> Iterator[BatchResult]:
+    """
+    Process image files in parallel, over a pool of processes or threads.
+
+    Files are sent to the workers in chunks, and the tags converted to
+    built-in types in the worker.
+    Processes use `process_path`, threads read files with `os.pread` where
+    available, which suits file systems where latency dominates.
+
+    :param paths: the paths of the files to process.
+    :param workers: the number of processes, by default the number of CPUs,
+        or the number of threads, by default the number of CPUs plus 4, up to 32.
+    :param chunksize: the number of files processed per task.
+    :param ordered: If `True`, yield results in the order of `paths`,
+        else as they are completed.
+    :param executor: `"process"` or `"thread"`.
+    :param kwargs: the options of `process_file`, except `lazy` and `stats`,
+        `builtin_types` is always set. The `timings` of the workers are added
+        up in the given `Timings` as results are yielded.
+
+    :returns: an iterator of `(path, tags)` tuples, where `tags` is the
+        exception raised if the file could not be processed.
+    """
+    if kwargs.pop("lazy", False):
+        raise ValueError("Lazy decoding is not supported when processing in parallel")
+    if kwargs.get("stats") is not None:
+        raise ValueError("I/O stats are not supported when processing in parallel")
+    kwargs.pop("builtin_types", None)
+    timings = kwargs.pop("timings", None)
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if executor not in EXECUTORS:
+        raise ValueError(
+            "Unknown executor %r, expected one of %s" % (executor, ", ".join(EXECUTORS))
+        )
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    # the options are checked above, when called, not on the first result
+    return _process_files(paths, workers, chunksize, ordered, executor, kwargs, timings)
+
+
+def _process_files(
+    paths: Iterable[PathType],
+    workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+    executor: str,
+    options: Dict[str, Any],
+    timings: Optional[Timings],
+) -> Iterator[BatchResult]:
+    pool: Executor
+    if executor == "thread":
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers)
+    pread = executor == "thread" and hasattr(os, "pread")
+
+    with pool:
+        yield from _run(
+            pool, paths, chunksize, ordered, workers * 2, options, pread, timings
+        )
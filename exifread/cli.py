@@ -19,14 +19,25 @@
 import argparse
 import sys
 import timeit
+from typing import List
 
 from exifread import __version__, exif_log, process_file
 from exifread.core.exceptions import ExifError
+from exifread.core.io_stats import IoCounters, IoStats
+from exifread.core.timings import Timings
 from exifread.tags.fields import FIELD_DEFINITIONS
 
 logger = exif_log.get_logger()
 
 
+def _comma_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _format_counters(counters: IoCounters) -> str:
+    return ", ".join("%s=%d" % item for item in counters.as_dict().items())
+
+
 def get_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="EXIF.py", description="Extract EXIF information from digital image files."
@@ -59,6 +70,18 @@ def get_args() -> argparse.Namespace:
         dest="stop_tag",
         help="Stop processing when this tag is retrieved.",
     )
+    parser.add_argument(
+        "--tags",
+        type=_comma_list,
+        dest="tags",
+        help="Only process these tags, comma separated (ex: 'Image Make,GPS GPSDate').",
+    )
+    parser.add_argument(
+        "--ifds",
+        type=_comma_list,
+        dest="ifds",
+        help="Only process the tags of these IFDs, comma separated (ex: 'EXIF,GPS').",
+    )
     parser.add_argument(
         "-s",
         "--strict",
@@ -80,6 +103,12 @@ def get_args() -> argparse.Namespace:
         dest="debug",
         help="Run in debug mode (display extra info).",
     )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        dest="stats",
+        help="Display the I/O made on each file.",
+    )
     parser.add_argument(
         "-c",
         "--color",
@@ -104,6 +133,8 @@ def run_cli(args: argparse.Namespace) -> None:
         ).decode()
 
         file_start = timeit.default_timer()
+        stats = IoStats() if args.stats else None
+        timings = Timings() if args.debug else None
         try:
             with open(escaped_fn, "rb") as img_file:
                 logger.info("Opening: %s", escaped_fn)
@@ -118,6 +149,10 @@ def run_cli(args: argparse.Namespace) -> None:
                     debug=args.debug,
                     extract_thumbnail=args.detailed,
                     builtin_types=args.builtin_types,
+                    tags=args.tags,
+                    ifds=args.ifds,
+                    stats=stats,
+                    timings=timings,
                 )
                 tag_stop = timeit.default_timer()
 
@@ -154,7 +189,15 @@ def run_cli(args: argparse.Namespace) -> None:
 
         file_stop = timeit.default_timer()
 
+        if stats is not None:
+            logger.info("I/O: %s", _format_counters(stats))
+            for phase, counters in stats.phases.items():
+                logger.info("I/O %s: %s", phase, _format_counters(counters))
+
         logger.debug("Tags processed in %s seconds", tag_stop - tag_start)
+        if timings is not None:
+            for phase, seconds in timings.seconds.items():
+                logger.debug("  %s: %s seconds", phase, seconds)
         logger.debug("File processed in %s seconds", file_stop - file_start)
         print()
 
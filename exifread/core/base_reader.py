@@ -0,0 +1,138 @@
+"""
+Base of the file-like readers keeping their own position.
+"""
+
+import io
+from typing import BinaryIO, Optional
+
+# Size of the chunks searched for the end of a line
+LINE_CHUNK_SIZE = 8192
+
+
+class PositionalReader(io.RawIOBase):
+    """
+    Read-only, seekable file reading at an offset with `pread`.
+
+    The position is kept here, so a read does not need a `seek` first.
+    Subclasses implement `pread` and `_file_size`.
+    """
+
+    # the whole file, if it is in memory
+    buffer: Optional[memoryview] = None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._position = 0
+
+    def pread(self, size: int, offset: int) -> bytes:
+        """Read `size` bytes at `offset`, fewer at the end of the file."""
+        raise NotImplementedError
+
+    def _file_size(self) -> int:
+        """Return the size of the file."""
+        raise NotImplementedError
+
+    def preadinto(self, buffer: memoryview, offset: int) -> int:
+        """
+        Read into `buffer` at `offset`, without moving the position.
+
+        :returns: the number of bytes read, fewer at the end of the file.
+        """
+        data = self.pread(len(buffer), offset)
+        buffer[: len(data)] = data
+        return len(data)
+
+    def start_header(self) -> None:
+        """Called once the EXIF header is found, before decoding it."""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            size = max(self._file_size() - self._position, 0)
+        data = self.pread(size, self._position)
+        self._position += len(data)
+        return data
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        limit = -1 if size is None else size
+        chunks = []
+        while limit != 0:
+            length = LINE_CHUNK_SIZE if limit < 0 else min(limit, LINE_CHUNK_SIZE)
+            data = self.pread(length, self._position)
+            if not data:
+                break
+            end = data.find(b"\n") + 1
+            if end:
+                data = data[:end]
+            chunks.append(data)
+            self._position += len(data)
+            if end:
+                break
+            if limit > 0:
+                limit -= len(data)
+        return b"".join(chunks)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._file_size()
+        elif whence != io.SEEK_SET:
+            raise ValueError("invalid whence (%r)" % whence)
+        if offset < 0:
+            raise ValueError("negative seek position %d" % offset)
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._position
+
+
+class FileReader(PositionalReader):
+    """
+    Positional reads over another file, seeking it before each read.
+
+    The wrapped file is owned by the caller.
+    """
+
+    def __init__(self, fh: BinaryIO) -> None:
+        super().__init__()
+        self.fh = fh
+        self._position = fh.tell()
+
+    def pread(self, size: int, offset: int) -> bytes:
+        self.fh.seek(offset)
+        return self.fh.read(size)
+
+    def preadinto(self, buffer: memoryview, offset: int) -> int:
+        readinto = getattr(self.fh, "readinto", None)
+        if readinto is None:
+            return super().preadinto(buffer, offset)
+        self.fh.seek(offset)
+        done = 0
+        while done < len(buffer):
+            size = readinto(buffer[done:])
+            if not size:
+                break
+            done += size
+        return done
+
+    def _file_size(self) -> int:
+        return self.fh.seek(0, io.SEEK_END)
+
+
+def positional_reader(fh: BinaryIO) -> PositionalReader:
+    """Return `fh` if it reads at an offset, else a `FileReader` over it."""
+    if isinstance(fh, PositionalReader):
+        return fh
+    return FileReader(fh)
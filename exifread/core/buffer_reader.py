@@ -0,0 +1,58 @@
+"""
+File-like access to data already in memory.
+"""
+
+import mmap
+from typing import Optional, Union
+
+from exifread.core.base_reader import PositionalReader
+
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class BufferReader(PositionalReader):
+    """
+    Read-only, seekable file over a buffer, such as a memory-mapped file.
+
+    The EXIF header is decoded straight from `buffer`, without copying it.
+    """
+
+    def __init__(self, buffer: BytesLike) -> None:
+        super().__init__()
+        self.buffer: memoryview = memoryview(buffer).cast("B")
+        # slices of bytes and mmap are bytes, other buffers are sliced as views
+        self._sliceable: Union[bytes, mmap.mmap, memoryview] = (
+            buffer if isinstance(buffer, (bytes, mmap.mmap)) else self.buffer
+        )
+        # searched directly, other buffers are copied on the first search
+        self._searchable: Optional[Union[bytes, bytearray, mmap.mmap]] = (
+            buffer if isinstance(buffer, (bytes, bytearray, mmap.mmap)) else None
+        )
+
+    def pread(self, size: int, offset: int) -> bytes:
+        data = self._sliceable[offset : offset + size]
+        return data if isinstance(data, bytes) else bytes(data)
+
+    def _file_size(self) -> int:
+        return len(self.buffer)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        end = self.find(b"\n", self._position)
+        end = len(self.buffer) if end == -1 else end + 1
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        return self.read(max(end - self._position, 0))
+
+    def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        """Return the lowest offset of `sub` in the buffer, or -1 if not found."""
+        if self._searchable is None:
+            self._searchable = self.buffer.tobytes()
+        if end is None:
+            end = len(self.buffer)
+        return self._searchable.find(sub, start, end)
+
+    def readinto(self, buffer) -> int:
+        data = self.buffer[self._position : self._position + len(buffer)]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
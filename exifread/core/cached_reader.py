@@ -0,0 +1,141 @@
+"""
+File-like access reading in aligned blocks, kept in a cache.
+"""
+
+import collections
+import io
+from typing import BinaryIO, List, Optional
+
+from exifread.core.base_reader import PositionalReader
+
+# Size of the blocks read and cached
+BLOCK_SIZE = 64 * 1024
+
+# Number of blocks kept in the cache
+MAX_BLOCKS = 64
+
+
+class BlockReader(PositionalReader):
+    """
+    Read-only, seekable file reading its data in aligned blocks.
+
+    Blocks are kept in a least recently used cache, and consecutive missing
+    blocks are read at once. Subclasses read the data with `_fetch`, and
+    implement `_file_size`.
+
+    :param block_size: the size of the blocks read.
+    :param max_blocks: the number of blocks kept in the cache.
+    """
+
+    def __init__(
+        self, block_size: int = BLOCK_SIZE, max_blocks: int = MAX_BLOCKS
+    ) -> None:
+        super().__init__()
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        if max_blocks < 1:
+            raise ValueError("max_blocks must be at least 1")
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self._blocks: "collections.OrderedDict[int, bytes]" = collections.OrderedDict()
+        # size of the file, once known
+        self.size: Optional[int] = None
+        # number of blocks found in the cache, and read
+        self.hits = 0
+        self.misses = 0
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        """Read the `[start, end)` range, fewer bytes at the end of the file."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self._blocks.clear()
+        super().close()
+
+    def _store(self, index: int, block: bytes) -> None:
+        self._blocks[index] = block
+        self._blocks.move_to_end(index)
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        """Return the data in `[start, end)`, from the cache or read."""
+        if self.size is not None:
+            end = min(end, self.size)
+        if start >= end:
+            return b""
+        block_size = self.block_size
+        first = start // block_size
+        last = (end - 1) // block_size
+        chunks: List[bytes] = []
+        index = first
+        while index <= last:
+            block = self._blocks.get(index)
+            if block is not None:
+                self.hits += 1
+                self._blocks.move_to_end(index)
+                chunks.append(block)
+                if len(block) < block_size:
+                    break
+                index += 1
+                continue
+            # read the missing blocks up to the next cached one at once
+            run_end = index + 1
+            while run_end <= last and run_end not in self._blocks:
+                run_end += 1
+            self.misses += run_end - index
+            data = self._fetch(index * block_size, run_end * block_size)
+            for offset in range(0, len(data), block_size):
+                self._store(
+                    index + offset // block_size, data[offset : offset + block_size]
+                )
+            chunks.append(data)
+            if len(data) < (run_end - index) * block_size:
+                # end of the file
+                self.size = index * block_size + len(data)
+                break
+            index = run_end
+        skip = start - first * block_size
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        return data[skip : skip + end - start]
+
+    def pread(self, size: int, offset: int) -> bytes:
+        return self._read_range(offset, offset + size)
+
+
+class CachedReader(BlockReader):
+    """
+    Read-only file over another file, reading it in aligned blocks.
+
+    The many small reads of the parsers, at scattered offsets, are served
+    from a few larger reads, which suits slow or remote files.
+    The wrapped file is owned by the caller.
+
+    :param fh: the file to read, opened in binary mode and seekable.
+    :param block_size: the size of the blocks read.
+    :param max_blocks: the number of blocks kept in the cache.
+    """
+
+    def __init__(
+        self, fh: BinaryIO, block_size: int = BLOCK_SIZE, max_blocks: int = MAX_BLOCKS
+    ) -> None:
+        super().__init__(block_size, max_blocks)
+        self.fh = fh
+        self._position = fh.tell()
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        self.fh.seek(start)
+        chunks = []
+        size = end - start
+        while size > 0:
+            data = self.fh.read(size)
+            if not data:
+                break
+            chunks.append(data)
+            size -= len(data)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def _file_size(self) -> int:
+        if self.size is None:
+            self.size = self.fh.seek(0, io.SEEK_END)
+        return self.size
@@ -2,12 +2,35 @@
 Base classes.
 """
 
+# the header decodes, and reads, every part of the EXIF data
+# pylint: disable=too-many-lines
+
+import array
+import bisect
+import importlib
+import logging
 import re
 import struct
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+import sys
+from types import ModuleType
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from exifread.core.base_reader import positional_reader
 from exifread.core.exceptions import ExifError
-from exifread.core.ifd_tag import IfdTag
+from exifread.core.ifd_tag import Formatter, IfdTag
+from exifread.core.lazy_tags import LazyTags
+from exifread.core.tag_filter import TagFilter
+from exifread.core.thumbnail import Thumbnail
 from exifread.core.xmp import xmp_bytes_to_str
 from exifread.exif_log import get_logger
 from exifread.tags import (
@@ -20,31 +43,97 @@
 from exifread.tags.exif import EXIF_TAGS
 from exifread.tags.fields import (
     FIELD_DEFINITIONS,
-    FLOAT_FIELD_TYPES,
     RATIO_FIELD_TYPES,
-    SIGNED_FIELD_TYPES,
     FieldType,
 )
-from exifread.tags.makernote import (
-    apple,
-    canon,
-    casio,
-    dji,
-    fujifilm,
-    nikon,
-    olympus,
-    sony,
-)
+from exifread.tags.makernote import CANON_CAMERA_INFO_TAG_NAME
 from exifread.utils import Ratio
 
 logger = get_logger()
 
+# Maximum number of bytes read up front when loading the EXIF block.
+# Containers give the exact size of the block, but for TIFF based files
+# (including RAW) the block is the whole file.
+PRELOAD_LIMIT = 256 * 1024
+
+# Values outside the EXIF block are read together when closer than this
+MERGE_GAP = 4 * 1024
+
+# First read of the values of a field outside the block, doubled until the
+# field is read, so that a corrupted count does not cause a large read
+FIELD_CHUNK_SIZE = 64 * 1024
+
+# Integer unpackers keyed by (endian, length, signed)
+_INT_STRUCTS: Dict[Tuple[str, int, bool], struct.Struct] = {
+    (endian, length, signed): struct.Struct(prefix + fmt)
+    for endian, prefix in (("I", "<"), ("M", ">"))
+    for (length, signed), fmt in {
+        (1, False): "B",
+        (1, True): "b",
+        (2, False): "H",
+        (2, True): "h",
+        (4, False): "I",
+        (4, True): "i",
+        (8, False): "Q",
+        (8, True): "q",
+    }.items()
+}
+
+# IFD entry unpackers: tag, field type, count and value (or offset to value)
+_ENTRY_STRUCTS: Dict[str, struct.Struct] = {
+    "I": struct.Struct("<HHII"),
+    "M": struct.Struct(">HHII"),
+}
+
+IfdEntry = Tuple[int, int, int, int]
+
+
+def _int_typecode(length: int, signed: bool) -> str:
+    """Find the array typecode for an integer of the given size."""
+    for typecode in "bhilq" if signed else "BHILQ":
+        if array.array(typecode).itemsize == length:
+            return typecode
+    raise ValueError("unsupported integer length: %d" % length)
+
+
+# array typecodes for the value of each field type
+_ARRAY_TYPECODES: Dict[FieldType, str] = {
+    FieldType.BYTE: "B",
+    FieldType.SHORT: "H",
+    FieldType.LONG: _int_typecode(4, False),
+    FieldType.RATIO: _int_typecode(4, False),
+    FieldType.SIGNED_BYTE: "b",
+    FieldType.UNDEFINED: "B",
+    FieldType.SIGNED_SHORT: "h",
+    FieldType.SIGNED_LONG: _int_typecode(4, True),
+    FieldType.SIGNED_RATIO: _int_typecode(4, True),
+    FieldType.FLOAT_32: "f",
+    FieldType.FLOAT_64: "d",
+    FieldType.IFD: _int_typecode(4, False),
+}
+
+_NATIVE_ENDIAN = "I" if sys.byteorder == "little" else "M"
+
+# Fields with more values than this are skipped, unless configured otherwise
+MAX_VALUES = 1 << 17
+
+# Fields with at least this many values are returned as typed arrays, not lists
+ARRAY_VALUES_THRESHOLD = 1000
+
+# Largest TIFF thumbnail assembled while processing a file object, thumbnails
+# are otherwise assembled when accessed: the thumbnail IFD of a multi-page TIFF
+# may hold a full size page
+TIFF_THUMBNAIL_LIMIT = 1024 * 1024
+
 
 class ExifHeader:
     """
     Handle an EXIF header.
     """
 
+    # the in-memory block and the reads past it are state of the decoding
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(
         self,
         file_handle: BinaryIO,
@@ -55,7 +144,13 @@ def __init__(
         debug=False,
         detailed=True,
         truncate_tags=True,
+        exif_size=0,
+        max_values=MAX_VALUES,
+        lazy=False,
+        tag_filter: Optional[TagFilter] = None,
     ) -> None:
+        # the options of process_file are passed through
+        # pylint: disable=too-many-arguments
         self.file_handle = file_handle
         self.endian = endian
         self.offset = offset
@@ -64,7 +159,182 @@ def __init__(
         self.debug = debug
         self.detailed = detailed
         self.truncate_tags = truncate_tags
-        self.tags: Dict[str, Any] = {}
+        self.max_values = max_values
+        self.tag_filter = tag_filter
+        # checked once, tags are decoded without building unused log messages
+        self._debug_log = logger.isEnabledFor(logging.DEBUG)
+        self.tags: MutableMapping[str, Any]
+        if lazy:
+            self.tags = LazyTags(self._decode_deferred)
+        else:
+            self.tags = {}
+        # decoded IFD entry tables, keyed by (offset, endian, IFD)
+        self._ifd_cache: Dict[Tuple[int, str, int], Tuple[List[IfdEntry], int]] = {}
+        # all reads go through `pread`, file objects seek before each read
+        self._reader = positional_reader(file_handle)
+        self._reader.start_header()
+        # data read outside the block, sorted by position in the file
+        self._extent_starts: List[int] = []
+        self._extents: List[bytes] = []
+        # size of the file, once a read came back short
+        self._file_end: Optional[int] = None
+        # in-memory copy of the EXIF block, starting at `offset` in the file
+        self._block_start = offset
+        # set if the block runs up to the end of the file
+        self._block_eof = False
+        # set if the block holds all the EXIF data, as sized by its container
+        self._block_whole = False
+        self._block = self._load_block(exif_size)
+        # values to read at once on the first one outside the block, as
+        # (offset, IFD, IFD entry, tag name, relative): those of the IFD chain
+        # and its sub-IFDs, then of the IFD being dumped
+        self._plan: List[Tuple[int, int, IfdEntry, str, int]] = []
+        # vendor of the MakerNote, once decoded
+        self.maker_note_vendor: Optional[str] = None
+
+    def _load_block(self, exif_size: int) -> memoryview:
+        """Read the EXIF block in one go, up to `PRELOAD_LIMIT` bytes."""
+        buffer = self._reader.buffer
+        if buffer is not None:
+            # already in memory, the block is the rest of the buffer
+            self._block_eof = True
+            return buffer[self._block_start :]
+        self._block_whole = 0 < exif_size <= PRELOAD_LIMIT
+        if not self._block_whole:
+            exif_size = PRELOAD_LIMIT
+        data = self._read_file(self._block_start, exif_size)
+        self._block_eof = len(data) < exif_size
+        return memoryview(data)
+
+    def _in_block(self, start: int, length: int) -> bool:
+        """Check if data at `start` can be served without reading the file."""
+        return start >= 0 and (start + length <= len(self._block) or self._block_eof)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """
+        Return `length` bytes at `offset` from the start of the EXIF information.
+
+        Served from the in-memory block, falling back to the file if outside of it.
+        """
+        start = self.offset + offset - self._block_start
+        if self._in_block(start, length):
+            return self._block[start : start + length].tobytes()
+        return self._read_outside(self.offset + offset, length)
+
+    def _read_outside(self, position: int, length: int) -> bytes:
+        """Read data outside the block, planning the reads of the current IFD."""
+        if self._file_end is not None and position >= self._file_end:
+            return b""
+        data = self._from_extents(position, length)
+        if data is None and self._plan:
+            self._read_plan()
+            data = self._from_extents(position, length)
+        if data is None:
+            data = self._read_file(position, length)
+        return data
+
+    def _from_extents(self, position: int, length: int) -> Optional[bytes]:
+        """Return data already read outside the block, if available."""
+        index = bisect.bisect_right(self._extent_starts, position) - 1
+        if index >= 0:
+            start = self._extent_starts[index]
+            data = self._extents[index]
+            end = start + len(data)
+            if position + length <= end or end == self._file_end:
+                return data[position - start : position - start + length]
+        return None
+
+    def _add_extent(self, position: int, data: bytes) -> None:
+        index = bisect.bisect_right(self._extent_starts, position)
+        self._extent_starts.insert(index, position)
+        self._extents.insert(index, data)
+
+    def _read_plan(self) -> None:
+        """
+        Read the planned values outside the block, in ascending order.
+
+        The IFD tables are read on their own.
+        """
+        ranges = []
+        for offset, ifd, ifd_entry, tag_name, relative in self._plan:
+            _, field_type_id, count, value_offset = ifd_entry
+            type_length = FIELD_DEFINITIONS.get(field_type_id, (0,))[0]  # type: ignore
+            length = count * type_length
+            # inline, too big to read ahead, or skipped
+            if length <= 4 or length > FIELD_CHUNK_SIZE:
+                continue
+            if count > self.max_values and tag_name not in (
+                "MakerNote",
+                CANON_CAMERA_INFO_TAG_NAME,
+            ):
+                continue
+            position = offset + self._value_offset(ifd, value_offset, relative)
+            end = position + length
+            if self._file_end is not None:
+                end = min(end, self._file_end)
+            if 0 <= position < end and self._from_extents(position, length) is None:
+                if not self._in_block(position - self._block_start, length):
+                    ranges.append((position, end))
+        self._plan.clear()
+
+        merged: List[List[int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + MERGE_GAP:
+                merged[-1][1] = max(end, merged[-1][1])
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            data = self._read_file(start, end - start)
+            if data:
+                self._add_extent(start, data)
+
+    def _read_values(self, offset: int, length: int) -> bytes:
+        """
+        Return up to `length` bytes of field values at `offset`.
+
+        The length comes from the count of the field, which is not trusted:
+        data outside the block is read in growing chunks, up to the end of
+        the file.
+        """
+        start = self.offset + offset - self._block_start
+        if length <= FIELD_CHUNK_SIZE or self._in_block(start, length):
+            return self._read(offset, length)
+        chunks = []
+        size = FIELD_CHUNK_SIZE
+        while length > 0:
+            chunk = self._read(offset, min(size, length))
+            chunks.append(chunk)
+            if len(chunk) < min(size, length):
+                break
+            offset += size
+            length -= size
+            size *= 2
+        return b"".join(chunks)
+
+    def _read_file(self, position: int, length: int) -> bytes:
+        """Read from the file, a short read marks its end."""
+        data = self._reader.pread(length, position)
+        if len(data) < length:
+            self._file_end = position + len(data)
+        return data
+
+    def _read_into(self, offset: int, buffer: memoryview) -> int:
+        """
+        Copy the data at `offset` from the start of the EXIF information into `buffer`.
+
+        :returns: the number of bytes copied, the rest of `buffer` is left unchanged.
+        """
+        length = len(buffer)
+        start = self.offset + offset - self._block_start
+        if self._in_block(start, length):
+            view = self._block[start : start + length]
+            buffer[: len(view)] = view
+            return len(view)
+        data = self._from_extents(self.offset + offset, length)
+        if data is None:
+            return self._reader.preadinto(buffer, self.offset + offset)
+        buffer[: len(data)] = data
+        return len(data)
 
     def s2n(self, offset: int, length: int, signed=False) -> int:
         """
@@ -76,24 +346,18 @@ def s2n(self, offset: int, length: int, signed=False) -> int:
         to some other starting point.
         """
         # Little-endian if Intel, big-endian if Motorola
-        fmt = "<" if self.endian == "I" else ">"
-        # Construct a format string from the requested length and signedness;
+        endian = "I" if self.endian == "I" else "M"
         # raise a ValueError if length is something silly like 3
         try:
-            fmt += {
-                (1, False): "B",
-                (1, True): "b",
-                (2, False): "H",
-                (2, True): "h",
-                (4, False): "I",
-                (4, True): "i",
-                (8, False): "L",
-                (8, True): "l",
-            }[(length, signed)]
+            unpacker = _INT_STRUCTS[(endian, length, signed)]
         except KeyError as err:
             raise ValueError("unexpected unpacking length: %d" % length) from err
-        self.file_handle.seek(self.offset + offset)
-        buf = self.file_handle.read(length)
+
+        start = self.offset + offset - self._block_start
+        if start >= 0 and start + length <= len(self._block):
+            return unpacker.unpack_from(self._block, start)[0]
+
+        buf = self._read(offset, length)
 
         if buf:
             # Make sure the buffer is the proper length.
@@ -101,7 +365,7 @@ def s2n(self, offset: int, length: int, signed=False) -> int:
             if len(buf) != length:
                 logger.warning("Unexpected slice length: %d", len(buf))
                 return 0
-            return struct.unpack(fmt, buf)[0]
+            return unpacker.unpack(buf)[0]
         return 0
 
     def n2b(self, offset: int, length: int) -> bytes:
@@ -119,10 +383,61 @@ def _first_ifd(self) -> int:
         """Return first IFD."""
         return self.s2n(4, 4)
 
+    def read_ifd(self, ifd: int) -> Tuple[List[IfdEntry], int]:
+        """
+        Decode the entry table of an IFD in one go.
+
+        :returns: the list of (tag, field type, count, value or offset) entries
+            and the pointer to the next IFD.
+        """
+        key = (self.offset, self.endian, ifd)
+        if key in self._ifd_cache:
+            return self._ifd_cache[key]
+
+        count = self.s2n(ifd, 2)
+        endian = "I" if self.endian == "I" else "M"
+        size = 12 * count
+        table = self._read(ifd + 2, size + 4)
+        position = self.offset + ifd + 2
+        if (
+            len(table) == size + 4
+            and not self._in_block(position - self._block_start, size + 4)
+            and self._from_extents(position, size + 4) is None
+        ):
+            # keep the table, inline values are read from it
+            self._add_extent(position, table)
+        if len(table) < size + 4:
+            entries = self._read_truncated_ifd(ifd, count, table)
+            next_ifd = 0
+        else:
+            entries = list(_ENTRY_STRUCTS[endian].iter_unpack(table[:size]))
+            next_ifd = _INT_STRUCTS[(endian, 4, False)].unpack_from(table, size)[0]
+
+        self._ifd_cache[key] = (entries, next_ifd)
+        return entries, next_ifd
+
+    def _read_truncated_ifd(self, ifd: int, count: int, table: bytes) -> List[IfdEntry]:
+        """Decode an IFD table cut short by the end of the file."""
+        endian = "I" if self.endian == "I" else "M"
+        complete = len(table) // 12
+        entries = list(_ENTRY_STRUCTS[endian].iter_unpack(table[: complete * 12]))
+        if complete < count:
+            # the partial entry is decoded field by field, missing data reads as 0
+            entry = ifd + 2 + 12 * complete
+            tag = self.s2n(entry, 2)
+            field_type = self.s2n(entry + 2, 2)
+            if field_type:
+                entries.append(
+                    (tag, field_type, self.s2n(entry + 4, 4), self.s2n(entry + 8, 4))
+                )
+            else:
+                entries.append((tag, 0, 0, 0))
+            entries.extend([(0, 0, 0, 0)] * (count - complete - 1))
+        return entries
+
     def _next_ifd(self, ifd: int) -> int:
         """Return the pointer to next IFD."""
-        entries = self.s2n(ifd, 2)
-        next_ifd = self.s2n(ifd + 2 + 12 * entries, 4)
+        next_ifd = self.read_ifd(ifd)[1]
         if next_ifd == ifd:
             return 0
         return next_ifd
@@ -145,54 +460,50 @@ def _process_field(
         self,
         tag_name: str,
         count: int,
-        field_type: int,
+        field_type: FieldType,
         type_length: int,
         offset: int,
-    ) -> list:
-        values: List[Any] = []
-        signed = field_type in SIGNED_FIELD_TYPES
-        # TODO: investigate
-        # some entries get too big to handle could be malformed
-        # file or problem with self.s2n
-        if count < 1000:
-            for _ in range(count):
-                if field_type in RATIO_FIELD_TYPES:
-                    # a ratio
-                    ratio_value = Ratio(
-                        self.s2n(offset, 4, signed), self.s2n(offset + 4, 4, signed)
-                    )
-                    values.append(ratio_value)
-                elif field_type in FLOAT_FIELD_TYPES:
-                    # a float or double
-                    unpack_format = ""
-                    if self.endian == "I":
-                        unpack_format += "<"
-                    else:
-                        unpack_format += ">"
-                    if field_type == FieldType.FLOAT_32:
-                        unpack_format += "f"
-                    else:
-                        unpack_format += "d"
-                    self.file_handle.seek(self.offset + offset)
-                    byte_str = self.file_handle.read(type_length)
-                    try:
-                        values.append(struct.unpack(unpack_format, byte_str))
-                    except struct.error:
-                        logger.warning("Possibly corrupted field %s", tag_name)
+    ) -> Optional[Union[list, array.array]]:
+        """
+        Decode the values of a numeric field.
 
-                else:
-                    value = self.s2n(offset, type_length, signed)
-                    values.append(value)
-
-                offset = offset + type_length
-        # The test above causes problems with tags that are
-        # supposed to have long values! Fix up one important case.
-        elif tag_name in ("MakerNote", canon.CAMERA_INFO_TAG_NAME):
-            for _ in range(count):
-                value = self.s2n(offset, type_length, signed)
-                values.append(value)
-                offset = offset + type_length
-        return values
+        :returns: the values, or `None` if not a single value could be read.
+        """
+        # some entries get too big to handle, could be a malformed file
+        if count > self.max_values and tag_name not in (
+            "MakerNote",
+            CANON_CAMERA_INFO_TAG_NAME,
+        ):
+            logger.debug("Skipping %s, too many values: %d", tag_name, count)
+            return []
+
+        # ratios are stored as pairs of numerator and denominator
+        items = count * 2 if field_type in RATIO_FIELD_TYPES else count
+        values = array.array(_ARRAY_TYPECODES[field_type])
+        data = self._read_values(offset, count * type_length)
+        usable = len(data) - len(data) % values.itemsize
+        if usable != len(data):
+            logger.warning("Unexpected slice length: %d", len(data) - usable)
+        values.frombytes(data[:usable])
+        if self.endian != _NATIVE_ENDIAN and values.itemsize > 1:
+            values.byteswap()
+
+        if len(values) < items:
+            # cut short by the end of the file, only the values read are kept
+            logger.warning("Possibly corrupted field %s", tag_name)
+            if len(values) < items // count:
+                return None
+
+        if field_type in RATIO_FIELD_TYPES:
+            return [Ratio(num, den) for num, den in zip(values[::2], values[1::2])]
+        # Keep compact typed arrays for large fields such as StripOffsets,
+        # the MakerNote is decoded from a list.
+        if count >= ARRAY_VALUES_THRESHOLD and tag_name not in (
+            "MakerNote",
+            CANON_CAMERA_INFO_TAG_NAME,
+        ):
+            return values
+        return values.tolist()
 
     def _process_ascii_field(
         self, ifd_name: str, tag_name: str, count: int, offset: int
@@ -204,8 +515,7 @@ def _process_ascii_field(
         if count != 0:  # and count < (2**31):  # 2E31 is hardware dependent. --gd
             file_position = self.offset + offset
             try:
-                self.file_handle.seek(file_position)
-                values = self.file_handle.read(count)
+                values = self._read_values(offset, count)
 
                 # Drop any garbage after a null.
                 values = values.split(b"\x00", 1)[0]
@@ -228,56 +538,36 @@ def _process_ascii_field(
                 values = ""
         return values
 
-    def _get_printable_for_field(
+    def _get_formatter_for_field(
         self,
-        count: int,
         values: Union[str, list],
-        field_type: FieldType,
         tag_entry: IfdDictValue,
         stop_tag: str,
-    ) -> Tuple[str, bool]:
-        # TODO: use only one type
-        if count == 1 and field_type != FieldType.ASCII:
-            printable = str(values[0])
-        elif count > 50 and len(values) > 20 and not isinstance(values, str):
-            if self.truncate_tags:
-                printable = str(values[0:20])[0:-1] + ", ... ]"
-            else:
-                printable = str(values[0:-1])
-        else:
-            printable = str(values)
-
-        prefer_printable = False
-
-        # compute printable version of values
-        if tag_entry:
-            # optional 2nd tag element is present
-            if tag_entry[1] is not None:
-                prefer_printable = True
-
-                # call mapping function
-                if callable(tag_entry[1]):
-                    printable = tag_entry[1](values)
-                # handle sub-ifd
-                elif isinstance(tag_entry[1], tuple):
-                    ifd_info = tag_entry[1]
-                    try:
-                        logger.debug("%s SubIFD at offset %d:", ifd_info[0], values[0])
-                        self.dump_ifd(
-                            ifd=values[0],  # type: ignore
-                            stop_tag=stop_tag,
-                            ifd_name=ifd_info[0],
-                            tag_dict=ifd_info[1],
-                        )
-                    except IndexError:
-                        logger.warning("No values found for %s SubIFD", ifd_info[0])
-                else:
-                    printable = ""
-                    for val in values:
-                        # use lookup table for this tag
-                        printable += tag_entry[1].get(val, repr(val))
+    ) -> Tuple[Optional[Formatter], bool]:
+        """
+        Return how to compute the printable version of the values, and whether
+        it should be preferred. Sub-IFDs are processed as they are found.
+        """
+        if not tag_entry or tag_entry[1] is None:
+            return None, False
 
-        return printable, prefer_printable
+        # optional 2nd tag element is present
+        if not isinstance(tag_entry[1], tuple):
+            return tag_entry[1], True
+
+        # handle sub-ifd
+        ifd_info = tag_entry[1]
+        try:
+            logger.debug("%s SubIFD at offset %d:", ifd_info[0], values[0])
+            self.dump_ifd(
+                ifd=values[0],  # type: ignore
+                stop_tag=stop_tag,
+                ifd_name=ifd_info[0],
+                tag_dict=ifd_info[1],
+            )
+        except IndexError:
+            logger.warning("No values found for %s SubIFD", ifd_info[0])
+        return None, True
 
     def _process_tag(
         self,
@@ -285,12 +575,12 @@ def _process_tag(
         ifd_name: str,
         tag_entry: SubIfdTagDictValue,
         entry: int,
-        tag: int,
+        ifd_entry: IfdEntry,
         tag_name: str,
         relative: bool,
         stop_tag: str,
     ) -> None:
-        field_type_id = self.s2n(entry + 2, 2)
+        tag, field_type_id = ifd_entry[:2]
         try:
             field_type = FieldType(field_type_id)
         except ValueError as err:
@@ -308,8 +598,62 @@ def _process_tag(
                 )
             return
 
+        # Sub-IFDs are always followed, other values are decoded on access
+        if isinstance(self.tags, LazyTags) and not (
+            tag_entry and isinstance(tag_entry[1], tuple)
+        ):
+            self.tags.defer(
+                ifd_name + " " + tag_name,
+                (
+                    self.offset,
+                    self.endian,
+                    ifd,
+                    ifd_name,
+                    tag_entry,
+                    entry,
+                    ifd_entry,
+                    tag_name,
+                    relative,
+                    stop_tag,
+                ),
+            )
+            return
+
+        self._decode_tag(
+            ifd,
+            ifd_name,
+            tag_entry,
+            entry,
+            ifd_entry,
+            tag_name,
+            relative,
+            stop_tag,
+        )
+
+    def _decode_deferred(self, deferred: tuple) -> None:
+        """Decode an IFD entry indexed in lazy mode."""
+        offset, endian = self.offset, self.endian
+        # MakerNotes may have been indexed with their own offset and endian
+        self.offset, self.endian = deferred[0], deferred[1]
+        try:
+            self._decode_tag(*deferred[2:])
+        finally:
+            self.offset, self.endian = offset, endian
+
+    def _decode_tag(
+        self,
+        ifd: int,
+        ifd_name: str,
+        tag_entry: SubIfdTagDictValue,
+        entry: int,
+        ifd_entry: IfdEntry,
+        tag_name: str,
+        relative: bool,
+        stop_tag: str,
+    ) -> None:
+        tag, field_type_id, count, value_offset = ifd_entry
+        field_type = FieldType(field_type_id)
         type_length = FIELD_DEFINITIONS[field_type][0]
-        count = self.s2n(entry + 4, 4)
         # Adjust for tag id/type/count (2+2+4 bytes)
         # Now we point at either the data or the 2nd level offset
         offset = entry + 8
@@ -317,19 +661,7 @@ def _process_tag(
         # If the value fits in 4 bytes, it is inlined, else we
         # need to jump ahead again.
         if count * type_length > 4:
-            # offset is not the value; it's a pointer to the value
-            # if relative we set things up so s2n will seek to the right
-            # place when it adds self.offset.  Note that this 'relative'
-            # is for the Nikon type 3 makernote.  Other cameras may use
-            # other relative offsets, which would have to be computed here
-            # slightly differently.
-            if relative:
-                tmp_offset = self.s2n(offset, 4)
-                offset = tmp_offset + ifd - 8
-                if self.fake_exif:
-                    offset += 18
-            else:
-                offset = self.s2n(offset, 4)
+            offset = self._value_offset(ifd, value_offset, relative)
 
         field_offset = offset
         if field_type == FieldType.ASCII:
@@ -338,22 +670,132 @@ def _process_tag(
             values = self._process_field(
                 tag_name, count, field_type, type_length, offset
             )
+            if values is None:
+                if isinstance(self.tags, LazyTags):
+                    # already listed, kept without values
+                    self.tags[ifd_name + " " + tag_name] = IfdTag(
+                        "[]", tag, field_type, [], offset, count * type_length
+                    )
+                return
 
-        printable, prefer_printable = self._get_printable_for_field(
-            count, values, field_type, tag_entry, stop_tag
+        formatter, prefer_printable = self._get_formatter_for_field(
+            values, tag_entry, stop_tag
         )
 
-        self.tags[ifd_name + " " + tag_name] = IfdTag(
-            printable,
+        # the printable version is computed on first access
+        ifd_tag = IfdTag(
+            None,
             tag,
             field_type,
             values,
             field_offset,
             count * type_length,
             prefer_printable,
+            formatter,
+            self.truncate_tags,
         )
-        tag_value = repr(self.tags[ifd_name + " " + tag_name])
-        logger.debug(" %s: %s", tag_name, tag_value)
+        self.tags[ifd_name + " " + tag_name] = ifd_tag
+        if self._debug_log:
+            logger.debug(" %s: %s", tag_name, repr(ifd_tag))
+
+    def _value_offset(self, ifd: int, value_offset: int, relative) -> int:
+        """Return the offset of values which do not fit in the entry."""
+        # offset is not the value; it's a pointer to the value
+        # if relative we set things up so s2n will seek to the right
+        # place when it adds self.offset.  Note that this 'relative'
+        # is for the Nikon type 3 makernote.  Other cameras may use
+        # other relative offsets, which would have to be computed here
+        # slightly differently.
+        if relative:
+            offset = value_offset + ifd - 8
+            if self.fake_exif:
+                offset += 18
+            return offset
+        return value_offset
+
+    def _select_entries(
+        self, ifd: int, ifd_name: str, tag_dict: Dict[int, Any], stop_tag: str
+    ) -> List[Tuple[Any, int, IfdEntry, str]]:
+        """
+        Return the entries of an IFD to decode.
+
+        :returns: the list of (tag definition, entry offset, IFD entry, tag name).
+        """
+        entries = self.read_ifd(ifd)[0]
+        selected = []
+        for i, ifd_entry in enumerate(entries):
+            # entry is index of start of this IFD in the file
+            entry = ifd + 2 + 12 * i
+            tag = ifd_entry[0]
+
+            # get tag name early to avoid errors, help debug
+            tag_entry = tag_dict.get(tag)
+            if tag_entry:
+                tag_name = tag_entry[0]
+            else:
+                tag_name = f"Tag 0x{tag:04X}"
+
+            # ignore certain tags for faster processing
+            if not (not self.detailed and tag in IGNORE_TAGS) and (
+                self.tag_filter is None or self.tag_filter.needs_tag(ifd_name, tag_name)
+            ):
+                selected.append((tag_entry, entry, ifd_entry, tag_name))
+
+            if tag_name == stop_tag:
+                break
+        return selected
+
+    def plan_reads(
+        self, chain: Sequence[Tuple[int, str]], stop_tag: str, details: bool
+    ) -> None:
+        """
+        Read the values of the IFD chain and of its sub-IFDs in merged ranges.
+
+        The IFDs are walked as `process_file` dumps them, before any value is
+        decoded: the chain, then the EXIF and SubIFDs IFDs, then the GPS and
+        Interoperability IFDs. The values of each level are read together,
+        before the tables of the next level, which they may hold. Sub-IFDs
+        listed out of their entry, e.g. several SubIFDs, and MakerNotes are
+        planned when dumped.
+
+        :param chain: the IFDs of the chain, with their names.
+        """
+        # values are only read when decoded, or already in memory
+        if isinstance(self.tags, LazyTags) or self._block_eof or self._block_whole:
+            return
+        level: List[Tuple[int, str, Dict[int, Any]]] = [
+            (ifd, ifd_name, EXIF_TAGS) for ifd, ifd_name in chain
+        ]
+        seen = set()
+        while level:
+            sub_ifds = []
+            for ifd, ifd_name, tag_dict in level:
+                if ifd in seen or (
+                    self.tag_filter is not None
+                    and not self.tag_filter.needs_ifd(ifd_name)
+                ):
+                    continue
+                seen.add(ifd)
+                try:
+                    selected = self._select_entries(ifd, ifd_name, tag_dict, stop_tag)
+                except TypeError:
+                    continue
+                for tag_entry, _, ifd_entry, tag_name in selected:
+                    self._plan.append((self.offset, ifd, ifd_entry, tag_name, 0))
+                    tag, field_type_id, count, value_offset = ifd_entry
+                    # pointers to sub-IFDs, stored in the entry
+                    if count != 1 or field_type_id not in (4, 13):
+                        continue
+                    if ifd_name == "Image" and tag == 0x8769:
+                        sub_ifds.append((value_offset, "EXIF", EXIF_TAGS))
+                    elif ifd_name == "Image" and tag == 0x014A and details:
+                        sub_ifds.append((value_offset, "EXIF SubIFD0", EXIF_TAGS))
+                    elif tag_entry and isinstance(tag_entry[1], tuple):
+                        sub_ifds.append(
+                            (value_offset, tag_entry[1][0], tag_entry[1][1])
+                        )
+            self._read_plan()
+            level = sub_ifds
 
     def dump_ifd(
         self,
@@ -365,100 +807,139 @@ def dump_ifd(
     ) -> None:
         """Return a list of entries in the given IFD."""
 
+        # skip IFDs without any requested tag
+        if self.tag_filter is not None and not self.tag_filter.needs_ifd(ifd_name):
+            logger.debug("Skipping %s IFD", ifd_name)
+            return
+
         # make sure we can process the entries
         if tag_dict is None:
             tag_dict = EXIF_TAGS
         try:
-            entries = self.s2n(ifd, 2)
+            selected = self._select_entries(ifd, ifd_name, tag_dict, stop_tag)
         except TypeError:
             logger.warning("Possibly corrupted IFD: %s", ifd_name)
             return
 
-        for i in range(entries):
-            # entry is index of start of this IFD in the file
-            entry = ifd + 2 + 12 * i
-            tag = self.s2n(entry, 2)
-
-            # get tag name early to avoid errors, help debug
-            tag_entry = tag_dict.get(tag)
-            if tag_entry:
-                tag_name = tag_entry[0]
-            else:
-                tag_name = f"Tag 0x{tag:04X}"
-
-            # ignore certain tags for faster processing
-            if not (not self.detailed and tag in IGNORE_TAGS):
+        # values are only read up front when decoded right away
+        outer_plan = self._plan
+        if isinstance(self.tags, LazyTags):
+            self._plan = []
+        else:
+            self._plan = [
+                (self.offset, ifd, ifd_entry, tag_name, relative)
+                for _, _, ifd_entry, tag_name in selected
+            ]
+        try:
+            for tag_entry, entry, ifd_entry, tag_name in selected:
                 self._process_tag(
-                    ifd, ifd_name, tag_entry, entry, tag, tag_name, relative, stop_tag
+                    ifd,
+                    ifd_name,
+                    tag_entry,
+                    entry,
+                    ifd_entry,
+                    tag_name,
+                    relative,
+                    stop_tag,
                 )
-
-            if tag_name == stop_tag:
-                break
+        finally:
+            self._plan = outer_plan
 
     def extract_tiff_thumbnail(self, thumb_ifd: int) -> None:
         """
         Extract uncompressed TIFF thumbnail.
 
-        Take advantage of the pre-existing layout in the thumbnail IFD as
-        much as possible
+        With lazy tags, or a file in memory, the thumbnail is only assembled
+        when its data is accessed. Otherwise, thumbnails larger than
+        `TIFF_THUMBNAIL_LIMIT` are left out.
         """
         thumb = self.tags.get("Thumbnail Compression")
-        if not thumb or thumb.printable != "Uncompressed TIFF":
+        # 1 is uncompressed
+        if not thumb or thumb.values[:1] != [1]:
             return
 
-        entries = self.s2n(thumb_ifd, 2)
-        # this is header plus offset to IFD ...
-        if self.endian == "M":
-            tiff = b"MM\x00*\x00\x00\x00\x08"
-        else:
-            tiff = b"II*\x00\x08\x00\x00\x00"
-            # ... plus thumbnail IFD data plus a null "next IFD" pointer
-        self.file_handle.seek(self.offset + thumb_ifd)
-        tiff += self.file_handle.read(entries * 12 + 2) + b"\x00\x00\x00\x00"
+        # tags may be filtered out of the result, keep what is needed to build it
+        strip_offsets = self.tags.get("Thumbnail StripOffsets")
+        strip_counts = self.tags.get("Thumbnail StripByteCounts")
+        if not strip_offsets or not strip_counts:
+            return
+        if not self._defer_thumbnails():
+            size = sum(strip_counts.values)
+            if size > TIFF_THUMBNAIL_LIMIT:
+                logger.debug("TIFF thumbnail of %d bytes not assembled", size)
+                return
+            self.tags["TIFFThumbnail"] = Thumbnail(
+                self._build_tiff_thumbnail(
+                    thumb_ifd, strip_offsets.values, strip_counts.values
+                )
+            )
+            return
+        self.tags["TIFFThumbnail"] = Thumbnail(
+            load=lambda: self._build_tiff_thumbnail(
+                thumb_ifd, strip_offsets.values, strip_counts.values
+            )
+        )
 
-        # fix up large value offset pointers into data area
-        for i in range(entries):
-            entry = thumb_ifd + 2 + 12 * i
-            tag = self.s2n(entry, 2)
-            field_type = FieldType(self.s2n(entry + 2, 2))
-            type_length = FIELD_DEFINITIONS[field_type][0]
-            count = self.s2n(entry + 4, 4)
-            old_offset = self.s2n(entry + 8, 4)
+    def _build_tiff_thumbnail(
+        self, thumb_ifd: int, old_offsets: Sequence[int], old_counts: Sequence[int]
+    ) -> bytearray:
+        """
+        Assemble a TIFF file from the thumbnail IFD.
+
+        Take advantage of the pre-existing layout in the thumbnail IFD as
+        much as possible
+        """
+        entries = self.read_ifd(thumb_ifd)[0]
+        endian = "I" if self.endian == "I" else "M"
+        ifd_size = len(entries) * 12 + 2
+
+        # lay out header, IFD, null "next IFD" pointer, values out of the
+        # entries, then pixel strips
+        size = 8 + ifd_size + 4
+        values: List[Tuple[int, int, int, int]] = []
+        strip_ptr = -1
+        strip_length = 0
+        for i, (tag, field_type_id, count, old_offset) in enumerate(entries):
+            type_length = FIELD_DEFINITIONS[FieldType(field_type_id)][0]
             # start of the 4-byte pointer area in entry
             ptr = i * 12 + 18
-
-            # remember strip offsets
-            strip_len = 0
+            length = count * type_length
+            # remember strip offsets location
             if tag == 0x0111:
-                strip_off = ptr
-                strip_len = count * type_length
-                # is it in the data area?
-            if count * type_length > 4:
-                # update offset pointer (nasty "strings are immutable" crap)
-                # should be able to say "tiff[ptr:ptr+4]=newoff"
-                newoff = len(tiff)
-                tiff = tiff[:ptr] + self.n2b(newoff, 4) + tiff[ptr + 4 :]
-                # remember strip offsets location
-                if tag == 0x0111:
-                    strip_off = newoff
-                    strip_len = 4
-                # get original data and store it
-                self.file_handle.seek(self.offset + old_offset)
-                tiff += self.file_handle.read(count * type_length)
+                strip_ptr = size if length > 4 else ptr
+                strip_length = type_length
+            # is it in the data area?
+            if length > 4:
+                values.append((ptr, old_offset, length, size))
+                size += length
+        strips = list(zip(old_offsets, old_counts))
+
+        tiff = bytearray(size + sum(count for _, count in strips))
+        # this is header plus offset to IFD ...
+        if endian == "M":
+            tiff[:8] = b"MM\x00*\x00\x00\x00\x08"
+        else:
+            tiff[:8] = b"II*\x00\x08\x00\x00\x00"
+        # ... plus thumbnail IFD data
+        view = memoryview(tiff)
+        self._read_into(thumb_ifd, view[8 : 8 + ifd_size])
+
+        # fix up large value offset pointers into data area
+        for ptr, old_offset, length, new_offset in values:
+            _INT_STRUCTS[(endian, 4, False)].pack_into(tiff, ptr, new_offset)
+            self._read_into(old_offset, view[new_offset : new_offset + length])
 
         # add pixel strips and update strip offset info
-        old_offsets = self.tags["Thumbnail StripOffsets"].values
-        old_counts = self.tags["Thumbnail StripByteCounts"].values
-        for i, old_offset in enumerate(old_offsets):
-            # update offset pointer (more nasty "strings are immutable" crap)
-            offset = self.n2b(len(tiff), strip_len)
-            tiff = tiff[:strip_off] + offset + tiff[strip_off + strip_len :]
-            strip_off += strip_len
-            # add pixel strip to end
-            self.file_handle.seek(self.offset + old_offset)
-            tiff += self.file_handle.read(old_counts[i])
-
-        self.tags["TIFFThumbnail"] = tiff
+        strip_offset = _INT_STRUCTS[(endian, strip_length or 4, False)]
+        mask = (1 << 8 * strip_offset.size) - 1
+        for i, (old_offset, count) in enumerate(strips):
+            if strip_ptr >= 0:
+                strip_offset.pack_into(tiff, strip_ptr + i * strip_length, size & mask)
+            self._read_into(old_offset, view[size : size + count])
+            size += count
+
+        view.release()
+        return tiff
 
     def extract_jpeg_thumbnail(self) -> None:
         """
@@ -469,20 +950,45 @@ def extract_jpeg_thumbnail(self) -> None:
         thumb_offset = self.tags.get("Thumbnail JPEGInterchangeFormat")
         thumb_length = self.tags.get("Thumbnail JPEGInterchangeFormatLength")
         if thumb_offset and thumb_length:
-            self.file_handle.seek(self.offset + thumb_offset.values[0])
-            size = thumb_length.values[0]
-            self.tags["JPEGThumbnail"] = self.file_handle.read(size)
+            self.tags["JPEGThumbnail"] = self._thumbnail(
+                thumb_offset.values[0], thumb_length.values[0]
+            )
 
         # Sometimes in a TIFF file, a JPEG thumbnail is hidden in the MakerNote
         # since it's not allowed in a uncompressed TIFF IFD
         if "JPEGThumbnail" not in self.tags:
             thumb_offset = self.tags.get("MakerNote JPEGThumbnail")
             if thumb_offset:
-                self.file_handle.seek(self.offset + thumb_offset.values[0])
-                self.tags["JPEGThumbnail"] = self.file_handle.read(
-                    thumb_offset.field_length
+                self.tags["JPEGThumbnail"] = self._thumbnail(
+                    thumb_offset.values[0], thumb_offset.field_length
                 )
 
+    def _thumbnail(self, offset: int, length: int) -> Thumbnail:
+        """
+        Return a handle on image data stored as a unit.
+
+        Data held in the EXIF block is a view on it, and data past the block
+        is read from the file when accessed. Unless tags are lazy, data from a
+        file object is copied, so the thumbnail does not need the file.
+        """
+        if not self._defer_thumbnails():
+            return Thumbnail(self._read(offset, length), offset=self.offset + offset)
+        start = self.offset + offset - self._block_start
+        if start >= 0 and start + length <= len(self._block):
+            return Thumbnail(
+                self._block[start : start + length], offset=self.offset + offset
+            )
+        return Thumbnail(
+            load=lambda: self._read(offset, length),
+            offset=self.offset + offset,
+            length=length,
+        )
+
+    def _defer_thumbnails(self) -> bool:
+        """Return `True` if thumbnails may keep a reference to the file."""
+        # a file in memory outlives the processing, unlike an open file object
+        return isinstance(self.tags, LazyTags) or self._reader.buffer is not None
+
     def decode_maker_note(self) -> None:
         """
         Decode all the camera-specific MakerNote formats
@@ -519,6 +1025,7 @@ def decode_maker_note(self) -> None:
         # not at the start of the makernote, it's probably type 2, since some
         # cameras work that way.
         if "NIKON" in make:
+            nikon = self._vendor_tags("nikon")
             if note.values[0:7] == [78, 105, 107, 111, 110, 0, 1]:
                 logger.debug("Looks like a type 1 Nikon MakerNote.")
                 self.dump_ifd(
@@ -547,6 +1054,7 @@ def decode_maker_note(self) -> None:
 
         # Olympus
         if make.startswith("OLYMPUS"):
+            olympus = self._vendor_tags("olympus")
             self.dump_ifd(
                 ifd=note.field_offset + 8, ifd_name="MakerNote", tag_dict=olympus.TAGS
             )
@@ -557,12 +1065,14 @@ def decode_maker_note(self) -> None:
 
         # Casio
         if "CASIO" in make or "Casio" in make:
+            casio = self._vendor_tags("casio")
             self.dump_ifd(
                 ifd=note.field_offset, ifd_name="MakerNote", tag_dict=casio.TAGS
             )
             return
 
         if "SONY" in make:
+            sony = self._vendor_tags("sony")
             self.dump_ifd(
                 ifd=note.field_offset, ifd_name="MakerNote", tag_dict=sony.TAGS
             )
@@ -570,6 +1080,7 @@ def decode_maker_note(self) -> None:
 
         # Fujifilm
         if make == "FUJIFILM":
+            fujifilm = self._vendor_tags("fujifilm")
             # bug: everything else is "Motorola" endian, but the MakerNote
             # is "Intel" endian
             endian = self.endian
@@ -598,6 +1109,7 @@ def decode_maker_note(self) -> None:
             83,
             0,
         ]:
+            apple = self._vendor_tags("apple")
             offset = self.offset
             self.offset += note.field_offset + 14
             self.dump_ifd(ifd=0, ifd_name="MakerNote", tag_dict=apple.TAGS)
@@ -605,6 +1117,7 @@ def decode_maker_note(self) -> None:
             return
 
         if make == "DJI":
+            dji = self._vendor_tags("dji")
             endian = self.endian
             self.endian = "I"
             offset = self.offset
@@ -616,22 +1129,36 @@ def decode_maker_note(self) -> None:
 
         # Canon
         if make == "Canon":
+            canon = self._vendor_tags("canon")
             self.dump_ifd(
                 ifd=note.field_offset, ifd_name="MakerNote", tag_dict=canon.TAGS
             )
-            for tag_id, tags_dict in canon.OFFSET_TAGS.items():
-                tag_str = f"MakerNote Tag 0x{tag_id:04X}"
-                if tag_str in self.tags:
-                    logger.debug("Canon %s", tag_str)
-                    self._canon_decode_tag(self.tags[tag_str].values, tags_dict)
-                    del self.tags[tag_str]
-            if canon.CAMERA_INFO_TAG_NAME in self.tags:
-                tag = self.tags[canon.CAMERA_INFO_TAG_NAME]
-                logger.debug("Canon CameraInfo")
-                self._canon_decode_camera_info(tag)
-                del self.tags[canon.CAMERA_INFO_TAG_NAME]
+            self._canon_decode_tags(canon)
             return
 
+    def _vendor_tags(self, vendor: str) -> ModuleType:
+        """
+        Import the tag tables of a MakerNote vendor, and record the vendor.
+
+        The tables of each vendor are only imported when its MakerNote is seen.
+        """
+        self.maker_note_vendor = vendor
+        return importlib.import_module("exifread.tags.makernote." + vendor)
+
+    def _canon_decode_tags(self, canon: ModuleType) -> None:
+        """Replace the Canon tags packing several values by their values."""
+        for tag_id, tags_dict in canon.OFFSET_TAGS.items():
+            tag_str = f"MakerNote Tag 0x{tag_id:04X}"
+            if tag_str in self.tags:
+                logger.debug("Canon %s", tag_str)
+                self._canon_decode_tag(self.tags[tag_str].values, tags_dict)
+                del self.tags[tag_str]
+        if canon.CAMERA_INFO_TAG_NAME in self.tags:
+            tag = self.tags[canon.CAMERA_INFO_TAG_NAME]
+            logger.debug("Canon CameraInfo")
+            self._canon_decode_camera_info(tag)
+            del self.tags[canon.CAMERA_INFO_TAG_NAME]
+
     #    TODO Decode Olympus MakerNote tag based on offset within tag.
     #    def _olympus_decode_tag(self, value, mn_tags):
     #        pass
@@ -653,10 +1180,11 @@ def _canon_decode_tag(self, value, mn_tags: SubIfdTagDict) -> None:
                     raise ExifError(f"Invalid tag type for Canon: {type(tag_format)}")
             else:
                 val = value[tag_idx]
-            try:
-                logger.debug(" %s %s %s", tag_idx, tag_name, hex(value[tag_idx]))
-            except TypeError:
-                logger.debug(" %s %s %s", tag_idx, tag_name, value[tag_idx])
+            if self._debug_log:
+                try:
+                    logger.debug(" %s %s %s", tag_idx, tag_name, hex(value[tag_idx]))
+                except TypeError:
+                    logger.debug(" %s %s %s", tag_idx, tag_name, value[tag_idx])
 
             # It's not a real IFD Tag, but we fake one to make everybody happy.
             # This will have a "proprietary" type
@@ -678,6 +1206,10 @@ def _canon_decode_camera_info(self, camera_info_tag: IfdTag) -> None:
             return
         model = model_tag.printable
 
+        from exifread.tags.makernote import (  # pylint: disable=import-outside-toplevel
+            canon,
+        )
+
         for model_name_re, tag_desc in canon.CAMERA_INFO_MODEL_MAP.items():
             if re.search(model_name_re, model):
                 camera_info_tags = tag_desc
@@ -701,7 +1233,8 @@ def _canon_decode_camera_info(self, camera_info_tag: IfdTag) -> None:
             packed_tag_value = camera_info[offset : offset + tag_size]
             tag_value = tag_func(struct.unpack(tag_format, packed_tag_value)[0])
 
-            logger.debug(" %s %s", tag_name, tag_value)
+            if self._debug_log:
+                logger.debug(" %s %s", tag_name, tag_value)
 
             self.tags["MakerNote " + tag_name] = IfdTag(
                 printable=str(tag_value),
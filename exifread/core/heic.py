@@ -21,7 +21,7 @@
 logger = get_logger()
 
 
-def find_heic_tiff(fh: BinaryIO) -> Tuple[int, bytes]:
+def find_heic_tiff(fh: BinaryIO) -> Tuple[int, bytes, int]:
     """
     Look for TIFF header in HEIC files.
 
@@ -43,7 +43,8 @@ def find_heic_tiff(fh: BinaryIO) -> Tuple[int, bytes]:
             + " instead of a TIFF header."
         )
 
-    return offset, endian
+    # size is unknown
+    return offset, endian, 0
 
 
 class BoxVersion(ExifError):
@@ -326,24 +327,24 @@ def _parse_idat(self, box: Box) -> None:
     def _parse_iref(self, box: Box) -> None:
         logger.debug("HEIC: found 'iref' Box %s, skipped", box.name)
 
-    def find_exif(self) -> Tuple[int, bytes]:
+    def find_exif(self) -> Tuple[int, bytes, int]:
         ftyp = self.expect_parse("ftyp")
         if (
             ftyp.major_brand not in [b"heic", b"avif", b"mif1"]
             or ftyp.minor_version != 0
         ):
-            return 0, b""
+            return 0, b"", 0
 
         meta = self.expect_parse("meta")
         if meta.subs["iinf"].exif_infe is None:
-            return 0, b""
+            return 0, b"", 0
 
         item_id = meta.subs["iinf"].exif_infe.item_id
         extents = meta.subs["iloc"].locs[item_id]
         logger.debug("HEIC: found Exif location.")
         # we expect the Exif data to be in one piece.
         assert len(extents) == 1
-        pos, _ = extents[0]
+        pos, length = extents[0]
         # looks like there's a kind of pseudo-box here.
         self.file_handle.seek(pos)
         # the payload of "Exif" item may be start with either
@@ -359,10 +360,12 @@ def find_exif(self) -> Tuple[int, bytes]:
 
             offset = 0
             endian = b"?"  # Haven't got Endian info yet
+            size = 0
         else:
             assert exif_tiff_header_offset >= 6
             assert self.get(exif_tiff_header_offset)[-6:] == b"Exif\x00\x00"
             offset = self.file_handle.tell()
             endian = self.file_handle.read(1)
+            size = max(length - 4 - exif_tiff_header_offset, 0)
 
-        return offset, endian
+        return offset, endian, size
@@ -2,26 +2,87 @@
 Eases dealing with tags.
 """
 
+import array
+from typing import Any, Callable, Dict, Optional, Union
+
 from exifread.tags.fields import FIELD_DEFINITIONS, FieldType
 
+# Either a mapping of values to their description, or a function
+# returning the printable version of the values.
+Formatter = Union[Dict[Any, str], Callable[[Any], str]]
+
+
+def get_printable(
+    values,
+    field_type: FieldType,
+    count: int,
+    formatter: Optional[Formatter] = None,
+    truncate: bool = True,
+) -> str:
+    """Compute the printable version of tag values."""
+    # call mapping function
+    if callable(formatter):
+        return formatter(values)
+    # use lookup table for this tag
+    if formatter is not None:
+        if truncate and count > 50 and len(values) > 20:
+            return (
+                "".join([formatter.get(val, repr(val)) for val in values[0:20]]) + "..."
+            )
+        return "".join([formatter.get(val, repr(val)) for val in values])
+
+    # TODO: use only one type
+    if count == 1 and field_type != FieldType.ASCII:
+        return str(values[0])
+    if count > 50 and len(values) > 20 and not isinstance(values, str):
+        # typed arrays print as lists, other values as in previous versions
+        if isinstance(values, array.array):
+            values = values.tolist()
+        if truncate:
+            return str(values[0:20])[0:-1] + ", ... ]"
+        return str(values[0:-1])
+    if isinstance(values, array.array):
+        return str(values.tolist())
+    return str(values)
+
 
 class IfdTag:
     """
     Represents an IFD tag.
+
+    If not given, the printable version of the values is only computed
+    when first accessed.
     """
 
+    __slots__ = (
+        "_printable",
+        "_formatter",
+        "_truncate",
+        "tag",
+        "field_type",
+        "field_offset",
+        "field_length",
+        "values",
+        "prefer_printable",
+    )
+
     def __init__(
         self,
-        printable: str,
+        printable: Optional[str],
         tag: int,
         field_type: FieldType,
         values,
         field_offset: int,
         field_length: int,
         prefer_printable: bool = True,
+        formatter: Optional[Formatter] = None,
+        truncate: bool = True,
     ) -> None:
-        # printable version of data
-        self.printable = printable
+        # printable version of data, None until computed
+        self._printable = printable
+        # how to compute the printable version
+        self._formatter = formatter
+        self._truncate = truncate
         # tag ID number
         self.tag = tag
         # field type as index into FIELD_TYPES
@@ -30,12 +91,29 @@ def __init__(
         self.field_offset = field_offset
         # length of data field in bytes
         self.field_length = field_length
-        # either string, bytes or list of data items
+        # either string, bytes, list or typed array (large fields) of data items
         # TODO: sort out this type mess!
         self.values = values
         # indication if printable version should be used upon serialization
         self.prefer_printable = prefer_printable
 
+    @property
+    def printable(self) -> str:
+        if self._printable is None:
+            type_length = FIELD_DEFINITIONS[self.field_type][0]
+            self._printable = get_printable(
+                self.values,
+                self.field_type,
+                self.field_length // type_length if type_length else 0,
+                self._formatter,
+                self._truncate,
+            )
+        return self._printable
+
+    @printable.setter
+    def printable(self, value: str) -> None:
+        self._printable = value
+
     def __str__(self) -> str:
         return self.printable
 
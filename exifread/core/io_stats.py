@@ -0,0 +1,129 @@
+"""
+Accounting of the I/O made on a file.
+"""
+
+import io
+from typing import BinaryIO, Dict, Optional
+
+from exifread.core.base_reader import FileReader, PositionalReader, positional_reader
+
+
+class IoCounters:
+    """Counters of the calls made on a file, and of the data read."""
+
+    __slots__ = ("seeks", "reads", "bytes_read", "max_read", "start", "end")
+
+    def __init__(self) -> None:
+        self.seeks = 0
+        self.reads = 0
+        self.bytes_read = 0
+        # largest single read
+        self.max_read = 0
+        # span of the file read, from `start` to `end`
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+
+    @property
+    def span(self) -> int:
+        """Return the size of the part of the file read, first to last byte."""
+        if self.start is None or self.end is None:
+            return 0
+        return self.end - self.start
+
+    def add_read(self, position: int, size: int) -> None:
+        self.reads += 1
+        self.bytes_read += size
+        self.max_read = max(self.max_read, size)
+        if size:
+            if self.start is None or position < self.start:
+                self.start = position
+            if self.end is None or position + size > self.end:
+                self.end = position + size
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "seeks": self.seeks,
+            "reads": self.reads,
+            "bytes_read": self.bytes_read,
+            "max_read": self.max_read,
+            "span": self.span,
+        }
+
+    def __repr__(self) -> str:
+        return "<%s %s>" % (
+            self.__class__.__name__,
+            " ".join("%s=%d" % item for item in self.as_dict().items()),
+        )
+
+
+class IoStats(IoCounters):
+    """
+    I/O made while processing a file, in total and for each phase.
+
+    Phases are the finder of the file format (e.g. `"jpeg"`, `"heic"`), then
+    `"header"`, `"makernote"`, `"thumbnail"` and `"xmp"`. Reads made after
+    processing, e.g. by lazy tags or thumbnails, count in the `"access"` phase.
+    """
+
+    __slots__ = ("phase", "phases")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.phase = "detect"
+        self.phases: Dict[str, IoCounters] = {}
+
+    def _counters(self) -> IoCounters:
+        counters = self.phases.get(self.phase)
+        if counters is None:
+            counters = self.phases[self.phase] = IoCounters()
+        return counters
+
+    def add_seek(self) -> None:
+        self.seeks += 1
+        self._counters().seeks += 1
+
+    def add_read(self, position: int, size: int) -> None:
+        super().add_read(position, size)
+        self._counters().add_read(position, size)
+
+
+class StatsReader(PositionalReader):
+    """
+    Positional reads over another file, recording its I/O in `stats`.
+
+    Files reading at an offset, e.g. in memory, are read as they are, others
+    are seeked before each read. The wrapped file is owned by the caller.
+    """
+
+    def __init__(self, fh: BinaryIO, stats: IoStats) -> None:
+        super().__init__()
+        self.reader = positional_reader(fh)
+        self.stats = stats
+        self._position = self.reader.tell()
+        # data in memory is used as it is, reads of it are not recorded
+        self.buffer = self.reader.buffer
+        # a file object, sought before each of its reads
+        self._seeks = isinstance(self.reader, FileReader)
+
+    def pread(self, size: int, offset: int) -> bytes:
+        data = self.reader.pread(size, offset)
+        self._add_read(offset, len(data))
+        return data
+
+    def preadinto(self, buffer: memoryview, offset: int) -> int:
+        size = self.reader.preadinto(buffer, offset)
+        self._add_read(offset, size)
+        return size
+
+    def _add_read(self, offset: int, size: int) -> None:
+        if self._seeks:
+            self.stats.add_seek()
+        self.stats.add_read(offset, size)
+
+    def _file_size(self) -> int:
+        if self._seeks:
+            self.stats.add_seek()
+        return self.reader.seek(0, io.SEEK_END)
+
+    def start_header(self) -> None:
+        self.reader.start_header()
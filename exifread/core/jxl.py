@@ -10,7 +10,7 @@
 class JXLExifFinder(HEICExifFinder):
     """Find JPEG XL EXIF tags."""
 
-    def find_exif(self) -> Tuple[int, bytes]:
+    def find_exif(self) -> Tuple[int, bytes, int]:
         ftyp = self.expect_parse("ftyp")
         assert ftyp.major_brand == b"jxl "
         assert ftyp.minor_version == 0
@@ -20,4 +20,4 @@ def find_exif(self) -> Tuple[int, bytes]:
         self.file_handle.seek(offset - 8)
         assert self.get(8)[:6] == b"Exif\x00\x00"
         endian = self.file_handle.read(1)
-        return offset, endian
+        return offset, endian, exif.size - 4
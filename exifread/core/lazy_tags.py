@@ -0,0 +1,84 @@
+"""
+Tags dictionary decoding values on access.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class _Deferred:  # pylint: disable=too-few-public-methods
+    """IFD entry indexed but not decoded yet."""
+
+    __slots__ = ("entry",)
+
+    def __init__(self, entry: tuple) -> None:
+        self.entry = entry
+
+
+class LazyTags(MutableMapping):
+    """
+    Mapping of tag names to tags, whose values are only decoded from the
+    file when first read.
+
+    Keeps a reference to the header, and so to the file or buffer, until
+    closed. Closing does not close the file, which is owned by the caller.
+    """
+
+    def __init__(self, decode: Optional[Callable[[tuple], None]] = None) -> None:
+        self._tags: Dict[str, Any] = {}
+        # decodes an IFD entry and stores the resulting tag in this mapping
+        self._decode: Optional[Callable[[tuple], None]] = decode
+        # applied to tags when read, e.g. conversion to built-in types
+        self.convert: Optional[Callable[[str, Any], Any]] = None
+
+    def defer(self, key: str, entry: tuple) -> None:
+        """Index an IFD entry, to be decoded when `key` is first read."""
+        self._tags[key] = _Deferred(entry)
+
+    def decoded(self, key: str) -> bool:
+        """Return `True` if the tag value has already been decoded."""
+        return not isinstance(self._tags[key], _Deferred)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._tags[key]
+        if isinstance(value, _Deferred):
+            if self._decode is None:
+                raise ValueError("Cannot decode %s, tags are closed" % key)
+            self._decode(value.entry)
+            value = self._tags[key]
+        if self.convert is not None:
+            return self.convert(key, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._tags[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._tags[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tags
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tags)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __repr__(self) -> str:
+        decoded = sum(not isinstance(v, _Deferred) for v in self._tags.values())
+        return "<%s: %d tags, %d decoded>" % (
+            self.__class__.__name__,
+            len(self._tags),
+            decoded,
+        )
+
+    def close(self) -> None:
+        """Release the file, tags not decoded yet can no longer be read."""
+        self._decode = None
+
+    def __enter__(self) -> "LazyTags":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
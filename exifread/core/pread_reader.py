@@ -0,0 +1,47 @@
+"""
+File-like access to a file descriptor with positional reads.
+"""
+
+import os
+
+from exifread.core.base_reader import PositionalReader
+
+
+class PreadReader(PositionalReader):
+    """
+    Read-only file over a file descriptor, reading with `os.pread`.
+
+    The position is kept here rather than in the descriptor, so a read does
+    not need a `seek` first, and readers never share a seek position.
+    The descriptor is owned by the caller.
+    """
+
+    def __init__(self, fd: int) -> None:
+        super().__init__()
+        self.fd = fd
+
+    def pread(self, size: int, offset: int) -> bytes:
+        """Read `size` bytes at `offset`, without moving the position."""
+        chunks = []
+        while size > 0:
+            data = os.pread(self.fd, size, offset)
+            if not data:
+                break
+            chunks.append(data)
+            size -= len(data)
+            offset += len(data)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def preadinto(self, buffer: memoryview, offset: int) -> int:
+        if not hasattr(os, "preadv"):
+            return super().preadinto(buffer, offset)
+        done = 0
+        while done < len(buffer):
+            size = os.preadv(self.fd, [buffer[done:]], offset + done)
+            if not size:
+                break
+            done += size
+        return done
+
+    def _file_size(self) -> int:
+        return os.fstat(self.fd).st_size
@@ -0,0 +1,147 @@
+"""
+File-like access to a remote file with HTTP range requests.
+"""
+
+import http.client
+import re
+import urllib.parse
+from typing import Dict, Optional, cast
+
+from exifread.core.cached_reader import BLOCK_SIZE, MAX_BLOCKS, BlockReader
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:\d+-\d+|\*)/(\d+|\*)")
+
+
+class RangeReader(BlockReader):
+    """
+    Read-only, seekable file over a URL, read with HTTP `Range` requests.
+
+    Data is fetched in blocks, kept in a least recently used cache, and
+    consecutive missing blocks are fetched in a single request, see
+    `BlockReader`. The connection is kept open between requests.
+
+    :param url: the `http` or `https` URL of the file.
+    :param block_size: the size of the blocks fetched.
+    :param max_blocks: the number of blocks kept in the cache.
+    :param headers: extra headers sent with each request, e.g. authorization.
+    :param timeout: the timeout of the connection, in seconds.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        block_size: int = BLOCK_SIZE,
+        max_blocks: int = MAX_BLOCKS,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = 30.0,
+    ) -> None:
+        super().__init__(block_size, max_blocks)
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("Unsupported URL: %r" % url)
+        self.url = url
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        # scheme, host and port of the connection
+        self._parts = parts
+        self._target = urllib.parse.urlunsplit(
+            ("", "", parts.path or "/", parts.query, "")
+        )
+        self._connection: Optional[http.client.HTTPConnection] = None
+        # the whole file, if the server does not support range requests
+        self._data: Optional[bytes] = None
+        # number of HTTP requests made, and of bytes received
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._data = None
+        super().close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._connection is None:
+            # the host is checked when the reader is created
+            host = cast(str, self._parts.hostname)
+            if self._parts.scheme == "https":
+                self._connection = http.client.HTTPSConnection(
+                    host, self._parts.port, timeout=self.timeout
+                )
+            else:
+                self._connection = http.client.HTTPConnection(
+                    host, self._parts.port, timeout=self.timeout
+                )
+        return self._connection
+
+    def _send(self, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        connection = self._connect()
+        try:
+            connection.request("GET", self._target, headers=headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            connection.close()
+            self._connection = None
+            raise
+        self.requests += 1
+        return response
+
+    def _request(self, start: int, end: int) -> http.client.HTTPResponse:
+        headers = dict(self.headers)
+        headers["Range"] = "bytes=%d-%d" % (start, end - 1)
+        reused = self._connection is not None
+        try:
+            return self._send(headers)
+        except (http.client.HTTPException, ConnectionError):
+            # a kept-alive connection may have been closed by the server
+            if not reused:
+                raise
+            return self._send(headers)
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        response = self._request(start, end)
+        data = response.read()
+        self.bytes_fetched += len(data)
+        total = self._total_size(response.getheader("Content-Range"))
+        if response.status == 206:
+            if total is not None:
+                self.size = total
+            elif len(data) < end - start:
+                self.size = start + len(data)
+            return data
+        if response.status == 416:
+            self.size = total if total is not None else start
+            return b""
+        if response.status == 200:
+            # ranges not supported, the whole file was sent
+            self._data = data
+            self.size = len(data)
+            self._blocks.clear()
+            return data[start:end]
+        raise OSError(
+            "HTTP error %d %s for %s" % (response.status, response.reason, self.url)
+        )
+
+    @staticmethod
+    def _total_size(content_range: Optional[str]) -> Optional[int]:
+        match = _CONTENT_RANGE.match(content_range or "")
+        if match and match.group(1) != "*":
+            return int(match.group(1))
+        return None
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        if self._data is not None:
+            return self._data[start:end]
+        return super()._read_range(start, end)
+
+    def _file_size(self) -> int:
+        """Return the size of the file, fetching the first block if unknown."""
+        if self.size is None:
+            self._read_range(0, 1)
+        if self.size is None:
+            # no total size sent, read up to the end
+            offset = max(self._blocks, default=0) * self.block_size
+            while self.size is None:
+                offset += len(self._read_range(offset, offset + self.block_size))
+        return self.size
@@ -0,0 +1,132 @@
+"""
+File-like access to the parts of a file fetched so far.
+"""
+
+import bisect
+from typing import List, Optional, Tuple
+
+from exifread.core.base_reader import PositionalReader
+
+# Largest read filled with zeros while collecting the missing data
+FILL_LIMIT = 16 * 1024 * 1024
+
+
+class NeedBytes(Exception):
+    """
+    Raised when reading data that has not been fetched yet.
+
+    `length` is `None` when the data is needed up to the end of the file.
+    """
+
+    def __init__(self, offset: int, length: Optional[int]) -> None:
+        super().__init__(offset, length)
+        self.offset = offset
+        self.length = length
+
+
+class SparseReader(PositionalReader):
+    """
+    Seekable file over ranges of a file, fed by the caller.
+
+    Reading data outside the fed ranges raises `NeedBytes`: the caller
+    fetches it, feeds it, and runs the parser again from the start.
+    Once collecting, such reads are recorded in `missing` and the data is
+    filled with zeros instead, so that a single run finds all the data it
+    lacks. Reads larger than `FILL_LIMIT`, e.g. of corrupted lengths, come
+    back short.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # non overlapping ranges of data, sorted by start
+        self._starts: List[int] = []
+        self._ranges: List[bytes] = []
+        # size of the file, once its end has been read
+        self.size: Optional[int] = None
+        # ranges [start, end) read but not fed, if collecting
+        self.missing: Optional[List[Tuple[int, int]]] = None
+
+    def feed(self, offset: int, data: bytes, eof: bool = False) -> None:
+        """Add data read at `offset`, `eof` is set if the file ends after it."""
+        if eof:
+            self.size = offset + len(data)
+        if not data:
+            return
+        end = offset + len(data)
+        # merge with the ranges it overlaps or touches
+        first = bisect.bisect_left(self._starts, offset)
+        if first and self._starts[first - 1] + len(self._ranges[first - 1]) >= offset:
+            first -= 1
+        last = first
+        while last < len(self._starts) and self._starts[last] <= end:
+            last += 1
+        merged = bytearray(data)
+        start = offset
+        for index in range(first, last):
+            range_start = self._starts[index]
+            data_range = self._ranges[index]
+            if range_start < start:
+                merged[:0] = data_range[: start - range_start]
+                start = range_start
+            range_end = range_start + len(data_range)
+            if range_end > start + len(merged):
+                merged += data_range[start + len(merged) - range_start :]
+        self._starts[first:last] = [start]
+        self._ranges[first:last] = [bytes(merged)]
+
+    def collect_missing(self) -> None:
+        """Record reads of data not fed yet, rather than raising `NeedBytes`."""
+        if self.missing is None:
+            self.missing = []
+
+    def _available(self, offset: int) -> bytes:
+        """Return the fed data from `offset` up to the end of its range."""
+        index = bisect.bisect_right(self._starts, offset) - 1
+        if index >= 0:
+            start = self._starts[index]
+            data = self._ranges[index]
+            if offset < start + len(data):
+                return data[offset - start :]
+        return b""
+
+    def pread(self, size: int, offset: int) -> bytes:
+        if self.size is not None:
+            size = min(size, self.size - offset)
+        if size <= 0:
+            return b""
+        data = self._available(offset)
+        if len(data) < size:
+            if self.missing is None:
+                raise NeedBytes(offset, size)
+            self.missing.append((offset + len(data), offset + size))
+            if size <= FILL_LIMIT:
+                return data + bytes(size - len(data))
+        return data[:size]
+
+    def _file_size(self) -> int:
+        if self.size is None:
+            raise NeedBytes(self._position, None)
+        return self.size
+
+    def start_header(self) -> None:
+        # the layout is known, find all the data missing from this run at once
+        self.collect_missing()
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        offset = self._position
+        if self.size is not None and offset >= self.size:
+            return b""
+        data = self._available(offset)
+        if size is not None and size >= 0:
+            data = data[:size]
+        end = data.find(b"\n") + 1
+        if not end:
+            if size is not None and 0 <= size <= len(data):
+                end = size
+            elif self.size is not None and offset + len(data) >= self.size:
+                end = len(data)
+            else:
+                # the rest of the line is in the next range
+                raise NeedBytes(offset + len(data), None)
+        self._position += end
+        return data[:end]
@@ -0,0 +1,90 @@
+"""
+Select the tags and IFDs to process.
+"""
+
+from typing import FrozenSet, Iterable, Optional, Set
+
+THUMBNAIL_KEYS = ("JPEGThumbnail", "TIFFThumbnail")
+
+# Tags needed to reach, or decode, each sub-IFD
+_SUB_IFD_DEPENDENCIES = {
+    "EXIF": ("Image ExifOffset",),
+    "GPS": ("Image GPSInfo",),
+    "Interoperability": ("EXIF InteroperabilityOffset",),
+    "MakerNote": ("EXIF MakerNote", "Image Make", "Image Model"),
+}
+
+
+def key_ifd_name(key: str) -> str:
+    """Return the IFD name of a tag key, e.g. `"GPS"` for `"GPS GPSLatitude"`."""
+    if key.startswith(("EXIF SubIFD", "IFD ")):
+        return " ".join(key.split(" ", 2)[:2])
+    return key.split(" ", 1)[0]
+
+
+class TagFilter:
+    """
+    Tags and IFDs to process, any other tag is skipped.
+
+    A tag is returned if its key (`"IFD_NAME TAG_NAME"`) is in `tags`,
+    or if its IFD name is in `ifds`. Tags needed to reach the requested
+    ones (e.g. `"Image GPSInfo"` for the GPS IFD) are processed, but not
+    returned.
+    """
+
+    def __init__(
+        self,
+        tags: Optional[Iterable[str]] = None,
+        ifds: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.tags: FrozenSet[str] = frozenset(tags or ())
+        self.ifds: FrozenSet[str] = frozenset(ifds or ())
+        self.thumbnail = "Thumbnail" in self.ifds or any(
+            key in self.tags for key in THUMBNAIL_KEYS
+        )
+
+        # the thumbnail is extracted from the whole thumbnail IFD
+        self._whole_ifds = set(self.ifds)
+        if self.thumbnail:
+            self._whole_ifds.add("Thumbnail")
+
+        needed_tags = set(self.tags).difference(THUMBNAIL_KEYS)
+        needed_ifds = set(self._whole_ifds)
+        while True:
+            needed_ifds.update(key_ifd_name(key) for key in needed_tags)
+            dependencies = self._dependencies(needed_ifds) - needed_tags
+            if not dependencies:
+                break
+            needed_tags.update(dependencies)
+        # some MakerNote tags are decoded from other ones, e.g. Canon
+        if "MakerNote" in needed_ifds:
+            self._whole_ifds.add("MakerNote")
+        self._needed_tags: FrozenSet[str] = frozenset(needed_tags)
+        self._needed_ifds: FrozenSet[str] = frozenset(needed_ifds)
+
+    @staticmethod
+    def _dependencies(ifd_names: Set[str]) -> Set[str]:
+        dependencies: Set[str] = set()
+        for ifd_name in ifd_names:
+            if ifd_name.startswith("EXIF SubIFD"):
+                dependencies.add("Image SubIFDs")
+            else:
+                dependencies.update(_SUB_IFD_DEPENDENCIES.get(ifd_name, ()))
+        return dependencies
+
+    def needs_ifd(self, ifd_name: str) -> bool:
+        """Return `True` if the IFD has to be walked."""
+        return ifd_name in self._needed_ifds
+
+    def needs_tag(self, ifd_name: str, tag_name: str) -> bool:
+        """Return `True` if the tag has to be decoded."""
+        return (
+            ifd_name in self._whole_ifds
+            or ifd_name + " " + tag_name in self._needed_tags
+        )
+
+    def wants(self, key: str) -> bool:
+        """Return `True` if the tag has to be returned."""
+        if key in THUMBNAIL_KEYS:
+            return self.thumbnail
+        return key in self.tags or key_ifd_name(key) in self.ifds
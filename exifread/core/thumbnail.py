@@ -0,0 +1,70 @@
+"""
+Lazy access to thumbnail images.
+"""
+
+from typing import Callable, Optional, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class Thumbnail:
+    """
+    Thumbnail image, whose data is only read, or built, when accessed.
+
+    Use `bytes(thumbnail)` to get the image data, or `view()` for a
+    memoryview, which does not copy thumbnails held in the EXIF block.
+    """
+
+    __slots__ = ("offset", "_length", "_data", "_load")
+
+    def __init__(
+        self,
+        data: Optional[BytesLike] = None,
+        load: Optional[Callable[[], BytesLike]] = None,
+        offset: Optional[int] = None,
+        length: Optional[int] = None,
+    ) -> None:
+        # position of the image data in the file, if stored as a unit
+        self.offset = offset
+        self._length = length
+        self._data = None if data is None else memoryview(data)
+        # reads or builds the data on first access
+        self._load = load
+
+    def view(self) -> memoryview:
+        """Return the thumbnail data as a memoryview."""
+        if self._data is None:
+            if self._load is None:
+                raise ValueError("No thumbnail data")
+            self._data = memoryview(self._load())
+            self._load = None
+            self._length = len(self._data)
+        return self._data
+
+    @property
+    def loaded(self) -> bool:
+        """Return `True` if the data has already been read or built."""
+        return self._data is not None
+
+    def __bytes__(self) -> bytes:
+        return self.view().tobytes()
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = len(self.view())
+        return self._length
+
+    def __getitem__(self, key):
+        return self.view()[key]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Thumbnail):
+            other = other.view()
+        if not isinstance(other, (bytes, bytearray, memoryview)):
+            return NotImplemented
+        return self.view() == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return "<%s: %d bytes>" % (self.__class__.__name__, len(self))
@@ -0,0 +1,73 @@
+"""
+Time spent in each phase of processing files.
+"""
+
+import time
+from typing import Dict
+
+
+class Timings:
+    """
+    Time spent in each phase of processing, added up over the files processed.
+
+    Phases are `"detect"`, `"ifds"`, `"sub_ifds"`, `"makernote VENDOR"`,
+    `"thumbnail"`, `"xmp"` and `"convert"`, only recorded if they ran.
+    Timings of several files, or batches, can be added up with `merge`.
+    """
+
+    __slots__ = ("files", "seconds", "calls", "_clock")
+
+    def __init__(self) -> None:
+        self.files = 0
+        # time spent in each phase, in seconds, and number of times it ran
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._clock = 0.0
+
+    def start(self) -> None:
+        """Start timing a file."""
+        self.files += 1
+        self._clock = time.perf_counter()
+
+    def record(self, phase: str) -> None:
+        """Add the time since the previous phase, or the start, to `phase`."""
+        now = time.perf_counter()
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + now - self._clock
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self._clock = now
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    def merge(self, other: "Timings") -> "Timings":
+        """Add the timings of `other` to these ones."""
+        self.files += other.files
+        for phase, seconds in other.seconds.items():
+            self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+            self.calls[phase] = self.calls.get(phase, 0) + other.calls[phase]
+        return self
+
+    def __iadd__(self, other: "Timings") -> "Timings":
+        return self.merge(other)
+
+    def __repr__(self) -> str:
+        return "<%s files=%d %s>" % (
+            self.__class__.__name__,
+            self.files,
+            " ".join(
+                "%s=%.6f" % (phase, seconds) for phase, seconds in self.seconds.items()
+            ),
+        )
+
+
+class NullTimings(Timings):
+    """Timings of a file not timed, recording nothing."""
+
+    __slots__ = ()
+
+    def start(self) -> None:
+        pass
+
+    def record(self, phase: str) -> None:
+        pass
@@ -1,17 +1,18 @@
 """XMP related utilities.."""
 
-from pyexpat import ExpatError
 from typing import BinaryIO
-from xml.dom.minidom import parseString
 
+from exifread.core.buffer_reader import BufferReader
 from exifread.exif_log import get_logger
 
 logger = get_logger()
 
 
 def find_xmp_data(fh: BinaryIO) -> bytes:
-    xmp_bytes = b""
     logger.debug("XMP not in Exif, searching file for XMP info...")
+    if isinstance(fh, BufferReader):
+        return _find_xmp_in_buffer(fh)
+    xmp_bytes = b""
     xml_started = False
     xml_finished = False
     for line in fh:
@@ -36,8 +37,29 @@ def find_xmp_data(fh: BinaryIO) -> bytes:
     return xmp_bytes
 
 
+def _find_xmp_in_buffer(reader: BufferReader) -> bytes:
+    """Search the whole buffer at once, rather than line by line."""
+    open_tag = reader.find(b"<x:xmpmeta", reader.tell())
+    if open_tag == -1:
+        return b""
+    logger.debug("XMP found opening tag at position %s", open_tag)
+    close_tag = reader.find(b"</x:xmpmeta>", open_tag)
+    if close_tag == -1:
+        end = len(reader.buffer)
+    else:
+        logger.debug("XMP found closing tag at position %s", close_tag)
+        end = close_tag + 12
+    xmp_bytes = reader.buffer[open_tag:end].tobytes()
+    logger.debug("Found %s XMP bytes", len(xmp_bytes))
+    return xmp_bytes
+
+
 def xmp_bytes_to_str(xmp_bytes: bytes) -> str:
     """Adobe's Extensible Metadata Platform, just dump the pretty XML."""
+    # imported on first use, XMP is only parsed in debug mode
+    # pylint: disable=import-outside-toplevel
+    from pyexpat import ExpatError
+    from xml.dom.minidom import parseString
 
     logger.debug("Cleaning XMP data ...")
 
@@ -0,0 +1,38 @@
+"""
+File-like readers, to process images from other sources than local files.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from exifread.core.buffer_reader import BufferReader
+from exifread.core.cached_reader import BlockReader, CachedReader
+from exifread.core.io_stats import IoCounters, IoStats, StatsReader
+from exifread.core.pread_reader import PreadReader
+from exifread.core.sparse_reader import NeedBytes, SparseReader
+
+if TYPE_CHECKING:
+    from exifread.core.range_reader import RangeReader
+
+__all__ = [
+    "BlockReader",
+    "BufferReader",
+    "CachedReader",
+    "IoCounters",
+    "IoStats",
+    "NeedBytes",
+    "PreadReader",
+    "RangeReader",
+    "SparseReader",
+    "StatsReader",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name != "RangeReader":
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    # imported on first use, it loads http.client
+    # pylint: disable=import-outside-toplevel
+    from exifread.core.range_reader import RangeReader
+
+    globals()[name] = RangeReader
+    return RangeReader
@@ -0,0 +1,137 @@
+"""
+Run `process_file` again until the byte ranges fed by the caller are enough.
+
+This is a retry loop around `process_file`, not a resumable parser: each
+call to `needed()` runs `process_file` from the start of the file, on the
+data fed so far, and returns the ranges the run lacked. The caller reads
+them in any way (file, async reader, HTTP range requests...) and feeds
+them back::
+
+    parser = RetryParser(details=False)
+    ranges = parser.needed()
+    while ranges:
+        for start, end in ranges:
+            parser.feed(start, read(start, end), eof=...)
+        ranges = parser.needed()
+    tags = parser.tags
+
+A run stops at the first data missing before the layout of the EXIF data
+is known, e.g. while looking for the EXIF block, so files take a few runs.
+From then on, the data not fed yet reads as zeros and all the ranges
+missing from the run are asked for at once, so they can be fetched in
+parallel. Messages logged by a run short of data are output as well, so
+they may be repeated by the next runs.
+"""
+
+from typing import Any, BinaryIO, List, MutableMapping, Optional, Tuple, cast
+
+import exifread
+from exifread.core.sparse_reader import NeedBytes, SparseReader
+
+# Ranges are asked for in blocks of this size
+BLOCK_SIZE = 64 * 1024
+
+# Limit for data asked for up to the end of the file, e.g. looking for XMP
+MAX_BLOCK_SIZE = 16 * 1024 * 1024
+
+Range = Tuple[int, int]
+
+
+class RetryParser:
+    """
+    Run `process_file` on the byte ranges fed by the caller, until none is missing.
+
+    :param block_size: ranges asked for are aligned on, and rounded up to,
+        this size.
+    :param kwargs: the options of `process_file`, except `lazy`, `stats` and `timings`.
+    """
+
+    def __init__(self, block_size: int = BLOCK_SIZE, **kwargs: Any) -> None:
+        if kwargs.pop("lazy", False):
+            raise ValueError("Lazy decoding is not supported without a file")
+        if kwargs.get("stats") is not None or kwargs.get("timings") is not None:
+            raise ValueError("I/O stats and timings are not supported without a file")
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        # ranges are already asked for in blocks
+        kwargs.pop("cached", None)
+        kwargs["auto_seek"] = True
+        self.block_size = block_size
+        self.options = kwargs
+        self.reader = SparseReader()
+        # the result, once the parsers have all the data they need
+        self.tags: Optional[MutableMapping[str, Any]] = None
+        # number of runs of the parsers
+        self.runs = 0
+        # size asked for data needed up to the end of the file
+        self._open_ended = block_size
+        self._fed = False
+
+    @property
+    def done(self) -> bool:
+        """Return `True` once the tags are parsed."""
+        return self.tags is not None
+
+    def feed(self, offset: int, data: bytes, eof: bool = False) -> None:
+        """
+        Add the data read at `offset`.
+
+        :param eof: `True` if the file ends after the data, e.g. if fewer
+            bytes than asked for could be read.
+        """
+        self.reader.feed(offset, data, eof)
+        self._fed = True
+
+    def needed(self) -> List[Range]:
+        """
+        Run the parsers from the start, on the data fed so far.
+
+        :returns: the `[start, end)` ranges to feed before calling again,
+            or an empty list once `tags` is set.
+        """
+        if self.tags is not None:
+            return []
+        if not self._fed:
+            return [(0, self.block_size)]
+
+        self.reader.missing = None
+        self.runs += 1
+        try:
+            tags = self._run()
+        except NeedBytes as need:
+            missing = self.reader.missing or []
+            missing.append(self._need_range(need))
+        else:
+            missing = self.reader.missing or []
+            if not missing:
+                self.tags = tags
+        return self._coalesce(missing)
+
+    def _run(self) -> MutableMapping[str, Any]:
+        return exifread.process_file(cast(BinaryIO, self.reader), **self.options)
+
+    def _need_range(self, need: NeedBytes) -> Range:
+        if need.length is not None:
+            return need.offset, need.offset + need.length
+        # e.g. a search through the file, asked for in growing blocks
+        size = self._open_ended
+        self._open_ended = min(size * 2, MAX_BLOCK_SIZE)
+        return need.offset, need.offset + size
+
+    def _coalesce(self, ranges: List[Range]) -> List[Range]:
+        """Align ranges on blocks and merge the ones which overlap."""
+        aligned = []
+        for start, end in ranges:
+            start -= start % self.block_size
+            end += -end % self.block_size
+            if self.reader.size is not None:
+                end = min(end, self.reader.size)
+            if start < end:
+                aligned.append((start, end))
+        merged: List[Range] = []
+        for start, end in sorted(aligned):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+            else:
+                merged.append((start, end))
+        return merged
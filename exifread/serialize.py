@@ -2,9 +2,11 @@
 Enable conversion of Exif IfdTags to native Python types
 """
 
-from typing import Callable, Dict, List, Union
+from array import array
+from typing import Callable, Dict, List, Mapping, Union
 
 from exifread.core.exif_header import IfdTag
+from exifread.core.thumbnail import Thumbnail
 from exifread.exif_log import get_logger
 from exifread.tags.fields import FieldType
 
@@ -15,7 +17,7 @@
 
 
 def convert_types(
-    exif_tags: Dict[str, Union[IfdTag, bytes]],
+    exif_tags: Mapping[str, Union[IfdTag, Thumbnail]],
 ) -> SerializedTagDict:
     """
     Convert Exif IfdTags to built-in Python types for easier serialization and programmatic use.
@@ -28,40 +30,45 @@ def convert_types(
     output: SerializedTagDict = {}
 
     for tag_name, ifd_tag in exif_tags.items():
-        # JPEGThumbnail and TIFFThumbnail are the only values
-        # in Exif Tags dict that do not have the IfdTag type.
-        if isinstance(ifd_tag, bytes):
-            output[tag_name] = ifd_tag
-            continue
-
-        convert_func: Callable[[IfdTag, str], SerializedTagValue]
-
-        if ifd_tag.prefer_printable:
-            # Prioritize the printable value if prefer_printable is set
-            convert_func = convert_proprietary
-
-        else:
-            # Get the conversion function based on field type
-            try:
-                convert_func = conversion_map[ifd_tag.field_type]
-            except KeyError:
-                logger.error(
-                    "Type conversion for field type %s not explicitly supported",
-                    ifd_tag.field_type,
-                )
-                convert_func = convert_proprietary  # Fallback to printable
-
-        output[tag_name] = convert_func(ifd_tag, tag_name)
+        output[tag_name] = convert_tag(tag_name, ifd_tag)
 
         # Useful only for testing
         # logger.warning(
-        #     f"{convert_func.__name__}: {ifd_tag.field_type} to {type(output[tag_name]).__name__}\n"
+        #     f"{ifd_tag.field_type} to {type(output[tag_name]).__name__}\n"
         #     f"{tag_name} --> {str(output[tag_name])[:30]!r}"
         # )
 
     return output
 
 
+def convert_tag(tag_name: str, ifd_tag: Union[IfdTag, Thumbnail]) -> SerializedTagValue:
+    """Convert a single Exif IfdTag to a built-in Python type."""
+
+    # JPEGThumbnail and TIFFThumbnail are the only values
+    # in Exif Tags dict that do not have the IfdTag type.
+    if isinstance(ifd_tag, Thumbnail):
+        return bytes(ifd_tag)
+
+    convert_func: Callable[[IfdTag, str], SerializedTagValue]
+
+    if ifd_tag.prefer_printable:
+        # Prioritize the printable value if prefer_printable is set
+        convert_func = convert_proprietary
+
+    else:
+        # Get the conversion function based on field type
+        try:
+            convert_func = conversion_map[ifd_tag.field_type]
+        except KeyError:
+            logger.error(
+                "Type conversion for field type %s not explicitly supported",
+                ifd_tag.field_type,
+            )
+            convert_func = convert_proprietary  # Fallback to printable
+
+    return convert_func(ifd_tag, tag_name)
+
+
 def convert_ascii(ifd_tag: IfdTag, tag_name: str) -> Union[str, bytes, None]:
     """
     Handle ASCII conversion, including special date formats.
@@ -148,6 +155,10 @@ def convert_numeric(ifd_tag: IfdTag, _tag_name: str) -> Union[int, List[int], No
     if not out:  # Empty lists, seen in floating point numbers
         return None
 
+    # Large fields are stored as typed arrays
+    if isinstance(out, array):
+        out = out.tolist()
+
     return out[0] if len(out) == 1 else out
 
 
@@ -166,19 +177,19 @@ def convert_ratio(
     Ratios can be re-created with `Ratio(float_value).limit_denominator()`.
     """
 
-    out = []
+    out: List[Union[int, float]] = []
 
     for ratio in ifd_tag.values:
-        # Prevent division by 0. Sometimes, EXIF data is full of 0s when a feature is unused.
-        if ratio.denominator == 0:
-            ratio = ratio.numerator
-
-        ratio = float(ratio)
+        try:
+            value = ratio.decimal()
+        except ZeroDivisionError:
+            # Sometimes, EXIF data is full of 0s when a feature is unused.
+            value = float(ratio.numerator)
 
-        if ratio.is_integer():
-            ratio = int(ratio)
+        if value.is_integer():
+            value = int(value)
 
-        out.append(ratio)
+        out.append(value)
 
     if not out:
         return None
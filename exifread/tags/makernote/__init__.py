@@ -1,3 +1,10 @@
 """
 Makernote tag definitions.
+
+Each vendor module is only imported when a MakerNote of that vendor is decoded.
 """
+
+# Canon CameraInfo tag, decoded from the MakerNote once the model is known.
+# Its values are always read in full, this name is needed before the Canon
+# tables are loaded.
+CANON_CAMERA_INFO_TAG_NAME = "MakerNote Tag 0x000D"
@@ -7,6 +7,7 @@
 from typing import Callable, Dict, Tuple
 
 from exifread.tags import SubIfdTagDict
+from exifread.tags.makernote import CANON_CAMERA_INFO_TAG_NAME
 
 
 def add_one(value):
@@ -1018,7 +1019,7 @@ def convert_temp(value):
 # byte offset: (item name, data item type, decoding map).
 # Note that the data item type is fed directly to struct.unpack at the
 # specified offset.
-CAMERA_INFO_TAG_NAME = "MakerNote Tag 0x000D"
+CAMERA_INFO_TAG_NAME = CANON_CAMERA_INFO_TAG_NAME
 
 CanonCameraInfo = Tuple[str, str, Callable]
 CanonCameraInfoMap = Dict[int, CanonCameraInfo]
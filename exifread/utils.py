@@ -2,8 +2,14 @@
 Misc utilities.
 """
 
-from fractions import Fraction
-from typing import Optional, Tuple
+import math
+import numbers
+import operator
+from math import gcd
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from fractions import Fraction
 
 
 def _degrees_to_decimal(degrees: float, minutes: float, seconds: float) -> float:
@@ -49,27 +55,75 @@ def get_gps_coords(tags: dict) -> Optional[Tuple[float, float]]:
     return lat, lng
 
 
-class Ratio(Fraction):
+def _fraction(numerator: Any, denominator: Optional[int] = None) -> "Fraction":
+    # imported on first use, fractions loads the decimal module
+    from fractions import Fraction  # pylint: disable=import-outside-toplevel
+
+    return Fraction(numerator, denominator)
+
+
+def _as_operand(value: Any) -> Any:
+    if isinstance(value, Ratio):
+        return value.as_fraction()
+    return value
+
+
+def _fraction_operators(function: Callable) -> Tuple[Callable, Callable]:
+    """Forward and reverse operators, working on fractions."""
+
+    def forward(self: "Ratio", other: Any) -> Any:
+        return function(self.as_fraction(), _as_operand(other))
+
+    def reverse(self: "Ratio", other: Any) -> Any:
+        return function(_as_operand(other), self.as_fraction())
+
+    return forward, reverse
+
+
+class Ratio:
     """
     Ratio object that eventually will be able to reduce itself to lowest
     common denominator for printing.
+
+    Only the numerator and denominator read from the file are stored,
+    reducing happens on demand. A zero denominator is allowed, as unused
+    Exif fields are often full of 0s.
+    Comparisons and arithmetic are done with `fractions.Fraction`.
     """
 
-    _numerator: Optional[int]
-    _denominator: Optional[int]
-
-    # We're immutable, so use __new__ not __init__
-    def __new__(cls, numerator: int = 0, denominator: Optional[int] = None):
-        try:
-            self = super(Ratio, cls).__new__(cls, numerator, denominator)
-        except ZeroDivisionError:
-            self = super(Ratio, cls).__new__(cls)
-            self._numerator = numerator
-            self._denominator = denominator
-        return self
+    __slots__ = ("_numerator", "_denominator")
+
+    _numerator: int
+    _denominator: int
+
+    def __init__(self, numerator: Any = 0, denominator: Optional[int] = None) -> None:
+        if denominator is None:
+            if isinstance(numerator, int):
+                denominator = 1
+            else:
+                # float, str, Fraction ...
+                fraction = _fraction(numerator)
+                numerator = fraction.numerator
+                denominator = fraction.denominator
+        self._numerator = numerator
+        self._denominator = denominator
+
+    def _reduce(self) -> Tuple[int, int]:
+        numerator, denominator = self._numerator, self._denominator
+        if denominator == 0:
+            return numerator, denominator
+        divisor = gcd(numerator, denominator)
+        if denominator < 0:
+            divisor = -divisor
+        return numerator // divisor, denominator // divisor
 
-    def __repr__(self) -> str:
-        return str(self)
+    @property
+    def numerator(self) -> int:
+        return self._reduce()[0]
+
+    @property
+    def denominator(self) -> int:
+        return self._reduce()[1]
 
     @property
     def num(self) -> int:
@@ -81,3 +135,95 @@ def den(self) -> int:
 
     def decimal(self) -> float:
         return float(self)
+
+    def as_fraction(self) -> "Fraction":
+        """Return the ratio as a `fractions.Fraction`."""
+        return _fraction(self._numerator, self._denominator)
+
+    def limit_denominator(self, max_denominator: int = 1000000) -> "Fraction":
+        return self.as_fraction().limit_denominator(max_denominator)
+
+    @property
+    def real(self) -> "Ratio":
+        return self
+
+    @property
+    def imag(self) -> int:
+        return 0
+
+    def conjugate(self) -> "Ratio":
+        return self
+
+    def __float__(self) -> float:
+        return self._numerator / self._denominator
+
+    def __int__(self) -> int:
+        return int(self.as_fraction())
+
+    def __complex__(self) -> complex:
+        return complex(float(self))
+
+    def __trunc__(self) -> int:
+        return math.trunc(self.as_fraction())
+
+    def __floor__(self) -> int:
+        return math.floor(self.as_fraction())
+
+    def __ceil__(self) -> int:
+        return math.ceil(self.as_fraction())
+
+    def __round__(self, ndigits: Optional[int] = None) -> Any:
+        return round(self.as_fraction(), ndigits)
+
+    def __bool__(self) -> bool:
+        return self._numerator != 0
+
+    def __str__(self) -> str:
+        numerator, denominator = self._reduce()
+        if denominator == 1:
+            return str(numerator)
+        return "%s/%s" % (numerator, denominator)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __reduce__(self):
+        return self.__class__, (self._numerator, self._denominator)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Ratio):
+            return self._reduce() == other._reduce()
+        if self._denominator == 0:
+            return NotImplemented
+        return self.as_fraction() == other
+
+    def __hash__(self) -> int:
+        if self._denominator == 0:
+            return hash((self._numerator, 0))
+        return hash(self.as_fraction())
+
+    def __neg__(self) -> "Fraction":
+        return -self.as_fraction()
+
+    def __pos__(self) -> "Fraction":
+        return self.as_fraction()
+
+    def __abs__(self) -> "Fraction":
+        return abs(self.as_fraction())
+
+    __add__, __radd__ = _fraction_operators(operator.add)
+    __sub__, __rsub__ = _fraction_operators(operator.sub)
+    __mul__, __rmul__ = _fraction_operators(operator.mul)
+    __truediv__, __rtruediv__ = _fraction_operators(operator.truediv)
+    __floordiv__, __rfloordiv__ = _fraction_operators(operator.floordiv)
+    __mod__, __rmod__ = _fraction_operators(operator.mod)
+    __divmod__, __rdivmod__ = _fraction_operators(divmod)
+    __pow__, __rpow__ = _fraction_operators(operator.pow)
+    __lt__ = _fraction_operators(operator.lt)[0]
+    __le__ = _fraction_operators(operator.le)[0]
+    __gt__ = _fraction_operators(operator.gt)[0]
+    __ge__ = _fraction_operators(operator.ge)[0]
+
+
+# Interoperability with `fractions.Fraction` and the numeric tower
+numbers.Rational.register(Ratio)
@@ -0,0 +1,131 @@
+"""Test processing files from asyncio code."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.core.sparse_reader import NeedBytes, SparseReader
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+FILES = (
+    "jpg/Canon_40D.jpg",
+    "jpg/tests/35-empty.jpg",
+    "tiff/Arbitro.tiff",
+    "heic/mobile/iphone_13_pro_max.heic",
+)
+
+
+class AsyncReader:
+    """Async reader counting its reads."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.position = 0
+        self.reads = 0
+
+    async def seek(self, offset: int) -> int:
+        self.position = offset
+        return offset
+
+    async def read(self, size: int) -> bytes:
+        await asyncio.sleep(0)
+        self.reads += 1
+        data = self.data[self.position : self.position + size]
+        self.position += len(data)
+        return data
+
+
+class AsyncPreadReader:  # pylint: disable=too-few-public-methods
+    """Async reader with positional reads, recording how many run at once."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.running = 0
+        self.max_running = 0
+
+    async def pread(self, size: int, offset: int) -> bytes:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        return self.data[offset : offset + size]
+
+
+def _printable(tags) -> dict:
+    return {key: str(value) for key, value in tags.items()}
+
+
+@pytest.mark.parametrize("file_path", FILES)
+def test_process_file_async(file_path):
+    with open(RESOURCES_ROOT / file_path, "rb") as fh:
+        expected = _printable(exifread.process_file(fh, debug=True))
+    reader = AsyncReader((RESOURCES_ROOT / file_path).read_bytes())
+    tags = asyncio.run(exifread.process_file_async(reader, debug=True))
+    assert _printable(tags) == expected
+    tags = asyncio.run(exifread.process_file_async(RESOURCES_ROOT / file_path))
+    assert _printable(tags) == _printable(
+        exifread.process_path(RESOURCES_ROOT / file_path)
+    )
+
+
+def test_process_file_async_pread():
+    """The ranges asked for by a run are read at once."""
+    data = (RESOURCES_ROOT / "jpg/Sony_DSLR-A200.jpg").read_bytes()
+    reader = AsyncPreadReader(data)
+    tags = asyncio.run(exifread.process_file_async(reader, block_size=1024))
+    assert _printable(tags) == _printable(exifread.process_bytes(data))
+    assert reader.max_running > 1
+
+
+def test_process_file_async_logs(caplog):
+    """Passes short of data log no other warnings than the last one."""
+    caplog.set_level(logging.WARNING)
+    file_path = RESOURCES_ROOT / "jpg/tests/35-empty.jpg"
+    with open(file_path, "rb") as fh:
+        exifread.process_file(fh)
+    expected = set(caplog.messages)
+    caplog.clear()
+    reader = AsyncReader(file_path.read_bytes())
+    asyncio.run(exifread.process_file_async(reader))
+    assert reader.reads > 1
+    assert set(caplog.messages) == expected
+
+
+@pytest.mark.parametrize("concurrency", (1, 3))
+def test_aprocess_files(tmp_path, concurrency):
+    paths = [RESOURCES_ROOT / file_path for file_path in FILES]
+    paths.append(tmp_path / "missing.jpg")
+
+    async def collect():
+        return {
+            path: tags
+            async for path, tags in exifread.aprocess_files(
+                paths, concurrency=concurrency, details=False
+            )
+        }
+
+    results = asyncio.run(collect())
+    assert set(results) == set(paths)
+    assert isinstance(results.pop(tmp_path / "missing.jpg"), FileNotFoundError)
+    for path, tags in results.items():
+        assert _printable(tags) == _printable(
+            exifread.process_path(path, details=False)
+        )
+
+
+def test_sparse_reader():
+    reader = SparseReader()
+    reader.feed(10, b"klmno")
+    reader.feed(0, b"abcdefghij")
+    reader.feed(20, b"uvw", eof=True)
+    assert reader.read(15) == b"abcdefghijklmno"
+    with pytest.raises(NeedBytes) as err:
+        reader.read(2)
+    assert (err.value.offset, err.value.length) == (15, 2)
+    reader.feed(14, b"opqrst")
+    assert reader.read(10) == b"pqrstuvw"
+    assert reader.read(1) == b""
@@ -0,0 +1,93 @@
+"""Test processing files in parallel."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.core.pread_reader import PreadReader
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+FILES = (
+    "jpg/Canon_40D.jpg",
+    "jpg/Nikon_D70.jpg",
+    "jpg/exif-org/olympus-d320l.jpg",
+    "tiff/Arbitro.tiff",
+    "heic/mobile/iphone_13_pro_max.heic",
+)
+
+
+@pytest.mark.parametrize("executor", ("process", "thread"))
+@pytest.mark.parametrize("ordered", (True, False))
+@pytest.mark.parametrize("chunksize", (1, 2, 16))
+def test_process_files(executor, ordered, chunksize):
+    paths = [RESOURCES_ROOT / file_path for file_path in FILES]
+    results = list(
+        exifread.process_files(
+            paths,
+            workers=2,
+            chunksize=chunksize,
+            ordered=ordered,
+            executor=executor,
+            details=False,
+        )
+    )
+    if ordered:
+        assert [path for path, _ in results] == paths
+    assert sorted(path for path, _ in results) == sorted(paths)
+    for path, tags in results:
+        with open(path, "rb") as fh:
+            assert tags == exifread.process_file(fh, details=False, builtin_types=True)
+
+
+@pytest.mark.parametrize("executor", ("process", "thread"))
+def test_process_files_error(tmp_path, executor):
+    missing = tmp_path / "missing.jpg"
+    results = dict(exifread.process_files([missing], workers=1, executor=executor))
+    assert isinstance(results[missing], FileNotFoundError)
+
+
+@pytest.mark.parametrize("executor", ("process", "thread"))
+def test_process_files_timings(executor):
+    """The timings of the workers are added up."""
+    paths = [RESOURCES_ROOT / file_path for file_path in FILES]
+    timings = exifread.Timings()
+    results = list(
+        exifread.process_files(
+            paths, workers=2, chunksize=2, executor=executor, timings=timings
+        )
+    )
+    assert len(results) == len(paths)
+    assert timings.files == len(paths)
+    assert timings.calls["detect"] == len(paths)
+    assert timings.calls["convert"] == len(paths) - 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    (
+        {"lazy": True},
+        {"executor": "fiber"},
+        {"chunksize": 0},
+        {"workers": 0},
+    ),
+)
+def test_process_files_options(options):
+    """Options are checked when called, before any result is asked for."""
+    with pytest.raises(ValueError):
+        exifread.process_files([], **options)
+
+
+@pytest.mark.skipif(not hasattr(os, "pread"), reason="requires os.pread")
+@pytest.mark.parametrize("file_path", FILES)
+def test_pread_reader(file_path):
+    """Positional reads give the same tags as a file object."""
+    with open(RESOURCES_ROOT / file_path, "rb") as fh:
+        expected = exifread.process_file(fh, debug=True)
+        reader = PreadReader(fh.fileno())
+        tags = exifread.process_file(reader, debug=True)  # type: ignore
+    assert {key: str(value) for key, value in tags.items()} == {
+        key: str(value) for key, value in expected.items()
+    }
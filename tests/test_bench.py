@@ -0,0 +1,75 @@
+"""Test the benchmark suite."""
+
+import importlib.util
+import io
+import json
+import sys
+from pathlib import Path
+
+import exifread
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+BENCHMARKS_ROOT = Path(__file__).parent.parent / "benchmarks"
+
+
+def _load_script(name: str):
+    """Import a script of the benchmarks folder, which is not part of the package."""
+    spec = importlib.util.spec_from_file_location(
+        name, BENCHMARKS_ROOT / (name + ".py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    # the suite imports the synthetic file generator next to it
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_load_script("synthetic")
+bench = _load_script("suite")
+
+
+def test_compare(capsys):
+    baseline = {"format jpg": 1.0, "micro s2n": 1.0}
+    results = {"format jpg": 1.2, "micro s2n": 0.8, "micro convert_types": 1.0}
+    assert bench.compare(results, baseline, 0.1) == ["format jpg"]
+    assert bench.compare(results, baseline, 0.25) == []
+    output = capsys.readouterr().out
+    assert "worse" in output
+    assert "better" in output
+    assert "new" in output
+
+
+def test_main(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["--resources", str(RESOURCES_ROOT), "-k", "micro s2n", "--repeat", "1"]
+    assert bench.main(args + ["--save", str(baseline)]) == 0
+    saved = json.loads(baseline.read_text())
+    assert list(saved["results"]) == ["micro s2n"]
+    # a baseline much faster than possible is always a regression
+    saved["results"]["micro s2n"] = 1e-12
+    baseline.write_text(json.dumps(saved))
+    assert bench.main(args + ["--compare", str(baseline)]) == 1
+    assert "Regressions: micro s2n" in capsys.readouterr().out
+
+
+def test_result_size():
+    data = (RESOURCES_ROOT / "jpg/Canon_40D.jpg").read_bytes()
+    tags = exifread.process_file(io.BytesIO(data), details=True)
+    thumbnail = len(tags["JPEGThumbnail"])
+    size = bench.result_size(tags)
+    # the copy of the thumbnail data is counted
+    assert size > thumbnail
+    del tags["JPEGThumbnail"]
+    assert bench.result_size(tags) < size - thumbnail
+
+
+def test_memory_results():
+    groups = {"format jpg": [RESOURCES_ROOT / "jpg/Canon_40D.jpg"]}
+    results = bench.memory_results(groups)
+    assert list(results) == [
+        "memory peak format jpg",
+        "memory retained format jpg",
+        "memory result format jpg",
+    ]
+    assert results["memory peak format jpg"] >= results["memory retained format jpg"]
+    assert results["memory retained format jpg"] > 0
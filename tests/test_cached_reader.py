@@ -0,0 +1,71 @@
+"""Test reading files through a block cache."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.io import CachedReader
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+
+class CountingFile(io.BytesIO):
+    """In-memory file counting its reads."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+def _printable(tags) -> dict:
+    return {key: str(value) for key, value in tags.items()}
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        "jpg/Canon_40D.jpg",
+        "tiff/Arbitro.tiff",
+        "heic/mobile/iphone_13_pro_max.heic",
+        "raw/sony_alpha_a7iii_raw_image.ARW",
+    ),
+)
+def test_process_file_cached(file_path):
+    data = (RESOURCES_ROOT / file_path).read_bytes()
+    uncached = CountingFile(data)
+    expected = _printable(exifread.process_file(uncached, debug=True))
+    fh = CountingFile(data)
+    tags = exifread.process_file(fh, debug=True, cached=True)
+    assert _printable(tags) == expected
+    assert fh.reads <= uncached.reads
+
+
+def test_cached_reader():
+    data = bytes(range(256)) * 4
+    fh = CountingFile(data)
+    fh.seek(10)
+    reader = CachedReader(fh, block_size=100, max_blocks=3)
+    assert reader.tell() == 10
+    assert reader.read(150) == data[10:160]
+    assert (fh.reads, reader.hits, reader.misses) == (1, 0, 2)
+    reader.seek(120)
+    assert reader.read(10) == data[120:130]
+    assert (fh.reads, reader.hits, reader.misses) == (1, 1, 2)
+    # the missing blocks are read at once, the oldest is evicted
+    reader.seek(250)
+    assert reader.read(200) == data[250:450]
+    assert (fh.reads, reader.hits, reader.misses) == (2, 1, 5)
+    reader.seek(0)
+    assert reader.read(10) == data[:10]
+    assert (fh.reads, reader.misses) == (3, 6)
+    assert reader.seek(-5, io.SEEK_END) == len(data) - 5
+    assert reader.read() == data[-5:]
+    assert reader.read(10) == b""
+    reader.seek(0)
+    assert reader.readline(300) == data[: data.index(b"\n") + 1]
@@ -0,0 +1,252 @@
+"""Test the EXIF header parsing."""
+
+import io
+import os
+import struct
+from array import array
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.core import exif_header
+from exifread.core.exif_header import MAX_VALUES, ExifHeader
+from exifread.core.find_exif import determine_type, find_exif_block
+from exifread.core.pread_reader import PreadReader
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+
+def _printable_tags(file_path: Path) -> dict:
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh=fh, details=True)
+    return {key: str(value) for key, value in tags.items()}
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        "jpg/Canon_40D.jpg",
+        "jpg/Nikon_D70.jpg",
+        "tiff/Arbitro.tiff",
+        "heic/mobile/iphone_13_pro_max.heic",
+    ),
+)
+def test_read_outside_block(monkeypatch, file_path):
+    """Offsets outside of the in-memory EXIF block are read from the file."""
+    expected = _printable_tags(RESOURCES_ROOT / file_path)
+    monkeypatch.setattr(exif_header, "PRELOAD_LIMIT", 16)
+    assert _printable_tags(RESOURCES_ROOT / file_path) == expected
+
+
+class _ReadLog(io.BytesIO):
+    """In-memory file logging the position and size of its reads."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append((self.tell(), size))
+        return super().read(size)
+
+
+@pytest.mark.parametrize(
+    "file_path", ("jpg/Canon_40D.jpg", "tiff/BSG1.tiff", "jpg/Sony_alpha_a58.JPG")
+)
+def test_read_plan(monkeypatch, file_path):
+    """Values outside of the block are read per IFD, in merged ranges."""
+    data = (RESOURCES_ROOT / file_path).read_bytes()
+    monkeypatch.setattr(exif_header, "PRELOAD_LIMIT", 1024)
+    planned = _ReadLog(data)
+    tags = exifread.process_file(planned, details=True)
+
+    monkeypatch.setattr(
+        ExifHeader,
+        "_read_plan",
+        lambda self: self._plan.clear(),  # pylint: disable=protected-access
+    )
+    unplanned = _ReadLog(data)
+    expected = exifread.process_file(unplanned, details=True)
+    assert {key: str(value) for key, value in tags.items()} == {
+        key: str(value) for key, value in expected.items()
+    }
+    assert len(planned.reads) < len(unplanned.reads)
+
+
+@pytest.mark.parametrize("file_path", ("jpg/corrupted.jpg", "jpg/gps/DSCN0010.jpg"))
+def test_plan_reads(monkeypatch, file_path):
+    """Values of the IFD chain and its sub-IFDs are planned before dumping."""
+    data = (RESOURCES_ROOT / file_path).read_bytes()
+    monkeypatch.setattr(exif_header, "PRELOAD_LIMIT", 1024)
+    planned = _ReadLog(data)
+    tags = exifread.process_file(planned, details=True)
+
+    monkeypatch.setattr(ExifHeader, "plan_reads", lambda self, *args: None)
+    per_ifd = _ReadLog(data)
+    expected = exifread.process_file(per_ifd, details=True)
+    assert {key: str(value) for key, value in tags.items()} == {
+        key: str(value) for key, value in expected.items()
+    }
+    assert len(planned.reads) <= len(per_ifd.reads)
+
+
+def test_read_ifd():
+    file_path = RESOURCES_ROOT / "jpg/Canon_40D.jpg"
+    with open(file_path, "rb") as fh:
+        offset, endian, fake_exif, exif_size = find_exif_block(fh)
+        hdr = ExifHeader(
+            fh, chr(endian[0]), offset, fake_exif, False, exif_size=exif_size
+        )
+        ifds = hdr.list_ifd()
+        entries, next_ifd = hdr.read_ifd(ifds[0])
+    assert len(ifds) == 2
+    assert next_ifd == ifds[1]
+    assert len(entries) == 11
+    # Image Make: ASCII, 6 characters
+    assert (0x010F, 2, 6) in [entry[:3] for entry in entries]
+
+
+def test_determine_type():
+    file_path = RESOURCES_ROOT / "jpg/Canon_40D.jpg"
+    with open(file_path, "rb") as fh:
+        offset, endian, fake_exif, exif_size = find_exif_block(fh)
+        fh.seek(0)
+        assert determine_type(fh) == (offset, endian, fake_exif)
+    assert exif_size > 0
+
+
+@pytest.mark.parametrize("max_values, length", ((1000, 0), (MAX_VALUES, 72734)))
+def test_max_values(max_values, length):
+    file_path = (
+        RESOURCES_ROOT
+        / "raw/nikon_z_9_high_efficiency_compressed_dx_cropped_max_overexposed.dng"
+    )
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh=fh, details=False, max_values=max_values)
+    # DNGPrivateData
+    values = tags["Image Tag 0xC634"].values
+    assert len(values) == length
+    if length:
+        assert isinstance(values, array)
+        assert bytes(values[:5]) == b"Adobe"
+
+
+def _tiff_past_end(count: int, entries: int = 20) -> bytes:
+    """Build a TIFF file of RATIONAL entries with values past its end."""
+    table = b"".join(
+        struct.pack("<HHLL", 0x7000 + tag, 5, count, 0x10000) for tag in range(entries)
+    )
+    return b"II*\x00\x08\x00\x00\x00" + struct.pack("<H", entries) + table + b"\x00" * 4
+
+
+@pytest.mark.parametrize("preload_limit", (exif_header.PRELOAD_LIMIT, 16))
+@pytest.mark.parametrize("count", (100_000, 1_000_000))
+def test_values_past_end(monkeypatch, preload_limit, count):
+    """Counts of fields are not trusted, no value is made up past the file end."""
+    monkeypatch.setattr(exif_header, "PRELOAD_LIMIT", preload_limit)
+    data = _tiff_past_end(count)
+    assert len(data) == 254
+    stats = exifread.IoStats()
+    tags = exifread.process_file(io.BytesIO(data), max_values=1 << 20, stats=stats)
+    assert not [key for key in tags if key.startswith("Image Tag 0x7")]
+    assert stats.max_read <= exif_header.FIELD_CHUNK_SIZE
+
+
+def test_values_past_end_lazy():
+    """In lazy mode, the fields already listed are kept without values."""
+    tags = exifread.process_file(
+        io.BytesIO(_tiff_past_end(100_000)), max_values=1 << 20, lazy=True
+    )
+    values = {key: tag.values for key, tag in tags.items() if key.startswith("Image")}
+    assert values == {"Image Tag 0x%04X" % (0x7000 + tag): [] for tag in range(20)}
+    assert tags["Image Tag 0x7000"].printable == "[]"
+
+
+def _tiff_with_thumbnail(strips: int, endian: str = "<") -> bytes:
+    """Build a TIFF file with an uncompressed thumbnail of `strips` strips."""
+    # IFD0: ImageWidth only, IFD1: the thumbnail
+    thumb_ifd = 8 + 2 + 12 + 4
+    data_start = thumb_ifd + 2 + 6 * 12 + 4
+    pixels = [bytes([i % 256]) * (i % 7 + 1) for i in range(strips)]
+    # single values are stored in the entry
+    arrays_size = 8 * strips if strips > 1 else 0
+    offsets = []
+    position = data_start + arrays_size
+    for pixel in pixels:
+        offsets.append(position)
+        position += len(pixel)
+    counts = [len(pixel) for pixel in pixels]
+    entry = struct.Struct(endian + "HHII")
+    short = struct.Struct(endian + "HHIHxx")
+    tiff = b"II*\x00" if endian == "<" else b"MM\x00*"
+    tiff += struct.pack(endian + "I", 8)
+    tiff += struct.pack(endian + "H", 1) + short.pack(0x0100, 3, 1, 16)
+    tiff += struct.pack(endian + "I", thumb_ifd)
+    tiff += struct.pack(endian + "H", 6)
+    tiff += short.pack(0x0100, 3, 1, 1)
+    tiff += short.pack(0x0101, 3, 1, strips)
+    tiff += short.pack(0x0103, 3, 1, 1)
+    if strips > 1:
+        tiff += entry.pack(0x0111, 4, strips, data_start)
+        tiff += short.pack(0x0116, 3, 1, 1)
+        tiff += entry.pack(0x0117, 4, strips, data_start + 4 * strips)
+        tiff += struct.pack(endian + "I", 0)
+        tiff += struct.pack(endian + "%dI" % strips, *offsets)
+        tiff += struct.pack(endian + "%dI" % strips, *counts)
+    else:
+        tiff += entry.pack(0x0111, 4, 1, offsets[0])
+        tiff += short.pack(0x0116, 3, 1, 1)
+        tiff += entry.pack(0x0117, 4, 1, counts[0])
+        tiff += struct.pack(endian + "I", 0)
+    return tiff + b"".join(pixels)
+
+
+@pytest.mark.parametrize("endian", ("<", ">"))
+@pytest.mark.parametrize("strips", (1, 500))
+@pytest.mark.parametrize("preload_limit", (16, 1 << 20))
+def test_tiff_thumbnail(monkeypatch, endian, strips, preload_limit):
+    monkeypatch.setattr(exif_header, "PRELOAD_LIMIT", preload_limit)
+    source = _tiff_with_thumbnail(strips, endian)
+    tags = exifread.process_file(io.BytesIO(source), details=False)
+    thumbnail = bytes(tags["TIFFThumbnail"])
+
+    thumb_tags = exifread.process_file(io.BytesIO(thumbnail), details=False)
+    assert thumb_tags["Image ImageLength"].values == [strips]
+    old_offsets = tags["Thumbnail StripOffsets"].values
+    new_offsets = thumb_tags["Image StripOffsets"].values
+    counts = thumb_tags["Image StripByteCounts"].values
+    assert len(new_offsets) == len(counts) == strips
+    for old_offset, new_offset, count in zip(old_offsets, new_offsets, counts):
+        assert (
+            thumbnail[new_offset : new_offset + count]
+            == source[old_offset : old_offset + count]
+        )
+    assert len(thumbnail) == new_offsets[-1] + counts[-1]
+
+
+@pytest.mark.skipif(not hasattr(os, "pread"), reason="requires os.pread")
+def test_tiff_thumbnail_pread(tmp_path):
+    """Strips are read into the thumbnail from file descriptors too."""
+    source = _tiff_with_thumbnail(500)
+    expected = exifread.process_file(io.BytesIO(source), details=False)
+    file_path = tmp_path / "thumbnail.tiff"
+    file_path.write_bytes(source)
+    with open(file_path, "rb") as fh:
+        reader = PreadReader(fh.fileno())
+        tags = exifread.process_file(reader, details=False)  # type: ignore
+    assert bytes(tags["TIFFThumbnail"]) == bytes(expected["TIFFThumbnail"])
+
+
+def test_tiff_thumbnail_limit(monkeypatch):
+    """Large TIFF thumbnails are only assembled when accessed."""
+    source = _tiff_with_thumbnail(500)
+    monkeypatch.setattr(exif_header, "TIFF_THUMBNAIL_LIMIT", 1000)
+    tags = exifread.process_file(io.BytesIO(source), details=False)
+    assert "TIFFThumbnail" not in tags
+    with exifread.process_file(io.BytesIO(source), details=False, lazy=True) as tags:
+        assert len(tags["TIFFThumbnail"]) > 1000
+    # the buffer outlives the processing
+    tags = exifread.process_bytes(source, details=False)
+    assert not tags["TIFFThumbnail"].loaded
+    assert len(tags["TIFFThumbnail"]) > 1000
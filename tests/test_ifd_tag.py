@@ -0,0 +1,71 @@
+"""Test the IFD tag class."""
+
+import array
+
+import pytest
+
+from exifread.core.ifd_tag import IfdTag
+from exifread.tags.fields import FIELD_DEFINITIONS, FieldType
+
+
+def _join(values):
+    return ".".join(map(str, values))
+
+
+@pytest.mark.parametrize(
+    "values, field_type, formatter, truncate, printable",
+    (
+        ([3], FieldType.SHORT, None, True, "3"),
+        ("Canon", FieldType.ASCII, None, True, "Canon"),
+        ([1, 2], FieldType.SHORT, None, True, "[1, 2]"),
+        (
+            list(range(60)),
+            FieldType.BYTE,
+            None,
+            True,
+            "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, ... ]",
+        ),
+        (list(range(60)), FieldType.BYTE, None, False, str(list(range(59)))),
+        (
+            array.array("H", range(1200)),
+            FieldType.SHORT,
+            None,
+            True,
+            "[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, ... ]",
+        ),
+        # bytes print as in previous versions
+        (
+            bytes(range(60)),
+            FieldType.UNDEFINED,
+            None,
+            True,
+            str(bytes(range(20)))[0:-1] + ", ... ]",
+        ),
+        ([1], FieldType.SHORT, {1: "Horizontal"}, True, "Horizontal"),
+        ([2, 1], FieldType.SHORT, {1: "a"}, True, "2a"),
+        ([1] * 1200, FieldType.BYTE, {1: "a"}, True, "a" * 20 + "..."),
+        ([1] * 1200, FieldType.BYTE, {1: "a"}, False, "a" * 1200),
+        ([0, 2, 2, 0], FieldType.UNDEFINED, _join, True, "0.2.2.0"),
+    ),
+)
+def test_lazy_printable(values, field_type, formatter, truncate, printable):
+    field_length = len(values) * FIELD_DEFINITIONS[field_type][0]
+    tag = IfdTag(
+        None, 0x100, field_type, values, 0, field_length, True, formatter, truncate
+    )
+    assert tag.printable == printable
+    assert str(tag) == printable
+
+
+def test_printable_given():
+    tag = IfdTag("Nikon", 0, FieldType.ASCII, "NIKON", 0, 5)
+    assert tag.printable == "Nikon"
+    tag.printable = "Canon"
+    assert str(tag) == "Canon"
+
+
+def test_slots():
+    tag = IfdTag(None, 0x100, FieldType.SHORT, [3], 0, 2)
+    assert not hasattr(tag, "__dict__")
+    with pytest.raises(AttributeError):
+        tag.foo = 1  # type: ignore  # pylint: disable=assigning-non-slot
@@ -0,0 +1,48 @@
+"""Test that modules only needed by some files or options are imported lazily."""
+
+import subprocess
+import sys
+
+import pytest
+
+import exifread
+import exifread.io
+from exifread import batch
+from exifread.core import range_reader
+
+LAZY_MODULES = (
+    "exifread.tags.makernote.canon",
+    "exifread.tags.makernote.nikon",
+    "xml.dom.minidom",
+    "fractions",
+    "asyncio",
+    "concurrent.futures",
+    "http.client",
+)
+
+
+@pytest.mark.parametrize("module", ("exifread.cli", "exifread.io"))
+def test_import(module):
+    code = "import sys, %s; print(' '.join(sys.modules))" % module
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stdout.split()
+    assert [name for name in LAZY_MODULES if name in output] == []
+
+
+def test_lazy_attributes():
+    assert exifread.process_files is batch.process_files
+    assert exifread.RangeReader is range_reader.RangeReader
+    assert exifread.io.RangeReader is range_reader.RangeReader
+    with pytest.raises(AttributeError):
+        exifread.missing  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        exifread.io.missing  # pylint: disable=pointless-statement
+
+
+def test_all():
+    for name in exifread.__all__:
+        assert getattr(exifread, name) is not None
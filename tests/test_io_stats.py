@@ -0,0 +1,101 @@
+"""Test the accounting of the I/O made on a file."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.core import exif_header
+from exifread.io import IoStats
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+
+class CountingFile(io.BytesIO):
+    """In-memory file counting its calls."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.seeks = 0
+        self.reads = 0
+        self.size = 0
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self.seeks += 1
+        return super().seek(offset, whence)
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.reads += 1
+        self.size += len(data)
+        return data
+
+    def readline(self, size=-1):
+        data = super().readline(size)
+        self.reads += 1
+        self.size += len(data)
+        return data
+
+    def readinto(self, buffer):
+        size = super().readinto(buffer)
+        self.reads += 1
+        self.size += size
+        return size
+
+
+@pytest.mark.parametrize(
+    "file_path, finder",
+    (
+        ("jpg/Canon_40D.jpg", "jpeg"),
+        ("tiff/BSG1.tiff", "tiff"),
+        ("heic/mobile/iphone_13_pro_max.heic", "heic"),
+        ("jxl/test_0001.jxl", "jxl"),
+    ),
+)
+def test_io_stats(file_path, finder):
+    data = (RESOURCES_ROOT / file_path).read_bytes()
+    expected = exifread.process_file(io.BytesIO(data), debug=True)
+    fh = CountingFile(data)
+    stats = IoStats()
+    tags = exifread.process_file(fh, debug=True, stats=stats)
+    assert {key: str(value) for key, value in tags.items()} == {
+        key: str(value) for key, value in expected.items()
+    }
+    assert (stats.seeks, stats.reads, stats.bytes_read) == (fh.seeks, fh.reads, fh.size)
+    assert 0 < stats.max_read <= stats.span <= len(data)
+    assert finder in stats.phases
+    assert "header" in stats.phases
+    assert sum(counters.reads for counters in stats.phases.values()) == stats.reads
+    assert (
+        sum(counters.bytes_read for counters in stats.phases.values())
+        == stats.bytes_read
+    )
+
+
+def test_io_stats_access(monkeypatch):
+    """Reads made after processing, here by lazy tags, are counted too."""
+    monkeypatch.setattr(exif_header, "PRELOAD_LIMIT", 16)
+    stats = IoStats()
+    with open(RESOURCES_ROOT / "jpg/Canon_40D.jpg", "rb") as fh:
+        tags = exifread.process_file(fh, lazy=True, stats=stats)
+        assert "access" not in stats.phases
+        assert str(tags["Image Make"]) == "Canon"
+    assert stats.phases["access"].reads > 0
+
+
+@pytest.mark.parametrize("cached", (False, True))
+def test_io_stats_buffer(cached):
+    """Recording I/O keeps reading data in memory without copies."""
+    data = (RESOURCES_ROOT / "jpg/Canon_40D.jpg").read_bytes()
+    stats = IoStats()
+    tags = exifread.process_bytes(data, stats=stats, cached=cached)
+    assert tags["JPEGThumbnail"].view().obj is data
+    assert "header" not in stats.phases
+
+
+def test_io_stats_unsupported():
+    with pytest.raises(ValueError):
+        exifread.RetryParser(stats=IoStats())
+    with pytest.raises(ValueError):
+        exifread.process_files([], stats=IoStats())
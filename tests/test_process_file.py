@@ -1,6 +1,8 @@
 """Basic tests."""
 
+import io
 import logging
+import struct
 from pathlib import Path
 
 import pytest
@@ -68,6 +70,57 @@ def test_thumbnail_extract(details):
     assert len(tags["JPEGThumbnail"]) == 1378
 
 
+def test_thumbnail_lazy():
+    file_path = RESOURCES_ROOT / "jpg/Canon_40D.jpg"
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh=fh, lazy=True)
+    thumbnail = tags["JPEGThumbnail"]
+    assert isinstance(thumbnail, exifread.Thumbnail)
+    # JPEG thumbnails are served from the EXIF block, without reading the file
+    assert thumbnail.loaded
+    view = thumbnail.view()
+    assert isinstance(view, memoryview)
+    assert bytes(view[:2]) == b"\xff\xd8"
+    assert bytes(thumbnail) == view
+    assert file_path.read_bytes()[
+        thumbnail.offset : thumbnail.offset + len(thumbnail)
+    ] == bytes(thumbnail)
+
+
+def test_thumbnail_closed_file(tmp_path):
+    """Thumbnails past the EXIF block are read before the file is closed."""
+    jpeg = b"\xff\xd8" + bytes(range(256)) + b"\xff\xd9"
+    offset = 300000
+    # IFD0: ImageWidth only, IFD1: a JPEG thumbnail far in the file
+    tiff = b"II*\x00\x08\x00\x00\x00"
+    tiff += struct.pack("<H", 1) + struct.pack("<HHII", 0x0100, 4, 1, 16)
+    tiff += struct.pack("<I", len(tiff) + 4)
+    tiff += struct.pack("<H", 2)
+    tiff += struct.pack("<HHII", 0x0201, 4, 1, offset)
+    tiff += struct.pack("<HHII", 0x0202, 4, 1, len(jpeg))
+    tiff += struct.pack("<I", 0)
+    file_path = tmp_path / "thumbnail.tiff"
+    file_path.write_bytes(tiff.ljust(offset, b"\x00") + jpeg)
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh)
+        lazy_tags = exifread.process_file(fh, lazy=True)
+    assert bytes(tags["JPEGThumbnail"]) == jpeg
+    assert tags["JPEGThumbnail"].offset == offset
+    with pytest.raises(ValueError):
+        bytes(lazy_tags["JPEGThumbnail"])
+
+
+def test_thumbnail_load_on_access():
+    calls = []
+    thumbnail = exifread.Thumbnail(load=lambda: calls.append(1) or b"\xff\xd8\xff")
+    assert not thumbnail.loaded
+    assert not calls
+    assert thumbnail == b"\xff\xd8\xff"
+    assert len(thumbnail) == 3
+    bytes(thumbnail)
+    assert calls == [1]
+
+
 @pytest.mark.parametrize("details", (True, False))
 def test_no_thumbnail_extract(details):
     file_path = RESOURCES_ROOT / "jpg/Canon_40D.jpg"
@@ -78,12 +131,20 @@ def test_no_thumbnail_extract(details):
 
 @pytest.mark.parametrize("strict", (True, False))
 def test_no_exif(strict):
-    file_path = RESOURCES_ROOT / "jpg/xmp/no_exif.jpg"
+    file_path = RESOURCES_ROOT / "jpg/exif-org/olympus-d320l.jpg"
     with open(file_path, "rb") as fh:
         tags = exifread.process_file(fh=fh, details=True, strict=strict)
     assert not tags
 
 
+def test_exif_after_xmp():
+    """The EXIF segment is found after a large XMP one."""
+    file_path = RESOURCES_ROOT / "jpg/xmp/no_exif.jpg"
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh=fh, details=False)
+    assert str(tags["Image ImageDescription"]) == "Der Goalie bin ig"
+
+
 @pytest.mark.parametrize("strict", (True, False))
 def test_invalid_exif(strict):
     file_path = RESOURCES_ROOT / "jpg/invalid/image00971.jpg"
@@ -165,3 +226,129 @@ def test_xmp_no_tag():
             builtin_types=True,
         )
     assert len(tags["Image ApplicationNotes"]) == 323
+
+
+@pytest.mark.parametrize("builtin_types", (True, False))
+@pytest.mark.parametrize("details", (True, False))
+def test_lazy(builtin_types, details):
+    file_path = RESOURCES_ROOT / "jpg/Canon_DIGITAL_IXUS_400.jpg"
+    with open(file_path, "rb") as fh:
+        expected = exifread.process_file(
+            fh=fh, builtin_types=builtin_types, details=details
+        )
+        with exifread.process_file(
+            fh=fh, builtin_types=builtin_types, details=details, lazy=True
+        ) as tags:
+            assert not tags.decoded("EXIF ExposureTime")
+            assert str(tags["EXIF ExposureTime"]) == str(expected["EXIF ExposureTime"])
+            assert tags.decoded("EXIF ExposureTime")
+            assert list(tags) == list(expected)
+            assert {k: str(v) for k, v in tags.items()} == {
+                k: str(v) for k, v in expected.items()
+            }
+
+
+def test_lazy_closed():
+    file_path = RESOURCES_ROOT / "jpg/Canon_40D.jpg"
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh=fh, lazy=True)
+        assert str(tags["Image Make"]) == "Canon"
+        tags.close()
+    assert str(tags["Image Make"]) == "Canon"
+    assert "Image Model" in tags
+    with pytest.raises(ValueError):
+        tags["Image Model"]  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize("lazy", (True, False))
+@pytest.mark.parametrize(
+    "tags, ifds, expected",
+    (
+        ({"Image Make", "EXIF Flash"}, None, {"Image Make", "EXIF Flash"}),
+        (None, {"GPS"}, set()),
+        ({"Image Model"}, {"Thumbnail"}, {"Image Model", "JPEGThumbnail"}),
+        ({"MakerNote AESetting"}, None, {"MakerNote AESetting"}),
+        ({"JPEGThumbnail"}, None, {"JPEGThumbnail"}),
+    ),
+)
+def test_tag_filter(lazy, tags, ifds, expected):
+    file_path = RESOURCES_ROOT / "jpg/Canon_DIGITAL_IXUS_400.jpg"
+    with open(file_path, "rb") as fh:
+        all_tags = exifread.process_file(fh=fh)
+        filtered = exifread.process_file(fh=fh, tags=tags, ifds=ifds, lazy=lazy)
+        if ifds:
+            expected = expected | {
+                key for key in all_tags if key.startswith(tuple(ifds))
+            }
+        assert set(filtered) == expected
+        for key in expected:
+            assert str(filtered[key]) == str(all_tags[key])
+
+
+def test_tag_filter_gps():
+    file_path = RESOURCES_ROOT / "jpg/gps/DSCN0010.jpg"
+    with open(file_path, "rb") as fh:
+        tags = exifread.process_file(fh=fh, ifds={"GPS"})
+    assert str(tags["GPS GPSLatitude"]) == "[43, 28, 1407/500]"
+    assert all(key.startswith("GPS ") for key in tags)
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        "jpg/Canon_40D.jpg",
+        "tiff/Arbitro.tiff",
+        "heic/mobile/iphone_13_pro_max.heic",
+        "jxl/test_0001.jxl",
+    ),
+)
+def test_process_path(file_path):
+    with open(RESOURCES_ROOT / file_path, "rb") as fh:
+        expected = {key: str(value) for key, value in exifread.process_file(fh).items()}
+    tags = exifread.process_path(RESOURCES_ROOT / file_path)
+    assert {key: str(value) for key, value in tags.items()} == expected
+
+
+def test_process_path_lazy():
+    with exifread.process_path(RESOURCES_ROOT / "jpg/Canon_40D.jpg", lazy=True) as tags:
+        assert str(tags["Image Model"]) == "Canon EOS 40D"
+        assert len(tags["JPEGThumbnail"]) == 1378
+
+
+def test_process_path_empty(tmp_path):
+    file_path = tmp_path / "empty.jpg"
+    file_path.write_bytes(b"")
+    assert not exifread.process_path(file_path)
+
+
+@pytest.mark.parametrize("buffer_type", (bytes, bytearray, memoryview))
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        "jpg/Canon_40D.jpg",
+        "tiff/Arbitro.tiff",
+        "heic/mobile/iphone_13_pro_max.heic",
+        "avif/mountains.avif",
+        "jxl/test_0001.jxl",
+    ),
+)
+def test_process_bytes(buffer_type, file_path):
+    data = (RESOURCES_ROOT / file_path).read_bytes()
+    with open(RESOURCES_ROOT / file_path, "rb") as fh:
+        expected = {
+            key: str(value)
+            for key, value in exifread.process_file(fh, debug=True).items()
+        }
+    tags = exifread.process_bytes(buffer_type(data), debug=True)
+    assert {key: str(value) for key, value in tags.items()} == expected
+
+
+def test_process_bytes_thumbnail_view():
+    data = (RESOURCES_ROOT / "jpg/Canon_40D.jpg").read_bytes()
+    # no copy of the thumbnail data, the buffer outlives the processing
+    for lazy in (False, True):
+        tags = exifread.process_bytes(data, lazy=lazy)
+        assert tags["JPEGThumbnail"].view().obj is data
+    # unlike a file object
+    tags = exifread.process_file(io.BytesIO(data))
+    assert tags["JPEGThumbnail"].view().obj is not data
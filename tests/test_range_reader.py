@@ -0,0 +1,145 @@
+"""Test reading remote files with HTTP range requests."""
+
+import http.server
+import re
+import threading
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.core.range_reader import RangeReader
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+
+class RangeHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve the test resources, with support for `Range` requests."""
+
+    protocol_version = "HTTP/1.1"
+    ranges = True
+    connections: set = set()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(RESOURCES_ROOT), **kwargs)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.connections.add(self.client_address)
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self.send_error(404)
+            return
+        data = path.read_bytes()
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if not (self.ranges and match):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        start, end = int(match.group(1)), int(match.group(2)) + 1
+        if start >= len(data):
+            self.send_response(416)
+            self.send_header("Content-Range", "bytes */%d" % len(data))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = data[start:end]
+        self.send_response(206)
+        self.send_header(
+            "Content-Range",
+            "bytes %d-%d/%d" % (start, start + len(body) - 1, len(data)),
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    RangeHandler.ranges = True
+    RangeHandler.connections = set()
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d/" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def _printable(tags) -> dict:
+    return {key: str(value) for key, value in tags.items()}
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        "jpg/Canon_40D.jpg",
+        "tiff/Arbitro.tiff",
+        "heic/mobile/iphone_13_pro_max.heic",
+    ),
+)
+def test_process_file(server, file_path):
+    size = (RESOURCES_ROOT / file_path).stat().st_size
+    with RangeReader(server + file_path, block_size=4096) as reader:
+        tags = exifread.process_file(reader, details=False)
+        assert 0 < reader.bytes_fetched <= size
+        assert reader.requests >= 1
+    assert _printable(tags) == _printable(
+        exifread.process_path(RESOURCES_ROOT / file_path, details=False)
+    )
+    # a single connection is kept open
+    assert len(RangeHandler.connections) == 1
+
+
+def test_block_cache(server):
+    data = (RESOURCES_ROOT / "jpg/Canon_40D.jpg").read_bytes()
+    url = server + "jpg/Canon_40D.jpg"
+    with RangeReader(url, block_size=100, max_blocks=3) as reader:
+        assert reader.read(150) == data[:150]
+        assert (reader.requests, reader.bytes_fetched) == (1, 200)
+        reader.seek(50)
+        assert reader.read(100) == data[50:150]
+        assert reader.requests == 1
+        # missing blocks are fetched at once, the oldest is evicted
+        reader.seek(250)
+        assert reader.read(200) == data[250:450]
+        assert (reader.requests, reader.bytes_fetched) == (2, 500)
+        reader.seek(0)
+        assert reader.read(10) == data[:10]
+        assert reader.requests == 3
+        assert reader.seek(-5, 2) == len(data) - 5
+        assert reader.read() == data[-5:]
+        assert reader.read(10) == b""
+        reader.seek(len(data) + 10)
+        assert reader.read(10) == b""
+
+
+def test_readline(server):
+    data = (RESOURCES_ROOT / "jpg/Canon_40D.jpg").read_bytes()
+    with RangeReader(server + "jpg/Canon_40D.jpg", block_size=64) as reader:
+        line = reader.readline()
+        assert line == data[: data.index(b"\n") + 1]
+        assert reader.readline(5) == data[len(line) : len(line) + 5]
+
+
+def test_no_ranges(server):
+    """Servers ignoring ranges send the whole file once."""
+    RangeHandler.ranges = False
+    data = (RESOURCES_ROOT / "jpg/Canon_40D.jpg").read_bytes()
+    with RangeReader(server + "jpg/Canon_40D.jpg", block_size=100) as reader:
+        assert reader.read(10) == data[:10]
+        reader.seek(1000)
+        assert reader.read(10) == data[1000:1010]
+        assert (reader.requests, reader.bytes_fetched) == (1, len(data))
+
+
+def test_errors(server):
+    with pytest.raises(ValueError):
+        RangeReader("ftp://example.com/image.jpg")
+    with RangeReader(server + "missing.jpg") as reader:
+        with pytest.raises(OSError):
+            reader.read(10)
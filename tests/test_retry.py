@@ -0,0 +1,72 @@
+"""Test the parser run again on the byte ranges fed."""
+
+from pathlib import Path
+
+import pytest
+
+import exifread
+from exifread.retry import RetryParser
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+
+def _printable(tags) -> dict:
+    return {key: str(value) for key, value in tags.items()}
+
+
+def _parse(parser: RetryParser, data: bytes) -> list:
+    """Feed the parser from `data`, return the ranges asked for by each call."""
+    calls = []
+    ranges = parser.needed()
+    while ranges:
+        calls.append(ranges)
+        for start, end in ranges:
+            chunk = data[start:end]
+            parser.feed(start, chunk, eof=len(chunk) < end - start)
+        ranges = parser.needed()
+    return calls
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    (
+        "jpg/Canon_40D.jpg",
+        "jpg/Sony_DSLR-A200.jpg",
+        "tiff/Arbitro.tiff",
+        "heic/mobile/iphone_13_pro_max.heic",
+    ),
+)
+@pytest.mark.parametrize("block_size", (512, 64 * 1024))
+def test_retry_parser(file_path, block_size):
+    data = (RESOURCES_ROOT / file_path).read_bytes()
+    parser = RetryParser(block_size=block_size, details=False)
+    calls = _parse(parser, data)
+    assert parser.done
+    assert not parser.needed()
+    assert _printable(parser.tags) == _printable(
+        exifread.process_bytes(data, details=False)
+    )
+    assert calls[0] == [(0, block_size)]
+    for ranges in calls:
+        for start, end in ranges:
+            assert start % block_size == 0
+            assert end % block_size == 0 or end == len(data)
+
+
+def test_retry_parser_coalesce():
+    """Ranges missing from a run are asked for at once, in order, merged."""
+    data = (RESOURCES_ROOT / "jpg/Sony_DSLR-A200.jpg").read_bytes()
+    parser = RetryParser(block_size=1024)
+    calls = _parse(parser, data)
+    assert max(len(ranges) for ranges in calls) > 1
+    for ranges in calls:
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end < start
+    assert parser.runs == len(calls)
+
+
+def test_retry_parser_options():
+    with pytest.raises(ValueError):
+        RetryParser(lazy=True)
+    with pytest.raises(ValueError):
+        RetryParser(block_size=0)
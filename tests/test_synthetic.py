@@ -0,0 +1,64 @@
+"""Test the synthetic files used in scaling benchmarks."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+import exifread
+
+# the generator is a script of the benchmarks folder, not part of the package
+_spec = importlib.util.spec_from_file_location(
+    "synthetic", Path(__file__).parent.parent / "benchmarks" / "synthetic.py"
+)
+synthetic = importlib.util.module_from_spec(_spec)
+sys.modules["synthetic"] = synthetic
+_spec.loader.exec_module(synthetic)
+
+
+def test_tiff_pages():
+    tags = exifread.process_bytes(synthetic.tiff_pages(12), details=False)
+    assert str(tags["Image Make"]) == "Synthetic"
+    assert str(tags["IFD 11 ImageDescription"]) == "Synthetic page 000011"
+    assert tags["IFD 11 PageNumber"].values == [11, 12]
+
+
+def test_tiff_strips():
+    tags = exifread.process_bytes(synthetic.tiff_strips(2000), details=False)
+    offsets = tags["Image StripOffsets"].values
+    assert len(offsets) == len(tags["Image StripByteCounts"].values) == 2000
+    assert offsets[0] == offsets[-1]
+
+
+@pytest.mark.parametrize("size", (3000, 1000000))
+def test_jpeg_icc(size):
+    data = synthetic.jpeg_icc(size)
+    assert data.count(b"\xff\xe2") == (size - 1) // (65535 - 2 - 14) + 1
+    tags = exifread.process_bytes(data, details=False)
+    assert str(tags["Image Make"]) == "Synthetic"
+
+
+def test_heic_items():
+    tags = exifread.process_bytes(synthetic.heic_items(100), details=False)
+    assert str(tags["Image Make"]) == "Synthetic"
+
+
+def test_jpeg_makernote():
+    data = synthetic.jpeg_makernote(64000)
+    assert 64000 < len(data) < 65536
+    tags = exifread.process_bytes(data, details=True)
+    assert str(tags["Image Make"]) == "Canon"
+    assert sum(key.startswith("MakerNote ") for key in tags) == (64000 - 6) // 28
+
+
+def test_write_files(tmp_path):
+    paths = synthetic.write_files(tmp_path, ["heic_items"])
+    assert [path.name for path in paths] == [
+        "heic_items_10.heic",
+        "heic_items_100.heic",
+        "heic_items_1000.heic",
+        "heic_items_10000.heic",
+    ]
+    tags = exifread.process_path(paths[0], details=False)
+    assert str(tags["Image Make"]) == "Synthetic"
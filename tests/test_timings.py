@@ -0,0 +1,50 @@
+"""Test the timing of the phases of processing."""
+
+from pathlib import Path
+
+import pytest
+
+import exifread
+
+RESOURCES_ROOT = Path(__file__).parent / "resources"
+
+
+@pytest.mark.parametrize(
+    "file_path, phases",
+    (
+        (
+            "jpg/Canon_DIGITAL_IXUS_400.jpg",
+            {"detect", "ifds", "sub_ifds", "makernote canon"},
+        ),
+        (
+            "jpg/Nikon_COOLPIX_P1.jpg",
+            {"makernote nikon", "thumbnail", "xmp", "convert"},
+        ),
+        ("jpg/exif-org/olympus-d320l.jpg", {"detect"}),
+    ),
+)
+def test_timings(file_path, phases):
+    timings = exifread.Timings()
+    with open(RESOURCES_ROOT / file_path, "rb") as fh:
+        exifread.process_file(fh, debug=True, builtin_types=True, timings=timings)
+    assert timings.files == 1
+    assert phases <= set(timings.seconds)
+    assert all(seconds >= 0 for seconds in timings.seconds.values())
+    assert timings.total == pytest.approx(sum(timings.seconds.values()))
+
+
+def test_timings_merge():
+    first, second = exifread.Timings(), exifread.Timings()
+    for timings, file_path in (
+        (first, "jpg/Canon_DIGITAL_IXUS_400.jpg"),
+        (second, "tiff/Arbitro.tiff"),
+    ):
+        with open(RESOURCES_ROOT / file_path, "rb") as fh:
+            exifread.process_file(fh, timings=timings)
+            exifread.process_file(fh, timings=timings)
+    detect = first.seconds["detect"] + second.seconds["detect"]
+    first += second
+    assert first.files == 4
+    assert first.calls["detect"] == 4
+    assert first.seconds["detect"] == pytest.approx(detect)
+    assert first.calls["makernote canon"] == 2
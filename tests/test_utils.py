@@ -0,0 +1,92 @@
+"""Test the utilities."""
+
+import math
+import numbers
+import pickle
+from fractions import Fraction
+
+import pytest
+
+from exifread.utils import Ratio
+
+
+@pytest.mark.parametrize(
+    "ratio, printable, num, den",
+    (
+        (Ratio(3, 6), "1/2", 1, 2),
+        (Ratio(4, 2), "2", 2, 1),
+        (Ratio(1, -3), "-1/3", -1, 3),
+        (Ratio(0, 0), "0/0", 0, 0),
+        (Ratio(5), "5", 5, 1),
+    ),
+)
+def test_ratio(ratio, printable, num, den):
+    assert str(ratio) == printable
+    assert repr(ratio) == printable
+    assert ratio.num == num
+    assert ratio.den == den
+
+
+def test_ratio_fraction_interop():
+    ratio = Ratio(3, 6)
+    assert ratio == Fraction(1, 2)
+    assert ratio == 0.5
+    assert hash(ratio) == hash(Fraction(1, 2))
+    assert Fraction(ratio) == Fraction(1, 2)
+    assert ratio + 1 == Fraction(3, 2)
+    assert 1 - ratio == Fraction(1, 2)
+    assert ratio < 1
+    assert ratio.decimal() == 0.5
+    assert Ratio(0.25) == Ratio(1, 4)
+    assert Ratio(0.333).limit_denominator(10) == Fraction(1, 3)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    (
+        lambda x: x + 2,
+        lambda x: 2 - x,
+        lambda x: x * Fraction(2, 3),
+        lambda x: 1 / x,
+        lambda x: x // 2,
+        lambda x: 5 // x,
+        lambda x: x % 2,
+        lambda x: 5 % x,
+        lambda x: divmod(x, 2),
+        lambda x: divmod(5, x),
+        lambda x: x**2,
+        lambda x: 4**x,
+        lambda x: -x,
+        lambda x: +x,
+        abs,
+        math.trunc,
+        math.floor,
+        math.ceil,
+        round,
+        lambda x: round(x, 1),
+        lambda x: x.real,
+        lambda x: x.imag,
+        lambda x: x.conjugate(),
+        complex,
+    ),
+)
+@pytest.mark.parametrize("numerator, denominator", ((7, 2), (-7, 2), (9, 6)))
+def test_ratio_rational(operation, numerator, denominator):
+    """Ratio implements the `numbers.Rational` protocol as `Fraction` does."""
+    ratio = Ratio(numerator, denominator)
+    assert isinstance(ratio, numbers.Rational)
+    assert operation(ratio) == operation(Fraction(numerator, denominator))
+
+
+def test_ratio_zero_denominator():
+    ratio = Ratio(5, 0)
+    assert ratio.numerator == 5
+    assert ratio.denominator == 0
+    assert ratio != 5
+    with pytest.raises(ZeroDivisionError):
+        ratio.decimal()
+
+
+def test_ratio_pickle():
+    ratio = Ratio(10, 4)
+    assert pickle.loads(pickle.dumps(ratio)) == ratio